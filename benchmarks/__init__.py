@@ -0,0 +1,5 @@
+# benchmarks/__init__.py
+"""
+Benchmark suite for WrapDataclass serialization and manager operations.
+Stdlib only; run with `python -m benchmarks` (see `benchmarks/__main__.py`).
+"""
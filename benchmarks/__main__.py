@@ -0,0 +1,78 @@
+# benchmarks/__main__.py
+"""
+Runs the WrapDataclass benchmark suite.
+
+Run from the repository root (with the package installed, e.g. `pip install -e .`):
+    python -m benchmarks                                  # everything, default budget
+    python -m benchmarks --scale small --op from_dict     # a subset
+    python -m benchmarks --save baseline.json             # record a baseline
+    python -m benchmarks --baseline baseline.json         # compare against it
+    python -m benchmarks --baseline baseline.json --fail-on-regression
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+from pathlib import Path
+from WrapDataclass.core.codecs import get_codec
+
+from .cases import OPERATIONS, SCALES, build_cases
+from .harness import compare, format_table, load_results, measure, save_results
+from .models import MODELS
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="WrapDataclass benchmark suite")
+    parser.add_argument("--model", action="append", choices=list(MODELS), help="Model to run (repeatable)")
+    parser.add_argument("--scale", action="append", choices=SCALES, help="Scale to run (repeatable)")
+    parser.add_argument("--op", action="append", choices=OPERATIONS, help="Operation to run (repeatable)")
+    parser.add_argument("--codec", default=None, help="JSON codec: json, orjson, ujson or auto (default: class default)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds spent timing each case")
+    parser.add_argument("--min-iterations", type=int, default=5, help="Minimum timed calls per case")
+    parser.add_argument("--save", type=Path, help="Write the results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Compare against results saved with --save")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
+    codec = get_codec(args.codec) if args.codec else None
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="wrapdataclass-bench-") as workdir:
+        cases = build_cases(
+            Path(workdir), models=args.model, scales=args.scale, operations=args.op, codec=codec
+        )
+        for name, func, payload in cases:
+            result = measure(
+                name, func, min_time=args.min_time, min_iterations=args.min_iterations, payload_bytes=payload
+            )
+            results.append(result)
+            print(f"  {name:<34} {result.p50_us:>10.1f} us p50", file=sys.stderr)
+
+    print(format_table(results))
+
+    if args.save:
+        settings = {
+            "codec": args.codec, "min_time": args.min_time, "min_iterations": args.min_iterations,
+        }
+        save_results(args.save, results, settings)
+        print(f"\nSaved results to {args.save}")
+
+    if args.baseline:
+        table, regressions = compare(results, load_results(args.baseline), args.threshold)
+        print(f"\nCompared with {args.baseline} (threshold {args.threshold:.0%}):")
+        print(table)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            if args.fail_on_regression:
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
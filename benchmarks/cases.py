@@ -0,0 +1,69 @@
+# benchmarks/cases.py
+"""
+Benchmark case definitions: every operation is run for every model at each of its scales.
+Case names are `{operation}/{model}/{scale}`, e.g. `from_dict/wide/large`.
+"""
+
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from WrapDataclass.core.codecs import JsonCodec
+from WrapDataclass.manager.base_manager import BaseManager
+
+from .models import MODELS
+
+OPERATIONS = ("to_dict", "from_dict", "to_json", "from_json", "save", "load")
+SCALES = ("small", "medium", "large")
+
+# A case: (name, zero-argument callable, payload bytes per call or 0).
+Case = tuple[str, Callable[[], object], int]
+
+
+def build_cases(
+    workdir: Path,
+    *,
+    models: Optional[list[str]] = None,
+    scales: Optional[list[str]] = None,
+    operations: Optional[list[str]] = None,
+    codec: Optional[JsonCodec] = None
+) -> Iterator[Case]:
+    """
+    Yield the selected benchmark cases, preparing their inputs in `workdir`.
+    Args:
+        workdir (Path): Scratch directory for JSON files and manager stores.
+        models (list[str] | None): Model names to include (all if None).
+        scales (list[str] | None): Scale names to include (all if None).
+        operations (list[str] | None): Operations to include (all if None).
+        codec (JsonCodec | None): JSON codec for file and manager operations (class default if None).
+    Returns:
+        Iterator[Case]: Cases in model, scale, operation order.
+    """
+    for model_name, (model_type, build, model_scales) in MODELS.items():
+        if models and model_name not in models:
+            continue
+        for scale, arg in model_scales.items():
+            if scales and scale not in scales:
+                continue
+            obj = build(arg)
+            data = obj.to_dict()
+            path = workdir / f"{model_name}-{scale}.json"
+            obj.to_json(path, app_name="bench", data_version="1.0", codec=codec)
+            size = path.stat().st_size
+            manager = BaseManager(model_type, workdir / f"store-{model_name}-{scale}", codec=codec)
+            manager.save(obj)
+
+            ops = {
+                "to_dict": (lambda obj=obj: obj.to_dict(), 0),
+                "from_dict": (lambda t=model_type, d=data: t.from_dict(d), 0),
+                "to_json": (
+                    lambda obj=obj, p=path: obj.to_json(p, app_name="bench", data_version="1.0", codec=codec),
+                    size,
+                ),
+                "from_json": (lambda t=model_type, p=path: t.from_json(p, codec=codec), size),
+                "save": (lambda m=manager, obj=obj: m.save(obj), size),
+                "load": (lambda m=manager, name=obj.id: m.load(name), size),
+            }
+            for op in OPERATIONS:
+                if operations and op not in operations:
+                    continue
+                func, payload = ops[op]
+                yield f"{op}/{model_name}/{scale}", func, payload
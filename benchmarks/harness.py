@@ -0,0 +1,205 @@
+# benchmarks/harness.py
+"""
+Measurement and reporting helpers for the benchmark suite (stdlib only):
+- `measure` times single calls until a time budget is spent and reports throughput
+  and latency percentiles, then measures peak memory of one call with tracemalloc
+- `compare` matches a run against a saved JSON baseline and flags regressions
+"""
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+# Peak-memory differences below this many KiB are treated as noise when comparing runs.
+MEMORY_SLACK_KIB = 4.0
+
+
+@dataclass
+class Result:
+    """Measurements for one benchmark case."""
+    name: str
+    iterations: int
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p90_us: float
+    p99_us: float
+    max_us: float
+    peak_kib: float
+    bytes: int = 0
+
+    @property
+    def mb_per_sec(self) -> float:
+        """Payload throughput, for cases that report a payload size."""
+        return self.bytes * self.ops_per_sec / 1e6
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    *,
+    min_time: float = 0.5,
+    min_iterations: int = 5,
+    max_iterations: int = 100_000,
+    warmup: int = 2,
+    payload_bytes: int = 0
+) -> Result:
+    """
+    Benchmark one zero-argument callable.
+    Each call is timed individually with `perf_counter_ns` until `min_time` seconds have
+    passed (and at least `min_iterations` calls ran). Peak memory is measured separately,
+    over a single traced call, so tracing does not distort the timings.
+    Args:
+        name (str): Case name.
+        func (Callable): The operation to measure.
+        min_time (float): Timing budget in seconds.
+        min_iterations (int): Lower bound on timed calls.
+        max_iterations (int): Upper bound on timed calls.
+        warmup (int): Untimed calls made first (plan caches, file system caches).
+        payload_bytes (int): Bytes processed per call, for MB/s reporting (0 if not applicable).
+    Returns:
+        Result: The measurements.
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        clock = time.perf_counter_ns
+        deadline = clock() + int(min_time * 1e9)
+        while len(samples) < max_iterations and (len(samples) < min_iterations or clock() < deadline):
+            start = clock()
+            func()
+            samples.append(clock() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        func()
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    total = sum(samples)
+    return Result(
+        name=name,
+        iterations=len(samples),
+        ops_per_sec=len(samples) / (total / 1e9) if total else 0.0,
+        mean_us=total / len(samples) / 1e3,
+        p50_us=percentile(samples, 50) / 1e3,
+        p90_us=percentile(samples, 90) / 1e3,
+        p99_us=percentile(samples, 99) / 1e3,
+        max_us=samples[-1] / 1e3,
+        peak_kib=peak / 1024,
+        bytes=payload_bytes,
+    )
+
+
+def environment() -> dict:
+    """Describe the interpreter and machine a run was made on."""
+    from WrapDataclass.core.codecs import available_backends
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "json_backends": available_backends(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def save_results(path: Path, results: list[Result], settings: dict) -> None:
+    """Write a run (environment, settings and results) as JSON, e.g. to use as a baseline."""
+    report = {
+        "environment": environment(),
+        "settings": settings,
+        "results": [asdict(r) for r in results],
+    }
+    Path(path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+def load_results(path: Path) -> dict[str, dict]:
+    """Read a saved run and return its results by case name."""
+    report = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {r["name"]: r for r in report["results"]}
+
+
+def format_table(results: list[Result]) -> str:
+    """Render results as a fixed-width text table."""
+    lines = [
+        f"{'case':<34} {'ops/s':>10} {'p50 us':>10} {'p90 us':>10} {'p99 us':>10} {'MB/s':>8} {'peak KiB':>10}",
+        "-" * 98,
+    ]
+    for r in results:
+        mb = f"{r.mb_per_sec:8.1f}" if r.bytes else f"{'-':>8}"
+        lines.append(
+            f"{r.name:<34} {r.ops_per_sec:>10.1f} {r.p50_us:>10.1f} {r.p90_us:>10.1f} "
+            f"{r.p99_us:>10.1f} {mb} {r.peak_kib:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def compare(results: list[Result], baseline: dict[str, dict], threshold: float = 0.10) -> tuple[str, list[str]]:
+    """
+    Compare a run against a baseline by median latency and peak memory.
+    Args:
+        results (list[Result]): The current run.
+        baseline (dict[str, dict]): Baseline results by case name (see `load_results`).
+        threshold (float): Relative slowdown (or memory growth) reported as a regression.
+    Returns:
+        tuple[str, list[str]]: The comparison table and the names of regressed cases.
+    """
+    lines = [
+        f"{'case':<34} {'base p50':>10} {'p50':>10} {'change':>8} {'base KiB':>10} {'KiB':>10} {'change':>8}",
+        "-" * 96,
+    ]
+    regressions = []
+    for r in results:
+        base = baseline.get(r.name)
+        if base is None:
+            lines.append(f"{r.name:<34} {'(new)':>10} {r.p50_us:>10.1f}")
+            continue
+        time_change = _change(r.p50_us, base["p50_us"])
+        mem_change = _change(r.peak_kib, base["peak_kib"])
+        flag = ""
+        mem_regressed = mem_change > threshold and r.peak_kib - base["peak_kib"] > MEMORY_SLACK_KIB
+        if time_change > threshold or mem_regressed:
+            regressions.append(r.name)
+            flag = "  REGRESSION"
+        elif time_change < -threshold:
+            flag = "  faster"
+        lines.append(
+            f"{r.name:<34} {base['p50_us']:>10.1f} {r.p50_us:>10.1f} {time_change:>+8.1%} "
+            f"{base['peak_kib']:>10.1f} {r.peak_kib:>10.1f} {mem_change:>+8.1%}{flag}"
+        )
+    missing = len(set(baseline) - {r.name for r in results})
+    if missing:
+        lines.append(f"({missing} baseline case(s) not run)")
+    return "\n".join(lines), regressions
+
+
+def _change(current: float, base: float) -> float:
+    """Relative change from `base` to `current` (0 when the baseline is 0)."""
+    return (current - base) / base if base else 0.0
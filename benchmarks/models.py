@@ -0,0 +1,108 @@
+# benchmarks/models.py
+"""
+Representative models for the benchmark suite, each with builders for several scales:
+- Flat: one record of plain fields
+- Nested: a chain of nested dataclasses (depth grows with the scale)
+- Wide: a record holding a long list of small dataclasses
+- Document: a FlexibleRecord with a large text body
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+from WrapDataclass import BaseModel
+from WrapDataclass.manager.base_record import AutoIDRecord, FlexibleRecord
+
+# === Models ===
+
+@dataclass(kw_only=True)
+class Flat(AutoIDRecord):
+    name: str
+    email: str
+    age: int
+    score: float
+    active: bool
+    city: str
+    country: str
+    notes: Optional[str] = None
+    visits: int = 0
+    ratio: float = 0.0
+
+
+@dataclass
+class Tag(BaseModel):
+    label: str
+    weight: int = 1
+
+
+@dataclass
+class Node(BaseModel):
+    name: str
+    value: float
+    tags: List[Tag] = field(default_factory=list)
+    child: Optional["Node"] = None
+
+
+@dataclass(kw_only=True)
+class Nested(AutoIDRecord):
+    title: str
+    root: Node
+
+
+@dataclass
+class Point(BaseModel):
+    x: float
+    y: float
+    label: str
+    valid: bool = True
+
+
+@dataclass(kw_only=True)
+class Wide(AutoIDRecord):
+    title: str
+    points: List[Point] = field(default_factory=list)
+
+
+@dataclass(kw_only=True)
+class Document(FlexibleRecord):
+    author: str = "bench"
+    tags: List[str] = field(default_factory=list)
+
+
+# === Builders ===
+
+def make_flat(scale: int) -> Flat:
+    """A flat record has a fixed shape, so it has a single scale."""
+    return Flat(
+        id="flat-0", name="Ada Lovelace", email="ada@example.com", age=36, score=97.5,
+        active=True, city="London", country="UK", notes="analytical engine", visits=12, ratio=0.25,
+    )
+
+
+def make_nested(depth: int) -> Nested:
+    """A chain of `depth` nodes, each with three tags."""
+    root = None
+    for level in reversed(range(depth)):
+        tags = [Tag(f"tag-{level}-{i}", i) for i in range(3)]
+        root = Node(name=f"node-{level}", value=level * 1.5, tags=tags, child=root)
+    return Nested(id="nested-0", title="nested", root=root)
+
+
+def make_wide(count: int) -> Wide:
+    """A record with `count` points."""
+    return Wide(id="wide-0", title="wide", points=[Point(i * 0.5, i * 2.0, f"p{i}") for i in range(count)])
+
+
+def make_document(kib: int) -> Document:
+    """A document whose body is `kib` KiB of text."""
+    line = "The quick brown fox jumps over the lazy dog. " * 2 + "\n"
+    body = (line * (kib * 1024 // len(line) + 1))[:kib * 1024]
+    return Document(id="doc-0", title="document", body=body, tags=["bench", "text"])
+
+
+# Model name -> (model type, builder, {scale name: builder argument}); models only run at the scales they list.
+MODELS: dict[str, tuple[type, Callable, dict[str, int]]] = {
+    "flat": (Flat, make_flat, {"small": 1}),
+    "nested": (Nested, make_nested, {"small": 3, "medium": 10, "large": 40}),
+    "wide": (Wide, make_wide, {"small": 10, "medium": 1_000, "large": 20_000}),
+    "document": (Document, make_document, {"small": 1, "medium": 64, "large": 1024}),
+}
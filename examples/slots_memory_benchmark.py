@@ -0,0 +1,66 @@
+# examples/slots_memory_benchmark.py
+"""
+Compares per-instance memory of regular and slotted records:
+- AutoIDRecord vs SlottedAutoIDRecord subclasses with the same fields
+- Measured with tracemalloc while N instances are alive
+- Also times dict-like access (keys/items), which uses cached field names
+
+Run: python examples/slots_memory_benchmark.py [N]
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from WrapDataclass.manager.base_record import AutoIDRecord, SlottedAutoIDRecord
+
+# === Record Models (identical fields) ===
+
+@dataclass(kw_only=True)
+class Reading(AutoIDRecord):
+    sensor: str
+    value: float
+    unit: str = "C"
+    ok: bool = True
+
+@dataclass(kw_only=True, slots=True)
+class SlottedReading(SlottedAutoIDRecord):
+    sensor: str
+    value: float
+    unit: str = "C"
+    ok: bool = True
+
+
+def measure(cls: type, n: int) -> tuple[float, float]:
+    """Return (bytes per instance, seconds for one keys()+items() pass over all instances)."""
+    # Shared field values so only the instances themselves are measured.
+    ids = [str(i) for i in range(n)]
+    sensor = "probe-1"
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objs = [cls(id=ids[i], sensor=sensor, value=1.5) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for obj in objs:
+        list(obj.keys())
+        list(obj.items())
+    elapsed = time.perf_counter() - start
+
+    # Subtract the list holding the instances.
+    return (after - before - sys.getsizeof(objs)) / n, elapsed
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    regular, regular_time = measure(Reading, n)
+    slotted, slotted_time = measure(SlottedReading, n)
+
+    print(f"Instances:            {n:,}")
+    print(f"AutoIDRecord:         {regular:7.1f} bytes/instance  dict-like pass {regular_time:.3f}s")
+    print(f"SlottedAutoIDRecord:  {slotted:7.1f} bytes/instance  dict-like pass {slotted_time:.3f}s")
+    print(f"Saving:               {regular - slotted:7.1f} bytes/instance ({1 - slotted / regular:.0%})")
+    print(f"Total for {n:,}:   {(regular - slotted) * n / 1024 / 1024:.1f} MiB")
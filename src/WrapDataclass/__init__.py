@@ -7,11 +7,18 @@ including the `BaseModel`, mixins for dictionary and file handling, and type res
 """
 
 
-from .core.base import BaseModel
+from .core.base import BaseModel, SlottedBaseModel
 from .core.mixin_dict import DictMixin
-from .core.mixin_file import FileMixin
+from .core.mixin_file import FileMixin, read_header
+from .core.mixin_binary import BinaryMixin
 from .core.mixin_dictlike import DictLikeMixin
 from .core.helpers import resolve_dataclass_type, get_list_inner_type
+from .core.plans import invalidate_plans
+from .core.codecs import JsonCodec, get_codec, available_backends
+from .core.compression import Compressor, get_compressor, available_compressions
+from .core.metrics import (
+    MetricEvent, MetricsSink, CallbackSink, CounterSink, LoggingSink, add_sink, remove_sink, clear_sinks, profile
+)
 
 
 import logging
@@ -22,9 +29,28 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     "BaseModel",
+    "SlottedBaseModel",
     "DictMixin",
     "FileMixin",
+    "read_header",
+    "BinaryMixin",
     "DictLikeMixin",
     "resolve_dataclass_type",
     "get_list_inner_type",
+    "invalidate_plans",
+    "JsonCodec",
+    "get_codec",
+    "available_backends",
+    "Compressor",
+    "get_compressor",
+    "available_compressions",
+    "MetricEvent",
+    "MetricsSink",
+    "CallbackSink",
+    "CounterSink",
+    "LoggingSink",
+    "add_sink",
+    "remove_sink",
+    "clear_sinks",
+    "profile",
 ]
@@ -1,7 +1,8 @@
 # core/base.py
 """
 BaseModel definition for WrapDataclass.
-Combines DictLike, Dict, and File mixins into a single serializable dataclass.
+Combines DictLike, Dict, File and Binary mixins into a single serializable dataclass,
+plus a `__slots__`-based variant for keeping many instances in memory.
 """
 
 from dataclasses import dataclass
@@ -12,15 +13,27 @@ logger = logging.getLogger(__name__)
 
 from .mixin_dictlike import DictLikeMixin
 from .mixin_file import FileMixin
+from .mixin_binary import BinaryMixin
 
 
 @dataclass
-class BaseModel(DictLikeMixin, FileMixin):
+class BaseModel(DictLikeMixin, FileMixin, BinaryMixin):
     """Base class for serializable dataclasses.
 
     Combines dict-like access (`obj['key']`), dictionary serialization (`to_dict`, `from_dict`),
-    and file-based JSON persistence (`to_json`, `from_json`).
+    file-based JSON persistence (`to_json`, `from_json`) and compact binary encoding
+    (`to_bytes`, `from_bytes`).
     """
+    __slots__ = ()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.to_dict(skip_none=True)})"
+
+
+@dataclass(slots=True)
+class SlottedBaseModel(BaseModel):
+    """Memory-compact BaseModel: instances store fields in `__slots__` instead of a `__dict__`.
+
+    Subclasses must also be declared with `@dataclass(slots=True)`, otherwise they get a
+    `__dict__` again. Slotted instances cannot take attributes that are not fields.
+    """
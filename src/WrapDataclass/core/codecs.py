@@ -0,0 +1,137 @@
+# core/codecs.py
+"""
+Pluggable JSON codecs for FileMixin and BaseManager.
+
+The stdlib `json` module is always available. `orjson` and `ujson` are used only if
+installed. Every codec reads plain JSON, so files written by one backend load with
+any other.
+"""
+
+from typing import Any, Optional, Union
+import json
+import logging
+
+# Logger Configuration
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # optional accelerated backend
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # optional accelerated backend
+    ujson = None
+
+
+class JsonCodec:
+    """Standard library JSON codec; pretty-printed (indent=2) unless compact."""
+    name = "json"
+
+    def __init__(self, compact: bool = False):
+        """
+        Args:
+            compact (bool): If True, emit no indentation or extra whitespace.
+        """
+        self.compact = compact
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(compact={self.compact})"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to UTF-8 JSON bytes."""
+        if self.compact:
+            return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes or text. Raises json.JSONDecodeError on malformed input."""
+        return json.loads(data)
+
+    def as_compact(self) -> "JsonCodec":
+        """Return a compact variant of this codec (itself if already compact)."""
+        return self if self.compact else self.__class__(compact=True)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by `orjson`. Emits UTF-8 directly rather than escaping non-ASCII text."""
+    name = "orjson"
+
+    def __init__(self, compact: bool = False):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+        super().__init__(compact)
+        self._option = 0 if compact else orjson.OPT_INDENT_2
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=self._option)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """Codec backed by `ujson`."""
+    name = "ujson"
+
+    def __init__(self, compact: bool = False):
+        if ujson is None:
+            raise ImportError("ujson is not installed")
+        super().__init__(compact)
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, indent=0 if self.compact else 2).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return ujson.loads(data)
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), data if isinstance(data, str) else "", 0)
+
+
+_BACKENDS = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "ujson": UjsonCodec,
+}
+
+DEFAULT_CODEC = JsonCodec()
+
+
+def available_backends() -> list[str]:
+    """Return the names of the codec backends that can be used in this environment."""
+    return ["json"] + [name for name, mod in (("orjson", orjson), ("ujson", ujson)) if mod is not None]
+
+
+def get_codec(backend: Union[str, JsonCodec, None] = None, compact: bool = False) -> JsonCodec:
+    """
+    Resolve a codec from a backend name or instance.
+    Args:
+        backend (str | JsonCodec | None): "json", "orjson", "ujson", "auto" (fastest installed),
+            a codec instance, or None for the stdlib default.
+        compact (bool): If True, return the compact (no indent) variant.
+    Returns:
+        JsonCodec: The resolved codec.
+    """
+    if isinstance(backend, JsonCodec):
+        return backend.as_compact() if compact else backend
+    if backend is None and not compact:
+        return DEFAULT_CODEC
+
+    name = backend or "json"
+    if name == "auto":
+        name = "orjson" if orjson is not None else "ujson" if ujson is not None else "json"
+    try:
+        codec_cls = _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec backend '{name}'; expected one of {sorted(_BACKENDS)} or 'auto'")
+    return codec_cls(compact=compact)
+
+
+def resolve_codec(codec: Optional[JsonCodec], owner: Any = None) -> JsonCodec:
+    """Return `codec` if given, else the owner's `json_codec` class default, else the stdlib codec."""
+    if codec is not None:
+        return codec
+    return getattr(owner, "json_codec", None) or DEFAULT_CODEC
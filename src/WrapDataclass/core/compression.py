@@ -0,0 +1,295 @@
+# core/compression.py
+"""
+Transparent compression for JSON record files.
+
+gzip, bz2 and lzma (xz) come from the standard library; zstd is used only if
+`compression.zstd` (Python 3.14+) or the `zstandard` package is installed. Compressed
+data is recognized by its magic bytes, so readers never need to be told which
+compressor (if any) wrote a file: plain JSON is passed through unchanged. Corrupt or
+truncated compressed data raises ValueError, whether decompressed whole or streamed.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+import bz2
+import gzip
+import io
+import lzma
+import zlib
+import logging
+
+# Logger Configuration
+logger = logging.getLogger(__name__)
+
+try:
+    from compression import zstd
+except ImportError:  # Python < 3.14
+    zstd = None
+
+try:
+    import zstandard
+except ImportError:  # optional zstd backend
+    zstandard = None
+
+
+class Compressor(ABC):
+    """Base class: a named compression format with its magic bytes and file suffix."""
+    name = ""
+    suffix = ""
+    magic = b""
+    default_level: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    @abstractmethod
+    def compress(self, data: bytes, level: Optional[int] = None) -> bytes:
+        """Compress bytes (`level` None uses the format's default)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress bytes produced by `compress`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def open(self, path: Union[Path, str]) -> BinaryIO:
+        """Open a compressed file as a decompressing binary reader."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def open_append(self, path: Union[Path, str], level: Optional[int] = None) -> BinaryIO:
+        """Open a file for appending a new compressed stream (readers see the concatenation)."""
+        raise NotImplementedError
+
+
+class GzipCompressor(Compressor):
+    """gzip (stdlib). Written with a zero timestamp so equal input gives equal output."""
+    name = "gzip"
+    suffix = ".gz"
+    magic = b"\x1f\x8b"
+    default_level = 6
+
+    def compress(self, data: bytes, level: Optional[int] = None) -> bytes:
+        return gzip.compress(data, compresslevel=self.default_level if level is None else level, mtime=0)
+
+    def decompress(self, data: bytes) -> bytes:
+        return gzip.decompress(data)
+
+    def open(self, path: Union[Path, str]) -> BinaryIO:
+        return gzip.open(path, "rb")
+
+    def open_append(self, path: Union[Path, str], level: Optional[int] = None) -> BinaryIO:
+        return gzip.GzipFile(path, "ab", compresslevel=self.default_level if level is None else level, mtime=0)
+
+
+class Bz2Compressor(Compressor):
+    """bzip2 (stdlib)."""
+    name = "bz2"
+    suffix = ".bz2"
+    magic = b"BZh"
+    default_level = 9
+
+    def compress(self, data: bytes, level: Optional[int] = None) -> bytes:
+        return bz2.compress(data, self.default_level if level is None else level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return bz2.decompress(data)
+
+    def open(self, path: Union[Path, str]) -> BinaryIO:
+        return bz2.open(path, "rb")
+
+    def open_append(self, path: Union[Path, str], level: Optional[int] = None) -> BinaryIO:
+        return bz2.open(path, "ab", compresslevel=self.default_level if level is None else level)
+
+
+class LzmaCompressor(Compressor):
+    """xz / LZMA (stdlib)."""
+    name = "lzma"
+    suffix = ".xz"
+    magic = b"\xfd7zXZ\x00"
+    default_level = 6
+
+    def compress(self, data: bytes, level: Optional[int] = None) -> bytes:
+        return lzma.compress(data, preset=self.default_level if level is None else level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return lzma.decompress(data)
+
+    def open(self, path: Union[Path, str]) -> BinaryIO:
+        return lzma.open(path, "rb")
+
+    def open_append(self, path: Union[Path, str], level: Optional[int] = None) -> BinaryIO:
+        return lzma.open(path, "ab", preset=self.default_level if level is None else level)
+
+
+class ZstdCompressor(Compressor):
+    """Zstandard, via `compression.zstd` or the `zstandard` package."""
+    name = "zstd"
+    suffix = ".zst"
+    magic = b"\x28\xb5\x2f\xfd"
+    default_level = 3
+
+    def compress(self, data: bytes, level: Optional[int] = None) -> bytes:
+        level = self.default_level if level is None else level
+        if zstd is not None:
+            return zstd.compress(data, level)
+        return zstandard.ZstdCompressor(level=level).compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        if zstd is not None:
+            return zstd.decompress(data)
+        # One frame at a time: appends add frames, and a frame cut short must not pass silently.
+        chunks = []
+        while data:
+            frame = zstandard.ZstdDecompressor().decompressobj()
+            chunks.append(frame.decompress(data))
+            if not frame.eof:
+                raise EOFError("Compressed data ended before the end-of-frame marker")
+            data = frame.unused_data
+        return b"".join(chunks)
+
+    def open(self, path: Union[Path, str]) -> BinaryIO:
+        if zstd is not None:
+            return zstd.open(path, "rb")
+        # Buffered so short reads only happen at end of stream.
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+        )
+
+    def open_append(self, path: Union[Path, str], level: Optional[int] = None) -> BinaryIO:
+        level = self.default_level if level is None else level
+        if zstd is not None:
+            return zstd.open(path, "ab", level=level)
+        return zstandard.open(path, "ab", cctx=zstandard.ZstdCompressor(level=level))
+
+
+# What the decompressors raise for corrupt or truncated input (gzip.BadGzipFile is an OSError).
+_CORRUPT_ERRORS: tuple[type[BaseException], ...] = (OSError, EOFError, lzma.LZMAError, zlib.error)
+if zstd is not None:
+    _CORRUPT_ERRORS += (zstd.ZstdError,)
+if zstandard is not None:
+    _CORRUPT_ERRORS += (zstandard.ZstdError,)
+
+
+class _CheckedStream(io.RawIOBase):
+    """Raw adapter over a decompressing stream that reports damaged data as ValueError.
+    `open_decompressed` buffers it, so the check runs once per chunk rather than per line."""
+    def __init__(self, stream: BinaryIO, compressor: Compressor, path: Union[Path, str]):
+        self._stream = stream
+        self._compressor = compressor
+        self._path = path
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        try:
+            return self._stream.readinto(buffer)
+        except _CORRUPT_ERRORS as e:
+            raise ValueError(f"Corrupt {self._compressor.name} data in '{self._path}': {e}") from e
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._stream.close()
+            finally:
+                super().close()
+
+
+_COMPRESSORS: dict[str, Compressor] = {
+    "gzip": GzipCompressor(),
+    "bz2": Bz2Compressor(),
+    "lzma": LzmaCompressor(),
+    "zstd": ZstdCompressor(),
+}
+
+# Longest magic prefix needed to recognize any format.
+MAGIC_LENGTH = max(len(c.magic) for c in _COMPRESSORS.values())
+
+
+def _installed(compressor: Compressor) -> bool:
+    return compressor.name != "zstd" or zstd is not None or zstandard is not None
+
+
+def available_compressions() -> list[str]:
+    """Return the names of the compression formats that can be used in this environment."""
+    return [name for name, c in _COMPRESSORS.items() if _installed(c)]
+
+
+def get_compressor(compression: Union[str, Compressor, None]) -> Optional[Compressor]:
+    """
+    Resolve a compressor from a name or instance.
+    Args:
+        compression (str | Compressor | None): "gzip", "bz2", "lzma" (or "xz"), "zstd",
+            an instance, or None / "none" for no compression.
+    Returns:
+        Compressor | None: The compressor, or None for plain JSON.
+    """
+    if compression is None or isinstance(compression, Compressor):
+        return compression
+    name = {"xz": "lzma", "gz": "gzip", "zst": "zstd"}.get(compression, compression)
+    if name == "none":
+        return None
+    compressor = _COMPRESSORS.get(name)
+    if compressor is None:
+        raise ValueError(f"Unknown compression '{compression}'; expected one of {sorted(_COMPRESSORS)} or 'none'")
+    if not _installed(compressor):
+        raise ValueError("zstd compression needs Python 3.14+ or the 'zstandard' package")
+    return compressor
+
+
+def compressor_for_path(path: Union[Path, str]) -> Optional[Compressor]:
+    """Return the compressor implied by a file's last suffix (e.g. `data.json.gz`), or None."""
+    suffix = Path(path).suffix
+    for compressor in _COMPRESSORS.values():
+        if compressor.suffix == suffix:
+            return get_compressor(compressor)
+    return None
+
+
+def detect(data: bytes) -> Optional[Compressor]:
+    """Return the compressor whose magic bytes start `data`, or None for uncompressed data."""
+    for compressor in _COMPRESSORS.values():
+        if data.startswith(compressor.magic):
+            return compressor
+    return None
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress `data` if it starts with a known magic number; otherwise return it unchanged."""
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        return data
+    compressor = detect(bytes(data[:MAGIC_LENGTH]))
+    if compressor is None:
+        return data
+    if not _installed(compressor):
+        raise ValueError("Data is zstd-compressed; reading it needs Python 3.14+ or the 'zstandard' package")
+    try:
+        return compressor.decompress(data)
+    except _CORRUPT_ERRORS as e:
+        raise ValueError(f"Corrupt {compressor.name} data: {e}")
+
+
+def detect_file(path: Union[Path, str]) -> Optional[Compressor]:
+    """Return the compressor a file was written with, from its magic bytes (None if plain)."""
+    with open(path, "rb") as f:
+        return detect(f.read(MAGIC_LENGTH))
+
+
+def open_decompressed(path: Union[Path, str]) -> BinaryIO:
+    """Open a file for binary reading, decompressing on the fly if it is compressed.
+    Reads from a compressed file raise ValueError if its data is corrupt or truncated."""
+    f = open(path, "rb")
+    try:
+        compressor = detect(f.peek(MAGIC_LENGTH)[:MAGIC_LENGTH])
+    except BaseException:
+        f.close()
+        raise
+    if compressor is None:
+        return f
+    f.close()
+    if not _installed(compressor):
+        raise ValueError(f"File '{path}' is zstd-compressed; reading it needs Python 3.14+ or the 'zstandard' package")
+    return io.BufferedReader(_CheckedStream(compressor.open(path), compressor, path))
@@ -0,0 +1,117 @@
+# core/fileio.py
+"""
+Crash-safe file writing helpers.
+
+Files are written to a temporary sibling and moved into place with `os.replace`,
+so readers see either the old or the new content, never a truncated file.
+Group writes fsync the directory once for the whole batch. Append-only journals
+use `append_line`, which drops a torn last line before appending.
+"""
+
+from pathlib import Path
+from typing import Iterable
+import os
+import threading
+import logging
+
+# Logger Configuration
+logger = logging.getLogger(__name__)
+
+
+def _temp_path(path: Path) -> Path:
+    """Return a unique hidden temporary path next to `path`."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _write_temp(path: Path, data: bytes, fsync: bool) -> Path:
+    """Write data to a temporary sibling of `path` and return the temporary path."""
+    tmp = _temp_path(path)
+    with tmp.open("wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    return tmp
+
+
+def fsync_directory(directory: Path | str) -> None:
+    """Flush a directory's entries (e.g. completed renames) to disk, where supported."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.debug(f"Directory fsync not supported for '{directory}': {e}")
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: Path | str, data: bytes, *, fsync: bool = False) -> None:
+    """
+    Atomically replace `path` with `data`.
+    Args:
+        path (str | Path): Destination file.
+        data (bytes): Full file content.
+        fsync (bool): If True, fsync the file and its directory so the write survives power loss.
+    """
+    path = Path(path)
+    tmp = _write_temp(path, data, fsync)
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    if fsync:
+        fsync_directory(path.parent)
+
+
+def atomic_write_group(items: Iterable[tuple[Path, bytes]], *, fsync: bool = True) -> None:
+    """
+    Atomically write a batch of files as one group commit.
+    Every file is staged to a temporary sibling first; only then are they moved into
+    place, followed by a single fsync per affected directory.
+    Args:
+        items (Iterable[tuple[Path, bytes]]): (destination, content) pairs.
+        fsync (bool): If True, fsync each staged file and each directory once.
+    """
+    staged = []
+    try:
+        for path, data in items:
+            path = Path(path)
+            staged.append((_write_temp(path, data, fsync), path))
+        for tmp, path in staged:
+            os.replace(tmp, path)
+    except OSError:
+        for tmp, _ in staged:
+            tmp.unlink(missing_ok=True)
+        raise
+
+    if fsync:
+        for directory in {path.parent for _, path in staged}:
+            fsync_directory(directory)
+
+
+def append_line(path: Path | str, line: bytes) -> int:
+    """
+    Append one newline-terminated line to a journal file.
+    A crash can leave a partial last line with no newline; it was never acknowledged,
+    so it is truncated first rather than glued onto the new line.
+    Args:
+        path (str | Path): Journal file (created if missing).
+        line (bytes): Line content, without the trailing newline.
+    Returns:
+        int: File size after the append.
+    """
+    with open(path, "a+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                f.seek(0)
+                keep = f.read().rfind(b"\n") + 1
+                f.truncate(keep)
+                logger.warning(f"Truncated a torn line ({size - keep} bytes) at the end of '{path}'")
+        f.write(line + b"\n")
+        return f.tell()
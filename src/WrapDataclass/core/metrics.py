@@ -0,0 +1,295 @@
+# core/metrics.py
+"""
+Opt-in instrumentation for serialization and record I/O.
+
+Instrumented operations (`to_dict`, `from_dict`, `to_json`, `from_json`, the byte variants,
+and `BaseManager` save/load/update/delete/flush/bulk/find) report one `MetricEvent` each,
+with the elapsed time, bytes, records and the exception type if the call failed. Events go
+to the registered sinks (`add_sink`) and to any `profile()` block open in the calling thread.
+
+While nothing is registered, the only cost is one check of `ACTIVE` on the hot paths
+(`to_dict`/`from_dict`) and a no-op context manager from `timed()` around file and manager I/O.
+Timings are inclusive: `manager.load` contains the `from_json_bytes` and `from_dict` it
+calls. A recursive call of the same operation (nested dataclasses in `to_dict`) is part of
+the outer call and is not reported separately.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Iterator, NamedTuple, Optional, Union
+import functools
+import threading
+import time
+import logging
+
+# Logger Configuration
+logger = logging.getLogger(__name__)
+
+# True while any sink or profile block is registered; checked by instrumented code before timing.
+ACTIVE = False
+
+_sinks: tuple["MetricsSink", ...] = ()
+_profiles = 0
+_registry_lock = threading.Lock()
+_local = threading.local()
+
+
+class MetricEvent(NamedTuple):
+    """One completed operation."""
+    op: str
+    seconds: float
+    bytes: int = 0
+    records: int = 1
+    error: Optional[str] = None
+
+
+class MetricsSink(ABC):
+    """Receives metric events. Subclasses implement `record`; it may be called from any thread."""
+    @abstractmethod
+    def record(self, event: MetricEvent) -> None:
+        """Handle one completed operation."""
+        raise NotImplementedError
+
+
+class CallbackSink(MetricsSink):
+    """Forwards every event to a callable."""
+    def __init__(self, callback: Callable[[MetricEvent], None]):
+        self.callback = callback
+
+    def record(self, event: MetricEvent) -> None:
+        self.callback(event)
+
+
+class LoggingSink(MetricsSink):
+    """Logs one line per event."""
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.log = log or logger
+        self.level = level
+
+    def record(self, event: MetricEvent) -> None:
+        status = f" error={event.error}" if event.error else ""
+        self.log.log(
+            self.level,
+            f"{event.op}: {event.seconds * 1e3:.3f}ms bytes={event.bytes} records={event.records}{status}"
+        )
+
+
+class CounterSink(MetricsSink):
+    """Aggregates events in memory, per operation."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict] = {}
+
+    def record(self, event: MetricEvent) -> None:
+        with self._lock:
+            stats = self._stats.get(event.op)
+            if stats is None:
+                stats = self._stats[event.op] = {
+                    "count": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0, "bytes": 0, "records": 0,
+                }
+            stats["count"] += 1
+            stats["seconds"] += event.seconds
+            stats["max_seconds"] = max(stats["max_seconds"], event.seconds)
+            stats["bytes"] += event.bytes
+            stats["records"] += event.records
+            if event.error:
+                stats["errors"] += 1
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Return a copy of the counters.
+        Returns:
+            dict[str, dict]: op -> count, errors, seconds, max_seconds, bytes and records.
+        """
+        with self._lock:
+            return {op: dict(stats) for op, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> str:
+        """Render the counters as a text table, slowest operations (by total time) first."""
+        lines = [f"{'operation':<24} {'count':>8} {'errors':>7} {'total ms':>10} {'mean us':>10} {'bytes':>12}"]
+        for op, s in sorted(self.snapshot().items(), key=lambda item: -item[1]["seconds"]):
+            mean_us = s["seconds"] / s["count"] * 1e6 if s["count"] else 0.0
+            lines.append(
+                f"{op:<24} {s['count']:>8} {s['errors']:>7} {s['seconds'] * 1e3:>10.2f} {mean_us:>10.1f} {s['bytes']:>12}"
+            )
+        return "\n".join(lines)
+
+
+def _update_active() -> None:
+    global ACTIVE
+    ACTIVE = bool(_sinks) or _profiles > 0
+
+
+def add_sink(sink: Union[MetricsSink, Callable[[MetricEvent], None]]) -> MetricsSink:
+    """
+    Register a sink for events from every thread. Plain callables are wrapped in a `CallbackSink`.
+    Args:
+        sink (MetricsSink | Callable): Sink or callback.
+    Returns:
+        MetricsSink: The registered sink (pass it to `remove_sink`).
+    """
+    global _sinks
+    if not isinstance(sink, MetricsSink):
+        sink = CallbackSink(sink)
+    with _registry_lock:
+        _sinks = _sinks + (sink,)
+        _update_active()
+    return sink
+
+
+def remove_sink(sink: MetricsSink) -> None:
+    """Unregister a sink (no-op if it is not registered)."""
+    global _sinks
+    with _registry_lock:
+        _sinks = tuple(s for s in _sinks if s is not sink)
+        _update_active()
+
+
+def clear_sinks() -> None:
+    """Unregister all sinks."""
+    global _sinks
+    with _registry_lock:
+        _sinks = ()
+        _update_active()
+
+
+@contextmanager
+def profile() -> Iterator[CounterSink]:
+    """
+    Collect counters for every instrumented call made by this thread inside the block,
+    however deeply nested. Blocks can nest; each sees the events of its own extent.
+        with profile() as prof:
+            manager.load_many(names)
+        print(prof.report())
+    Returns:
+        Iterator[CounterSink]: The counters for the block.
+    """
+    global _profiles
+    sink = CounterSink()
+    stack = getattr(_local, "profiles", None)
+    if stack is None:
+        stack = _local.profiles = []
+    stack.append(sink)
+    with _registry_lock:
+        _profiles += 1
+        _update_active()
+    try:
+        yield sink
+    finally:
+        stack.remove(sink)
+        with _registry_lock:
+            _profiles -= 1
+            _update_active()
+
+
+def bind(func: Callable) -> Callable:
+    """
+    Make the calling thread's open `profile()` blocks also collect events from `func`
+    when it runs on another thread (e.g. a pool worker). Returns `func` unchanged if none are open.
+    """
+    profiles = tuple(getattr(_local, "profiles", None) or ())
+    if not profiles:
+        return func
+
+    @functools.wraps(func)
+    def bound(*args, **kwargs):
+        stack = getattr(_local, "profiles", None)
+        if stack is None:
+            stack = _local.profiles = []
+        depth = len(stack)
+        stack.extend(profiles)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            del stack[depth:]
+    return bound
+
+
+def emit(event: MetricEvent) -> None:
+    """Deliver an event to the registered sinks and this thread's open profile blocks."""
+    for sink in _sinks + tuple(getattr(_local, "profiles", None) or ()):
+        try:
+            sink.record(event)
+        except Exception as e:
+            logger.error(f"Metrics sink {sink!r} failed: {e}")
+
+
+class Span:
+    """Times one instrumented call; use via `span()` as a context manager."""
+    __slots__ = ("op", "bytes", "records", "_start")
+
+    def __init__(self, op: str, records: int):
+        self.op = op
+        self.bytes = 0
+        self.records = records
+
+    def __enter__(self) -> "Span":
+        _open_spans().append(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        elapsed = time.perf_counter() - self._start
+        _open_spans().pop()
+        emit(MetricEvent(self.op, elapsed, self.bytes, self.records, exc_type.__name__ if exc_type else None))
+        return False
+
+
+class _NullSpan:
+    """Stand-in for a recursive call of an operation that is already being timed."""
+    __slots__ = ()
+    bytes = 0
+    records = 0
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def __setattr__(self, name: str, value) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _open_spans() -> list:
+    spans = getattr(_local, "spans", None)
+    if spans is None:
+        spans = _local.spans = []
+    return spans
+
+
+def span(op: str, records: int = 1) -> Union[Span, _NullSpan]:
+    """
+    Return a context manager timing one call of `op` (call only when `ACTIVE`).
+    Args:
+        op (str): Operation name, e.g. "from_dict" or "manager.load".
+        records (int): Records handled by the call.
+    Returns:
+        Span: Set `.bytes` / `.records` on it before the block ends to report them.
+    """
+    for open_span in _open_spans():
+        if open_span.op == op:
+            return _NULL_SPAN
+    return Span(op, records)
+
+
+def timed(op: str, records: int = 1) -> Union[Span, _NullSpan]:
+    """`span()` if instrumentation is active, else a shared no-op context manager."""
+    if not ACTIVE:
+        return _NULL_SPAN
+    return span(op, records)
+
+
+def add_bytes(count: int) -> None:
+    """Add to the byte count of the innermost call being timed in this thread (call only when `ACTIVE`)."""
+    spans = _open_spans()
+    if spans:
+        spans[-1].bytes += count
@@ -0,0 +1,396 @@
+# core/mixin_binary.py
+"""
+BinaryMixin for compact binary serialization of dataclasses.
+
+Records are encoded in dataclass field order without field names. Each value carries
+a one-byte tag; ints use zigzag varints, floats are packed as 8-byte IEEE doubles and
+strings are length-prefixed UTF-8. Nested dataclasses and lists of dataclasses are
+encoded recursively from their own field order. Records whose fields are all plain
+float/int/bool are packed with a single `struct` call. A file starts with a magic
+number, a format version and the same header metadata as the JSON format.
+"""
+
+from dataclasses import is_dataclass
+from pathlib import Path
+from typing import Any, Callable, Type
+import functools
+import struct
+import logging
+
+# Logger Configuration
+logger = logging.getLogger(__name__)
+
+from .mixin_dict import DictMixin
+from .mixin_file import _check_header
+from .plans import get_binary_plan
+from .types import T
+
+MAGIC = b"WDCB"
+FORMAT_VERSION = 1
+
+# Value tags
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_LIST = 6
+TAG_DICT = 7
+TAG_BYTES = 8
+TAG_RECORD = 9
+TAG_RECORD_LIST = 10
+
+# Record layouts
+LAYOUT_TAGGED = 0
+LAYOUT_PACKED = 1
+
+_DOUBLE = struct.Struct("<d")
+_unpack_double = _DOUBLE.unpack_from
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+@functools.lru_cache(maxsize=None)
+def _packed_struct(codes: str) -> struct.Struct:
+    """Return the little-endian Struct for a string of field codes."""
+    return struct.Struct("<" + codes)
+
+
+def _packable(values: list, codes: str) -> bool:
+    """Check that every value exactly matches its struct code (no None, no subclasses, int64 range)."""
+    for v, code in zip(values, codes):
+        if code == "d":
+            if v.__class__ is not float:
+                return False
+        elif code == "q":
+            if v.__class__ is not int or not _INT64_MIN <= v <= _INT64_MAX:
+                return False
+        elif v.__class__ is not bool:
+            return False
+    return True
+
+# --- Encoding -------------------------------------------------------------
+
+def _write_varint(out: bytearray, n: int) -> None:
+    """Append an unsigned LEB128 varint."""
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _write_str(out: bytearray, s: str) -> None:
+    """Append a length-prefixed UTF-8 string."""
+    raw = s.encode("utf-8")
+    _write_varint(out, len(raw))
+    out += raw
+
+
+def _encode_int(out: bytearray, v: int) -> None:
+    out.append(TAG_INT)
+    _write_varint(out, (v << 1) if v >= 0 else ((-v << 1) - 1))
+
+
+def _encode_float(out: bytearray, v: float) -> None:
+    out.append(TAG_FLOAT)
+    out += _DOUBLE.pack(v)
+
+
+def _encode_str(out: bytearray, v: str) -> None:
+    out.append(TAG_STR)
+    _write_str(out, v)
+
+
+def _encode_bool(out: bytearray, v: bool) -> None:
+    out.append(TAG_TRUE if v else TAG_FALSE)
+
+
+def _encode_bytes(out: bytearray, v: bytes) -> None:
+    out.append(TAG_BYTES)
+    _write_varint(out, len(v))
+    out += v
+
+
+def _encode_list(out: bytearray, v: list) -> None:
+    out.append(TAG_LIST)
+    _write_varint(out, len(v))
+    for item in v:
+        encode_value(out, item)
+
+
+def _encode_dict(out: bytearray, v: dict) -> None:
+    out.append(TAG_DICT)
+    _write_varint(out, len(v))
+    for key, item in v.items():
+        _write_str(out, str(key))
+        encode_value(out, item)
+
+
+_VALUE_ENCODERS: dict[type, Callable[[bytearray, Any], None]] = {
+    int: _encode_int,
+    float: _encode_float,
+    str: _encode_str,
+    bool: _encode_bool,
+    bytes: _encode_bytes,
+    list: _encode_list,
+    tuple: _encode_list,
+    dict: _encode_dict,
+}
+
+
+def encode_value(out: bytearray, v: Any) -> None:
+    """Append a self-describing value. Dataclasses without a schema slot are stored as dicts."""
+    if v is None:
+        out.append(TAG_NONE)
+        return
+    encoder = _VALUE_ENCODERS.get(v.__class__)
+    if encoder is not None:
+        encoder(out, v)
+    elif is_dataclass(v):
+        _encode_dict(out, v.to_dict())
+    elif isinstance(v, bool):
+        _encode_bool(out, v)
+    elif isinstance(v, int):
+        _encode_int(out, int(v))
+    elif isinstance(v, float):
+        _encode_float(out, float(v))
+    elif isinstance(v, str):
+        _encode_str(out, str(v))
+    elif isinstance(v, (list, tuple)):
+        _encode_list(out, v)
+    elif isinstance(v, dict):
+        _encode_dict(out, v)
+    else:
+        raise TypeError(f"Cannot binary-encode value of type {type(v).__name__}")
+
+
+def encode_record(out: bytearray, obj: Any) -> None:
+    """Append a dataclass instance as a layout byte, a field count and its values in field order."""
+    plan, packed = get_binary_plan(obj.__class__)
+    if packed is not None:
+        values = [getattr(obj, name) for name, _, _ in plan]
+        if _packable(values, packed):
+            out.append(LAYOUT_PACKED)
+            _write_varint(out, len(plan))
+            out += _packed_struct(packed).pack(*values)
+            return
+
+    out.append(LAYOUT_TAGGED)
+    _write_varint(out, len(plan))
+    for name, sub_type, is_list in plan:
+        value = getattr(obj, name)
+        if sub_type is None or value is None:
+            encode_value(out, value)
+        elif not is_list:
+            if value.__class__ is sub_type:
+                out.append(TAG_RECORD)
+                encode_record(out, value)
+            else:
+                encode_value(out, value)
+        elif value.__class__ is list:
+            out.append(TAG_RECORD_LIST)
+            _write_varint(out, len(value))
+            for item in value:
+                if item.__class__ is sub_type:
+                    out.append(TAG_RECORD)
+                    encode_record(out, item)
+                else:
+                    encode_value(out, item)
+        else:
+            encode_value(out, value)
+
+
+# --- Decoding -------------------------------------------------------------
+
+def _read_varint(buf: bytes, pos: int) -> tuple[int, int]:
+    """Read an unsigned LEB128 varint; return (value, new position)."""
+    result = 0
+    shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _read_str(buf: bytes, pos: int) -> tuple[str, int]:
+    """Read a length-prefixed UTF-8 string; return (value, new position)."""
+    n, pos = _read_varint(buf, pos)
+    end = pos + n
+    if end > len(buf):
+        raise IndexError("string extends past end of buffer")
+    return buf[pos:end].decode("utf-8"), end
+
+
+def decode_value(buf: bytes, pos: int, sub_type: Any = None) -> tuple[Any, int]:
+    """Read one tagged value; `sub_type` is the dataclass type for record tags."""
+    tag = buf[pos]
+    pos += 1
+    if tag == TAG_STR:
+        return _read_str(buf, pos)
+    if tag == TAG_INT:
+        z, pos = _read_varint(buf, pos)
+        return (z >> 1) if not z & 1 else -((z + 1) >> 1), pos
+    if tag == TAG_FLOAT:
+        return _DOUBLE.unpack_from(buf, pos)[0], pos + 8
+    if tag == TAG_NONE:
+        return None, pos
+    if tag == TAG_TRUE:
+        return True, pos
+    if tag == TAG_FALSE:
+        return False, pos
+    if tag == TAG_RECORD:
+        if sub_type is None:
+            raise ValueError("Nested record found where the schema has no dataclass field")
+        return decode_record(buf, pos, sub_type)
+    if tag == TAG_RECORD_LIST:
+        if sub_type is None:
+            raise ValueError("Record list found where the schema has no list-of-dataclass field")
+        n, pos = _read_varint(buf, pos)
+        items = []
+        for _ in range(n):
+            if buf[pos] == TAG_RECORD:
+                item, pos = decode_record(buf, pos + 1, sub_type)
+            else:
+                item, pos = decode_value(buf, pos, sub_type)
+            items.append(item)
+        return items, pos
+    if tag == TAG_LIST:
+        n, pos = _read_varint(buf, pos)
+        items = []
+        for _ in range(n):
+            item, pos = decode_value(buf, pos)
+            items.append(item)
+        return items, pos
+    if tag == TAG_DICT:
+        n, pos = _read_varint(buf, pos)
+        result = {}
+        for _ in range(n):
+            key, pos = _read_str(buf, pos)
+            result[key], pos = decode_value(buf, pos)
+        return result, pos
+    if tag == TAG_BYTES:
+        n, pos = _read_varint(buf, pos)
+        return bytes(buf[pos:pos + n]), pos + n
+    raise ValueError(f"Unknown binary value tag {tag}")
+
+
+def decode_record(buf: bytes, pos: int, cls: type) -> tuple[Any, int]:
+    """Read a record written by `encode_record` and construct an instance of `cls`.
+    Records with fewer fields than the class (fields appended later) use the defaults."""
+    plan, packed = get_binary_plan(cls)
+    layout = buf[pos]
+    count, pos = _read_varint(buf, pos + 1)
+    if count > len(plan):
+        raise ValueError(f"Record has {count} fields but {cls.__name__} defines {len(plan)}")
+
+    if layout == LAYOUT_PACKED:
+        if packed is None:
+            raise ValueError(f"Packed record found but {cls.__name__} has non-numeric fields")
+        layout_struct = _packed_struct(packed[:count])
+        values = layout_struct.unpack_from(buf, pos)
+        return cls(**{entry[0]: value for entry, value in zip(plan, values)}), pos + layout_struct.size
+    if layout != LAYOUT_TAGGED:
+        raise ValueError(f"Unknown record layout {layout}")
+
+    kwargs = {}
+    for name, sub_type, _ in plan[:count]:
+        # Inline the most common numeric cases; everything else goes through decode_value.
+        tag = buf[pos]
+        if tag == TAG_FLOAT:
+            kwargs[name] = _unpack_double(buf, pos + 1)[0]
+            pos += 9
+        elif tag == TAG_INT and buf[pos + 1] < 0x80:
+            z = buf[pos + 1]
+            kwargs[name] = (z >> 1) if not z & 1 else -((z + 1) >> 1)
+            pos += 2
+        else:
+            kwargs[name], pos = decode_value(buf, pos, sub_type)
+    return cls(**kwargs), pos
+
+
+# BinaryMixin
+class BinaryMixin(DictMixin):
+    """Provides compact, schema-driven binary serialization with header metadata."""
+    __slots__ = ()
+
+    def to_bytes(self, *, app_name: str, data_version: str, file_type: str = None) -> bytes:
+        """Serialize the dataclass and header metadata to the binary format.
+                Args:
+                    app_name (str): Name of the application.
+                    data_version (str): Version string for data format.
+                    file_type (str): Optional file type name override.
+                Returns:
+                    bytes: Encoded document.
+        """
+        out = bytearray(MAGIC)
+        out.append(FORMAT_VERSION)
+        encode_value(out, {
+            "app_name": app_name,
+            "data_version": data_version,
+            "file_type": file_type or self.__class__.__name__,
+        })
+        encode_record(out, self)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls: Type[T], content: bytes, require_type: str = None) -> T:
+        """Load an instance from binary content produced by `to_bytes`.
+                Args:
+                    content (bytes): Encoded document.
+                    require_type (str | None): Optional type check for header's file_type.
+                Returns:
+                    An instance of the dataclass.
+        """
+        return cls.from_bytes_with_header(content, require_type)[0]
+
+    @classmethod
+    def from_bytes_with_header(cls: Type[T], content: bytes, require_type: str = None) -> tuple[T, dict]:
+        """Load an instance and its metadata header from binary content.
+                Returns:
+                    tuple: (dataclass instance, header dictionary)
+        """
+        if len(content) <= len(MAGIC) or content[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a WrapDataclass binary document")
+        if content[len(MAGIC)] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported binary format version {content[len(MAGIC)]}")
+        try:
+            header, pos = decode_value(content, len(MAGIC) + 1)
+            if not isinstance(header, dict):
+                raise ValueError("Binary document header must be a dictionary")
+            _check_header(header, require_type)
+            obj, pos = decode_record(content, pos, cls)
+        except (IndexError, struct.error, UnicodeDecodeError, TypeError) as e:
+            raise ValueError(f"Error decoding binary content: {e}")
+        if pos != len(content):
+            raise ValueError(f"Error decoding binary content: {len(content) - pos} trailing bytes")
+        return obj, header
+
+    def to_binary_file(self, path: Path | str, *, app_name: str, data_version: str, file_type: str = None) -> None:
+        """Save the dataclass to a binary file with header metadata.
+                Args:
+                    path (str | Path): Output file path.
+                    app_name (str): Name of the application.
+                    data_version (str): Version string for data format.
+                    file_type (str): Optional file type name override.
+        """
+        Path(path).write_bytes(self.to_bytes(app_name=app_name, data_version=data_version, file_type=file_type))
+
+    @classmethod
+    def from_binary_file(cls: Type[T], path: Path | str, require_type: str = None) -> T:
+        """Load an instance from a binary file.
+                Args:
+                    path (str | Path): File to load.
+                    require_type (str | None): Optional type check for header's file_type.
+                Returns:
+                    An instance of the dataclass.
+        """
+        path = Path(path)
+        try:
+            content = path.read_bytes()
+        except OSError as e:
+            raise ValueError(f"Error loading binary file '{path}': {e}")
+        return cls.from_bytes(content, require_type)
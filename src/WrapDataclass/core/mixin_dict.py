@@ -6,15 +6,18 @@ Provides `to_dict` and `from_dict` methods for serializing dataclass instances,
 including nested dataclasses and lists of dataclasses.
 """
 
-from dataclasses import is_dataclass
-from typing import Type, TypeVar, get_type_hints, cast
+from typing import Iterable, Optional, Type, TypeVar, Union, cast
 import logging
 
 # Logger Configuration
 logger = logging.getLogger(__name__)
 
-from .helpers import get_dataclass_fields, resolve_dataclass_type, is_dataclass_type, is_list_of_dataclass, get_list_inner_type
+from .plans import (
+    get_encoder_plan, encode_with_plan, encode_columns, get_decoder_plan, decode_with_plan, decode_lazy,
+    project_data, invalidate_plans
+)
 from .types import T
+from . import metrics
 
 
 # DictMixin
@@ -22,51 +25,127 @@ class DictMixin:
     """Serialization mixin for dataclasses.
        Supports conversion to and from dictionaries, including nested structures.
     """
+    __slots__ = ()
+
     def to_dict(self, skip_none: bool = True) -> dict:
         """Convert the dataclass instance to a dictionary.
+                The field plan is built once per class and cached (see `core.plans`).
                 Args:
                     skip_none (bool): If True, omit fields with None values.
                 Returns:
                     dict: Dictionary representation of the dataclass.
         """
-        result = {}
-        for f in get_dataclass_fields(self):
-            value = getattr(self, f.name)
-            if value is None and skip_none:
-                continue
-            elif is_dataclass(value):
-                result[f.name] = cast(DictMixin, value).to_dict(skip_none=skip_none)
-            elif isinstance(value, list):
-                result[f.name] = [
-                    item.to_dict(skip_none=skip_none) if is_dataclass(item) else item
-                    for item in value
-                    if item is not None or not skip_none
-                ]
-            else:
-                result[f.name] = value
-        return result
+        plan = get_encoder_plan(self.__class__)
+        if not metrics.ACTIVE:
+            return encode_with_plan(self, plan, skip_none)
+        with metrics.span("to_dict"):
+            return encode_with_plan(self, plan, skip_none)
 
     @classmethod
-    def from_dict(cls: Type[T], data: dict) -> T:
+    def from_dict(cls: Type[T], data: dict, lazy: bool = False, only: Optional[Iterable[str]] = None) -> T:
         """Reconstruct a dataclass instance from a dictionary.
+                Type hints and nested dispatch are resolved once per class and cached.
                 Args:
                     data (dict): Dictionary to load values from.
+                    lazy (bool): If True, nested dataclass and list-of-dataclass fields keep
+                        their raw values and are converted on first attribute access, then cached.
+                    only (Iterable[str] | None): Decode just these fields (a projection). Other
+                        fields keep their defaults, or None if they have none, and nothing is
+                        built for them. Do not save a projected instance over the full record.
                 Returns:
                     An instance of the dataclass.
         """
-        kwargs = {}
-        type_hints = get_type_hints(cls)
+        if only is not None:
+            data = project_data(cls, data, only)
+        decode = decode_lazy if lazy else decode_with_plan
+        if not metrics.ACTIVE:
+            return cast(T, decode(cls, data, get_decoder_plan(cls)))
+        with metrics.span("from_dict"):
+            return cast(T, decode(cls, data, get_decoder_plan(cls)))
 
-        for key, val in data.items():
-            field_type = resolve_dataclass_type(type_hints.get(key))
-            if is_dataclass_type(field_type) and isinstance(val, dict):
-                kwargs[key] = field_type.from_dict(val)
-            elif is_list_of_dataclass(field_type) and isinstance(val, list):
-                sub_type = get_list_inner_type(type_hints.get(key))
-                kwargs[key] = [
-                    sub_type.from_dict(i) if isinstance(i, dict) else i for i in val
-                ]
-            else:
-                kwargs[key] = val
+    @classmethod
+    def to_dicts(
+        cls,
+        objs: Iterable[T],
+        skip_none: bool = True,
+        columnar: bool = False
+    ) -> Union[list[dict], dict[str, list]]:
+        """Convert many instances to dictionaries, reusing one plan for the batch.
+                Args:
+                    objs (Iterable[T]): Instances to convert.
+                    skip_none (bool): If True, omit fields with None values. In columnar
+                        mode None values are kept so columns stay aligned.
+                    columnar (bool): If True, return a dict of field name -> list of values
+                        instead of one dict per instance. Only this class's fields are emitted.
+                Returns:
+                    list[dict] | dict[str, list]: Row or columnar representation.
+        """
+        if metrics.ACTIVE:
+            objs = list(objs)
+            with metrics.span("to_dicts", records=len(objs)):
+                return cls._to_dicts(objs, skip_none, columnar)
+        return cls._to_dicts(objs, skip_none, columnar)
 
-        return cast(Type[T], cls)(**kwargs)
+    @classmethod
+    def _to_dicts(cls, objs: Iterable[T], skip_none: bool, columnar: bool) -> Union[list[dict], dict[str, list]]:
+        plan = get_encoder_plan(cls)
+        # An overridden to_dict must still run; the plan is only a shortcut for the default.
+        fast = cls.to_dict is DictMixin.to_dict
+        if columnar:
+            if fast:
+                return encode_columns(objs, plan, skip_none)
+            rows = [obj.to_dict(skip_none=False) for obj in objs]
+            return {name: [row.get(name) for row in rows] for name, _ in plan}
+        return [
+            encode_with_plan(obj, plan, skip_none) if fast and obj.__class__ is cls else obj.to_dict(skip_none=skip_none)
+            for obj in objs
+        ]
+
+    @classmethod
+    def from_dicts(
+        cls: Type[T],
+        data: Union[Iterable[dict], dict[str, list]],
+        columnar: bool = False,
+        lazy: bool = False
+    ) -> list[T]:
+        """Reconstruct many instances, reusing one plan for the batch.
+                Args:
+                    data (Iterable[dict] | dict[str, list]): Row dicts, or a columnar dict
+                        as produced by `to_dicts(..., columnar=True)`.
+                    columnar (bool): If True, `data` is a dict of field name -> list of values.
+                    lazy (bool): If True, defer nested conversion to first access (see `from_dict`).
+                Returns:
+                    list[T]: The reconstructed instances, in input order.
+        """
+        if not metrics.ACTIVE:
+            return cls._from_dicts(data, columnar, lazy)
+        with metrics.span("from_dicts") as span:
+            result = cls._from_dicts(data, columnar, lazy)
+            span.records = len(result)
+            return result
+
+    @classmethod
+    def _from_dicts(cls: Type[T], data: Union[Iterable[dict], dict[str, list]], columnar: bool, lazy: bool) -> list[T]:
+        if cls.from_dict.__func__ is DictMixin.from_dict.__func__:
+            plan = get_decoder_plan(cls)
+            decode = decode_lazy if lazy else decode_with_plan
+        else:
+            # Overridden from_dict: call it per row instead of bypassing it with the plan.
+            plan = None
+            decode = lambda c, row, _: c.from_dict(row, lazy=True) if lazy else c.from_dict(row)
+        if not columnar:
+            return [cast(T, decode(cls, row, plan)) for row in data]
+
+        names = list(data)
+        columns = [data[name] for name in names]
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise ValueError("Columnar data must have columns of equal length")
+        return [cast(T, decode(cls, dict(zip(names, values)), plan)) for values in zip(*columns)]
+
+    @classmethod
+    def invalidate_plan(cls) -> None:
+        """Drop this class's cached serialization plans.
+                Use when forward references in the type hints resolve after first use.
+        """
+        invalidate_plans(cls)
@@ -10,12 +10,23 @@ import logging
 # Logger Configuration
 logger = logging.getLogger(__name__)
 
-from .helpers import get_dataclass_fields
+from dataclasses import fields
+
+
+def field_names(cls: type) -> tuple[str, ...]:
+    """Return a dataclass type's field names, cached on the class itself."""
+    names = cls.__dict__.get("_field_names")
+    if names is None:
+        names = tuple(f.name for f in fields(cls))
+        setattr(cls, "_field_names", names)
+    return names
 
 
 # DictLikeMixin
 class DictLikeMixin:
     """Enables dictionary-style access for dataclass fields (e.g., obj['field'])."""
+    __slots__ = ()
+
     def __getitem__(self, key: str) -> Any:
         """Retrieve a field value via dict-style access."""
         return getattr(self, key)
@@ -34,12 +45,12 @@ class DictLikeMixin:
 
     def keys(self):
         """Return an iterator over field names."""
-        return (f.name for f in get_dataclass_fields(self))
+        return iter(field_names(self.__class__))
 
     def values(self):
         """Return an iterator over field values."""
-        return (getattr(self, f.name) for f in get_dataclass_fields(self))
+        return (getattr(self, name) for name in field_names(self.__class__))
 
     def items(self):
         """Return an iterator of (field name, value) pairs."""
-        return ((f.name, getattr(self, f.name)) for f in get_dataclass_fields(self))
+        return ((name, getattr(self, name)) for name in field_names(self.__class__))
@@ -1,23 +1,122 @@
 # core/mixin_file.py
 """
 FileMixin for loading and saving dataclass instances to JSON files.
-Extends DictMixin with file read/write support using a standardized header.
+Extends DictMixin with file read/write support using a standardized header,
+including a JSON Lines mode (one header line, then one record per line) for streaming.
+The JSON codec is pluggable per call or per class via `json_codec` (see `core.codecs`).
+Files may be gzip/bz2/lzma/zstd compressed (see `core.compression`); readers detect it.
 """
 
-from typing import Type, TypeVar, TextIO
+from typing import ClassVar, Iterable, Iterator, Optional, Type, TypeVar
 import json
+import re
 from pathlib import Path
 import logging
 
 # Logger Configuration
 logger = logging.getLogger(__name__)
 
+from .codecs import JsonCodec, resolve_codec
+from .compression import Compressor, compressor_for_path, decompress, detect_file, get_compressor, open_decompressed
 from .mixin_dict import DictMixin
+from . import metrics
+from .plans import get_encoder_plan, encode_with_plan, get_decoder_plan, decode_with_plan
 from .types import T
 
+
+def _split_wrapper(content: object) -> tuple[dict, dict]:
+    """Validate a loaded file wrapper and return its (header, data) sections."""
+    if not isinstance(content, dict):
+        raise ValueError("Top-level JSON structure must be a dictionary")
+
+    header = content.get("header")
+    data = content.get("data")
+
+    if not header or not data:
+        raise ValueError("JSON file must contain 'header' and 'data' sections")
+    return header, data
+
+
+def _check_header(header: dict, require_type: str = None) -> None:
+    """Validate a header's `file_type` against an optional required type."""
+    if require_type and header.get("file_type") != require_type:
+        raise ValueError(
+            f"Expected file_type '{require_type}', got '{header.get('file_type')}'"
+        )
+
+
+# Header fast path: record files start with {"header": {...}, ...}, so the header can be
+# parsed from a bounded prefix of the file without touching the data section.
+_HEADER_PREFIX = re.compile(rb'\s*\{\s*"header"\s*:\s*')
+_HEADER_CHUNK = 4096
+_HEADER_DECODER = json.JSONDecoder()
+
+
+def read_header(path: Path | str, require_type: str = None) -> dict:
+    """Read only the header section of a JSON file written by `FileMixin.to_json`.
+            Reads the file in small growing chunks until the header object is complete, so the
+            cost does not depend on the size of the data section. Files whose first key is not
+            "header" (e.g. edited by hand) fall back to a full parse. Compressed files are
+            decompressed as a stream, so only the prefix holding the header is inflated.
+            Args:
+                path (str | Path): File to read.
+                require_type (str | None): Optional type check for header's file_type.
+            Returns:
+                dict: The header dictionary.
+    """
+    path = Path(path)
+    try:
+        with open_decompressed(path) as f:
+            buf = f.read(_HEADER_CHUNK)
+            eof = len(buf) < _HEADER_CHUNK
+            while True:
+                header = _parse_leading_header(buf, eof)
+                if header is not None or eof:
+                    break
+                more = f.read(len(buf))
+                eof = len(more) < len(buf)
+                buf += more
+
+        if header is None:
+            # Not a header-first document; parse it the slow way.
+            header, _ = _split_wrapper(json.loads(buf))
+        if not isinstance(header, dict):
+            raise ValueError("JSON file 'header' section must be a dictionary")
+        _check_header(header, require_type)
+        return header
+
+    except (OSError, EOFError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Error loading JSON file '{path}': {e}")
+
+
+def _parse_leading_header(buf: bytes, eof: bool) -> Optional[object]:
+    """Decode the value of a leading "header" key from a file prefix; None if more input is needed."""
+    match = _HEADER_PREFIX.match(buf)
+    if match is None:
+        return None
+    rest = buf[match.end():]
+    try:
+        text = rest.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # The chunk may end inside a multi-byte character.
+        if eof or e.start < len(rest) - 3:
+            raise
+        text = rest[:e.start].decode("utf-8")
+    try:
+        return _HEADER_DECODER.raw_decode(text)[0]
+    except json.JSONDecodeError:
+        if eof:
+            raise
+        return None
+
+
 # FileMixin
 class FileMixin(DictMixin):
     """Provides JSON serialization/deserialization with header metadata."""
+    __slots__ = ()
+    # Class-wide default codec; None means stdlib json with indent=2.
+    json_codec: ClassVar[Optional[JsonCodec]] = None
+
     def to_json(
         self,
         path: Path | str,
@@ -25,7 +124,10 @@ class FileMixin(DictMixin):
         app_name: str,
         data_version: str,
         file_type: str = None,
-        skip_none: bool = True
+        skip_none: bool = True,
+        codec: JsonCodec = None,
+        compression: str | Compressor = None,
+        compression_level: int = None
     ) -> None:
         """Save the dataclass to a JSON file with header metadata.
                 Args:
@@ -34,9 +136,52 @@ class FileMixin(DictMixin):
                     data_version (str): Version string for data format.
                     file_type (str): Optional file type name override.
                     skip_none (bool): Whether to skip fields with None values.
+                    codec (JsonCodec | None): Codec override (defaults to the class `json_codec`).
+                    compression (str | Compressor | None): "gzip", "bz2", "lzma", "zstd" or "none";
+                        by default inferred from the file extension (`.gz`, `.bz2`, `.xz`, `.zst`).
+                    compression_level (int | None): Compression level (format default if None).
         """
         path = Path(path)
-        wrapper = {
+        compressor = compressor_for_path(path) if compression is None else get_compressor(compression)
+        with metrics.timed("to_json") as span:
+            content = self.to_json_bytes(
+                app_name=app_name, data_version=data_version, file_type=file_type, skip_none=skip_none, codec=codec
+            )
+            if compressor is not None:
+                content = compressor.compress(content, compression_level)
+            with path.open("wb") as f:
+                f.write(content)
+            span.bytes = len(content)
+
+    def to_json_bytes(
+        self,
+        *,
+        app_name: str,
+        data_version: str,
+        file_type: str = None,
+        skip_none: bool = True,
+        codec: JsonCodec = None
+    ) -> bytes:
+        """Serialize the dataclass with header metadata to the bytes `to_json` would write.
+                Args:
+                    app_name (str): Name of the application.
+                    data_version (str): Version string for data format.
+                    file_type (str): Optional file type name override.
+                    skip_none (bool): Whether to skip fields with None values.
+                    codec (JsonCodec | None): Codec override (defaults to the class `json_codec`).
+                Returns:
+                    bytes: UTF-8 encoded JSON document.
+        """
+        with metrics.timed("to_json_bytes") as span:
+            wrapper = self._build_wrapper(app_name, data_version, file_type, skip_none)
+            content = resolve_codec(codec, self).dumps(wrapper)
+            span.bytes = len(content)
+            return content
+
+    def _build_wrapper(self, app_name: str, data_version: str, file_type: str, skip_none: bool) -> dict:
+        """Build the {"header": ..., "data": ...} document for this instance.
+        The header must stay first so `read_header` can stop before the data section."""
+        return {
             "header": {
                 "app_name": app_name,
                 "data_version": data_version,
@@ -45,69 +190,217 @@ class FileMixin(DictMixin):
             "data": self.to_dict(skip_none=skip_none),
         }
 
-        with path.open("w", encoding="utf-8") as f:
-            f_: TextIO = f
-            json.dump(wrapper, f_, indent=2)
-
     @classmethod
-    def from_json(cls: Type[T], path: Path | str, require_type: str = None) -> T:
-        """Load an instance from a JSON file.
+    def from_json(
+        cls: Type[T],
+        path: Path | str,
+        require_type: str = None,
+        codec: JsonCodec = None,
+        only: Optional[Iterable[str]] = None
+    ) -> T:
+        """Load an instance from a JSON file (compressed files are detected and decompressed).
                 Args:
                     path (str | Path): File to load.
                     require_type (str | None): Optional type check for header's file_type.
+                    codec (JsonCodec | None): Codec override; any codec reads any JSON file.
+                    only (Iterable[str] | None): Decode just these fields (see `from_dict`).
                 Returns:
                     An instance of the dataclass.
         """
         path = Path(path)
         try:
-            with path.open("r", encoding="utf-8") as f:
-                content = json.load(f)
+            with metrics.timed("from_json") as span:
+                with path.open("rb") as f:
+                    raw = f.read()
+                span.bytes = len(raw)
+                content = resolve_codec(codec, cls).loads(decompress(raw))
 
-            if not isinstance(content, dict):
-                raise ValueError("Top-level JSON structure must be a dictionary")
+                header, data = _split_wrapper(content)
+                _check_header(header, require_type)
 
-            header = content.get("header")
-            data = content.get("data")
+                return cls.from_dict(data, only=only)
 
-            if not header or not data:
-                raise ValueError("JSON file must contain 'header' and 'data' sections")
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Error loading JSON file '{path}': {e}")
 
-            if require_type and header.get("file_type") != require_type:
-                raise ValueError(
-                    f"Expected file_type '{require_type}', got '{header.get('file_type')}'"
-                )
+    @classmethod
+    def from_json_bytes(
+        cls: Type[T],
+        content: bytes | str,
+        require_type: str = None,
+        codec: JsonCodec = None,
+        only: Optional[Iterable[str]] = None
+    ) -> T:
+        """Load an instance from the bytes of a JSON file (as produced by `to_json_bytes`).
+                Args:
+                    content (bytes | str): Encoded JSON document, optionally compressed.
+                    require_type (str | None): Optional type check for header's file_type.
+                    codec (JsonCodec | None): Codec override; any codec reads any JSON document.
+                    only (Iterable[str] | None): Decode just these fields (see `from_dict`).
+                Returns:
+                    An instance of the dataclass.
+        """
+        try:
+            with metrics.timed("from_json_bytes") as span:
+                span.bytes = len(content)
+                header, data = _split_wrapper(resolve_codec(codec, cls).loads(decompress(content)))
+                _check_header(header, require_type)
+                return cls.from_dict(data, only=only)
 
-            return cls.from_dict(data)
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Error loading JSON content: {e}")
 
-        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
-            raise ValueError(f"Error loading JSON file '{path}': {e}")
+    @classmethod
+    def read_header(cls, path: Path | str, require_type: str = None) -> dict:
+        """Read only the metadata header of a JSON file, without parsing its data.
+                Args:
+                    path (str | Path): File to read.
+                    require_type (str | None): Optional type check for header's file_type.
+                Returns:
+                    dict: The header dictionary.
+        """
+        return read_header(path, require_type)
 
     @classmethod
-    def from_json_with_header(cls: Type[T], path: Path | str, require_type: str = None) -> tuple[T, dict]:
+    def from_json_with_header(
+        cls: Type[T],
+        path: Path | str,
+        require_type: str = None,
+        codec: JsonCodec = None
+    ) -> tuple[T, dict]:
         """Load an instance and its metadata header from a JSON file.
                 Returns:
                     tuple: (dataclass instance, header dictionary)
         """
         path = Path(path)
         try:
-            with path.open("r", encoding="utf-8") as f:
-                content = json.load(f)
+            with path.open("rb") as f:
+                content = resolve_codec(codec, cls).loads(decompress(f.read()))
 
-            if not isinstance(content, dict):
-                raise ValueError("Top-level JSON structure must be a dictionary")
+            header, data = _split_wrapper(content)
+            _check_header(header, require_type)
 
-            header = content.get("header")
-            data = content.get("data")
+            return cls.from_dict(data), header
 
-            if not header or not data:
-                raise ValueError("JSON file must contain 'header' and 'data' sections")
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Error loading JSON file '{path}': {e}")
 
-            if require_type and header.get("file_type") != require_type:
-                raise ValueError(
-                    f"Expected file_type '{require_type}', got '{header.get('file_type')}'"
-                )
+    @classmethod
+    def write_jsonl(
+        cls,
+        path: Path | str,
+        objs: Iterable[T],
+        *,
+        app_name: str,
+        data_version: str,
+        file_type: str = None,
+        skip_none: bool = True,
+        codec: JsonCodec = None,
+        compression: str | Compressor = None,
+        compression_level: int = None
+    ) -> int:
+        """Append instances to a JSON Lines file, writing the header line if the file is new.
+                Records are encoded and written one at a time, so memory use is constant.
+                Appending to an existing file requires its header to match; appends to a compressed
+                file add a new compressed stream in the file's own format.
+                Args:
+                    path (str | Path): Output file path.
+                    objs (Iterable[T]): Instances to write.
+                    app_name (str): Name of the application.
+                    data_version (str): Version string for data format.
+                    file_type (str): Optional file type name override.
+                    skip_none (bool): Whether to skip fields with None values.
+                    codec (JsonCodec | None): Codec override; its compact variant is always used.
+                    compression (str | Compressor | None): "gzip", "bz2", "lzma", "zstd" or "none";
+                        by default inferred from the file extension (`.gz`, `.bz2`, `.xz`, `.zst`).
+                    compression_level (int | None): Compression level (format default if None).
+                Returns:
+                    int: Number of records written.
+        """
+        path = Path(path)
+        compressor = compressor_for_path(path) if compression is None else get_compressor(compression)
+        header = {
+            "app_name": app_name,
+            "data_version": data_version,
+            "file_type": file_type or cls.__name__,
+        }
 
-            return cls.from_dict(data), header
+        if path.exists() and path.stat().st_size > 0:
+            existing = cls._read_jsonl_header(path)
+            if existing != header:
+                raise ValueError(f"Cannot append to '{path}': header {existing} does not match {header}")
+            stored = detect_file(path)
+            stored_name = stored.name if stored else "none"
+            if compression is not None and stored_name != (compressor.name if compressor else "none"):
+                raise ValueError(f"Cannot append to '{path}' with compression '{compression}': it is stored as '{stored_name}'")
+            compressor = get_compressor(stored_name)
+            needs_header = False
+        else:
+            needs_header = True
 
-        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
-            raise ValueError(f"Error loading JSON file '{path}': {e}")
\ No newline at end of file
+        dumps = resolve_codec(codec, cls).as_compact().dumps
+        plan = get_encoder_plan(cls)
+        fast = cls.to_dict is DictMixin.to_dict
+        count = 0
+        with (compressor.open_append(path, compression_level) if compressor else path.open("ab")) as f:
+            if needs_header:
+                f.write(dumps({"header": header}) + b"\n")
+            for obj in objs:
+                if fast and obj.__class__ is cls:
+                    data = encode_with_plan(obj, plan, skip_none)
+                else:
+                    data = obj.to_dict(skip_none=skip_none)
+                f.write(dumps(data) + b"\n")
+                count += 1
+        return count
+
+    @classmethod
+    def iter_jsonl(
+        cls: Type[T],
+        path: Path | str,
+        require_type: str = None,
+        codec: JsonCodec = None
+    ) -> Iterator[T]:
+        """Lazily load instances from a JSON Lines file, one record at a time (compressed files are detected).
+                Args:
+                    path (str | Path): File to read.
+                    require_type (str | None): Optional type check for header's file_type.
+                    codec (JsonCodec | None): Codec override; any codec reads any JSON Lines file.
+                Yields:
+                    T: One instance per record line.
+        """
+        path = Path(path)
+        loads = resolve_codec(codec, cls).loads
+        # The plan shortcut only stands in for the default from_dict, never an override.
+        plan = get_decoder_plan(cls) if cls.from_dict.__func__ is DictMixin.from_dict.__func__ else None
+        try:
+            with open_decompressed(path) as f:
+                header = cls._parse_jsonl_header(f.readline())
+                _check_header(header, require_type)
+                for line_no, line in enumerate(f, start=2):
+                    if not line.strip():
+                        continue
+                    data = loads(line)
+                    if not isinstance(data, dict):
+                        raise ValueError(f"Line {line_no} is not a JSON object")
+                    yield decode_with_plan(cls, data, plan) if plan is not None else cls.from_dict(data)
+
+        except (OSError, EOFError, json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Error loading JSON Lines file '{path}': {e}")
+
+    @classmethod
+    def _read_jsonl_header(cls, path: Path) -> dict:
+        """Read and parse only the header line of a JSON Lines file."""
+        try:
+            with open_decompressed(path) as f:
+                return cls._parse_jsonl_header(f.readline())
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            raise ValueError(f"Error loading JSON Lines file '{path}': {e}")
+
+    @staticmethod
+    def _parse_jsonl_header(line: bytes | str) -> dict:
+        """Parse a JSON Lines header line of the form {"header": {...}}."""
+        content = json.loads(line)
+        if not isinstance(content, dict) or not content.get("header"):
+            raise ValueError("JSON Lines file must start with a 'header' line")
+        return content["header"]
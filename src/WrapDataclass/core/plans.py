@@ -0,0 +1,430 @@
+# core/plans.py
+"""
+Per-class serialization plans for DictMixin.
+
+A plan is built once per dataclass from its field list and type hints, then cached.
+`to_dict` and `from_dict` walk the precomputed plans instead of re-introspecting the
+class and re-resolving every field type on each call. The decoder plan also drives the
+opt-in lazy mode, which defers nested conversion until a field is first read, and
+projections (`from_dict(data, only=...)`), which skip unrequested fields entirely.
+"""
+
+from dataclasses import MISSING, fields, is_dataclass
+from types import UnionType
+from typing import Any, Callable, Iterable, Optional, Union, get_args, get_origin, get_type_hints
+import logging
+
+# Logger Configuration
+logger = logging.getLogger(__name__)
+
+from .helpers import resolve_dataclass_type, is_dataclass_type, is_list_of_dataclass, get_list_inner_type
+
+# Values of these exact types are emitted as-is by `to_dict`.
+_ATOMIC_TYPES = frozenset({str, int, float, bool})
+
+FieldEncoder = Callable[[Any, bool], Any]
+EncoderPlan = tuple[tuple[str, Optional[FieldEncoder]], ...]
+
+# Decoder entries: field name -> (kind, dataclass type). Fields without an entry pass through.
+DECODE_NESTED = 1
+DECODE_LIST = 2
+DecoderPlan = dict[str, tuple[int, type]]
+
+# Binary plan: entries in field order as (field name, nested dataclass type or None, True if list
+# of that type), plus struct codes when every field is a plain float/int/bool (else None).
+BinaryPlan = tuple[tuple[tuple[str, Any, bool], ...], Optional[str]]
+_STRUCT_CODES = {float: "d", int: "q", bool: "?"}
+
+_ENCODER_PLANS: dict[type, EncoderPlan] = {}
+_DECODER_PLANS: dict[type, DecoderPlan] = {}
+_BINARY_PLANS: dict[type, BinaryPlan] = {}
+# Per class: (names of all __init__ fields, names of those without a default).
+_INIT_FIELDS: dict[type, tuple[frozenset, tuple[str, ...]]] = {}
+
+
+def _encode_list(value: list, skip_none: bool) -> list:
+    """Encode a list, serializing dataclass items and optionally dropping None items."""
+    return [
+        item.to_dict(skip_none=skip_none) if is_dataclass(item) else item
+        for item in value
+        if item is not None or not skip_none
+    ]
+
+
+def _encode_value(value: Any, skip_none: bool) -> Any:
+    """Encode a non-None value by inspecting it (the generic, hint-free path)."""
+    if is_dataclass(value):
+        return value.to_dict(skip_none=skip_none)
+    if isinstance(value, list):
+        return _encode_list(value, skip_none)
+    return value
+
+
+def _encode_list_field(value: Any, skip_none: bool) -> Any:
+    """Encoder for fields hinted as lists."""
+    if value.__class__ is list:
+        return _encode_list(value, skip_none)
+    return _encode_value(value, skip_none)
+
+
+def _make_nested_encoder(field_type: type) -> FieldEncoder:
+    """Build an encoder for fields hinted as a single nested dataclass."""
+    def encode_nested(value: Any, skip_none: bool) -> Any:
+        if value.__class__ is field_type:
+            return value.to_dict(skip_none=skip_none)
+        return _encode_value(value, skip_none)
+    return encode_nested
+
+
+def _strip_optional(t: Any) -> Any:
+    """Return the single non-None member of Optional[X] / X | None, or `t` unchanged."""
+    if get_origin(t) in (Union, UnionType):
+        args = [arg for arg in get_args(t) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return t
+
+
+def _field_encoder(hint: Any) -> Optional[FieldEncoder]:
+    """Pick the encoder for a field from its type hint (None means atomic)."""
+    t = _strip_optional(hint)
+    if t in _ATOMIC_TYPES:
+        return None
+    if is_dataclass_type(t):
+        return _make_nested_encoder(t)
+    if t is list or get_origin(t) is list:
+        return _encode_list_field
+    return _encode_value
+
+
+def build_encoder_plan(cls: type) -> EncoderPlan:
+    """Build the `to_dict` plan for a dataclass type.
+
+    Type hints only select fast paths; every encoder falls back to inspecting the
+    value, so the output is identical even when a value does not match its hint.
+    If the hints cannot be resolved yet, every field uses the generic encoder.
+    """
+    try:
+        hints = get_type_hints(cls)
+    except Exception as e:
+        logger.debug(f"Could not resolve type hints for {cls.__name__}, using generic plan: {e}")
+        hints = {}
+
+    return tuple(
+        (f.name, _field_encoder(hints[f.name]) if f.name in hints else _encode_value)
+        for f in fields(cls)
+    )
+
+
+def get_encoder_plan(cls: type) -> EncoderPlan:
+    """Return the cached `to_dict` plan for a dataclass type, building it on first use."""
+    plan = _ENCODER_PLANS.get(cls)
+    if plan is None:
+        plan = _ENCODER_PLANS[cls] = build_encoder_plan(cls)
+    return plan
+
+
+def encode_with_plan(obj: Any, plan: EncoderPlan, skip_none: bool) -> dict:
+    """Serialize a dataclass instance to a dict by running its precomputed plan."""
+    result = {}
+    for name, encoder in plan:
+        value = getattr(obj, name)
+        if value is None:
+            if not skip_none:
+                result[name] = None
+        elif encoder is None:
+            result[name] = value if value.__class__ in _ATOMIC_TYPES else _encode_value(value, skip_none)
+        else:
+            result[name] = encoder(value, skip_none)
+    return result
+
+
+def encode_fields(cls: type, values: dict, skip_none: bool = True) -> dict:
+    """Serialize selected field values of a dataclass type exactly as `to_dict` would.
+
+    None values are kept (as None) so callers can tell cleared fields apart.
+    Raises ValueError for names that are not fields of `cls`.
+    """
+    encoders = dict(get_encoder_plan(cls))
+    unknown = [name for name in values if name not in encoders]
+    if unknown:
+        raise ValueError(f"{cls.__name__} has no field(s) {unknown}")
+
+    result = {}
+    for name, value in values.items():
+        encoder = encoders[name]
+        if value is None:
+            result[name] = None
+        elif encoder is None:
+            result[name] = value if value.__class__ in _ATOMIC_TYPES else _encode_value(value, skip_none)
+        else:
+            result[name] = encoder(value, skip_none)
+    return result
+
+
+def encode_columns(objs: Iterable[Any], plan: EncoderPlan, skip_none: bool) -> dict[str, list]:
+    """Serialize instances into a columnar dict of field name -> list of values.
+
+    Every column keeps one entry per instance (None included) so rows stay aligned;
+    `skip_none` only applies inside nested values.
+    """
+    columns = {name: [] for name, _ in plan}
+    appenders = [(name, columns[name].append, encoder) for name, encoder in plan]
+    for obj in objs:
+        for name, append, encoder in appenders:
+            value = getattr(obj, name)
+            if value is None:
+                append(None)
+            elif encoder is None:
+                append(value if value.__class__ in _ATOMIC_TYPES else _encode_value(value, skip_none))
+            else:
+                append(encoder(value, skip_none))
+    return columns
+
+
+def build_decoder_plan(cls: type) -> DecoderPlan:
+    """Build the `from_dict` plan for a dataclass type.
+
+    Only nested-dataclass and list-of-dataclass fields get an entry; the dispatch
+    rules are the ones `from_dict` has always applied per key.
+    Raises whatever `typing.get_type_hints` raises for unresolvable hints.
+    """
+    plan = {}
+    for key, hint in get_type_hints(cls).items():
+        field_type = resolve_dataclass_type(hint)
+        if is_dataclass_type(field_type):
+            plan[key] = (DECODE_NESTED, field_type)
+        elif is_list_of_dataclass(field_type):
+            plan[key] = (DECODE_LIST, get_list_inner_type(hint))
+    return plan
+
+
+def get_decoder_plan(cls: type) -> DecoderPlan:
+    """Return the cached `from_dict` plan for a dataclass type, building it on first use."""
+    plan = _DECODER_PLANS.get(cls)
+    if plan is None:
+        plan = _DECODER_PLANS[cls] = build_decoder_plan(cls)
+    return plan
+
+
+def decode_with_plan(cls: type, data: dict, plan: DecoderPlan) -> Any:
+    """Construct a dataclass instance from a dict by running its precomputed plan."""
+    if not plan:
+        return cls(**data)
+
+    kwargs = {}
+    for key, val in data.items():
+        entry = plan.get(key)
+        if entry is None:
+            kwargs[key] = val
+            continue
+        kind, sub_type = entry
+        if kind == DECODE_NESTED:
+            kwargs[key] = sub_type.from_dict(val) if isinstance(val, dict) else val
+        elif isinstance(val, list):
+            kwargs[key] = [sub_type.from_dict(i) if isinstance(i, dict) else i for i in val]
+        else:
+            kwargs[key] = val
+    return cls(**kwargs)
+
+
+def get_init_fields(cls: type) -> tuple[frozenset, tuple[str, ...]]:
+    """Return the cached (init field names, required field names) of a dataclass type."""
+    entry = _INIT_FIELDS.get(cls)
+    if entry is None:
+        init = [f for f in fields(cls) if f.init]
+        required = tuple(f.name for f in init if f.default is MISSING and f.default_factory is MISSING)
+        entry = _INIT_FIELDS[cls] = (frozenset(f.name for f in init), required)
+    return entry
+
+
+def project_data(cls: type, data: dict, only: Iterable[str]) -> dict:
+    """Keep only the requested keys of `data` for a projected decode.
+
+    Unrequested fields are left to their defaults; required ones (no default) are set
+    to None so the instance can still be constructed. Raises ValueError for names
+    that are not fields of `cls`.
+    """
+    names, required = get_init_fields(cls)
+    only = frozenset((only,) if isinstance(only, str) else only)
+    unknown = only - names
+    if unknown:
+        raise ValueError(f"{cls.__name__} has no field(s) {sorted(unknown)}")
+
+    projected = {key: val for key, val in data.items() if key in only}
+    for name in required:
+        if name not in only:
+            projected[name] = None
+    return projected
+
+
+class LazyField:
+    """Raw nested value stored on a lazily decoded instance until its first access."""
+    __slots__ = ("kind", "sub_type", "raw")
+
+    def __init__(self, kind: int, sub_type: type, raw: Any):
+        self.kind = kind
+        self.sub_type = sub_type
+        self.raw = raw
+
+    def resolve(self) -> Any:
+        """Build the dataclass value(s), lazily again for their own nested fields."""
+        sub_type = self.sub_type
+        if self.kind == DECODE_NESTED:
+            return sub_type.from_dict(self.raw, lazy=True)
+        return [sub_type.from_dict(i, lazy=True) if isinstance(i, dict) else i for i in self.raw]
+
+
+def _lazy_getattribute(self: Any, name: str) -> Any:
+    """`__getattribute__` of lazy subclasses: resolve and cache a LazyField on first access."""
+    value = object.__getattribute__(self, name)
+    if value.__class__ is not LazyField:
+        return value
+    value = value.resolve()
+    object.__setattr__(self, name, value)
+    _finish_if_resolved(self)
+    return value
+
+
+# The `__class__` slot of `object`, used to switch resolved instances back to the plain class.
+_OBJECT_CLASS = object.__dict__["__class__"]
+
+
+def _plain_class(self: Any) -> type:
+    """`__class__` of lazy instances: report the user's class, so exact-class checks still hold."""
+    return type(self).__bases__[0]
+
+
+def _finish_if_resolved(obj: Any) -> None:
+    """Turn a lazy instance back into its plain class once no LazyField is left."""
+    base = type(obj).__bases__[0]
+    for name in get_decoder_plan(base):
+        if object.__getattribute__(obj, name).__class__ is LazyField:
+            return
+    _OBJECT_CLASS.__set__(obj, base)
+
+
+def _resolve_all(obj: Any) -> Any:
+    """Resolve every pending field of a lazy instance (making it a plain instance)."""
+    lazy_cls = type(obj)
+    if lazy_cls.__getattribute__ is _lazy_getattribute:
+        for name in get_decoder_plan(lazy_cls.__bases__[0]):
+            getattr(obj, name)
+        if type(obj) is lazy_cls:  # nothing was pending
+            _OBJECT_CLASS.__set__(obj, lazy_cls.__bases__[0])
+    return obj
+
+
+def _lazy_eq(self: Any, other: Any) -> Any:
+    _resolve_all(self)
+    _resolve_all(other)
+    return self == other
+
+
+def _lazy_reduce_ex(self: Any, protocol: int) -> Any:
+    return _resolve_all(self).__reduce_ex__(protocol)
+
+
+_LAZY_CLASSES: dict[type, Optional[type]] = {}
+
+
+def get_lazy_class(cls: type) -> Optional[type]:
+    """Return the cached lazy subclass of a class, or None if it cannot be decoded lazily.
+
+    The subclass carries the attribute hook, so the user's class (and every eagerly decoded
+    instance of it) keeps plain `object.__getattribute__`. Lazy instances report the user's
+    class as `__class__` and switch to it for real once all their nested fields have been
+    accessed; equality and pickling resolve them first. Classes with their own
+    `__getattribute__` get None.
+    """
+    try:
+        return _LAZY_CLASSES[cls]
+    except KeyError:
+        pass
+    lazy_cls = None
+    if cls.__getattribute__ is object.__getattribute__:
+        namespace = {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__getattribute__": _lazy_getattribute,
+            "__class__": property(_plain_class),
+            "__eq__": _lazy_eq,
+            "__hash__": cls.__hash__,
+            "__reduce_ex__": _lazy_reduce_ex,
+        }
+        lazy_cls = type(cls)(cls.__name__, (cls,), namespace)
+    _LAZY_CLASSES[cls] = lazy_cls
+    return lazy_cls
+
+
+def decode_lazy(cls: type, data: dict, plan: DecoderPlan) -> Any:
+    """Like `decode_with_plan`, but nested and list-of-dataclass values stay raw until accessed.
+
+    Instances are built as the class's lazy subclass (see `get_lazy_class`) only when
+    at least one field is deferred; everything else decodes to a plain instance.
+    """
+    lazy_cls = get_lazy_class(cls) if plan else None
+    if lazy_cls is None:
+        return decode_with_plan(cls, data, plan)
+
+    kwargs = {}
+    deferred = False
+    for key, val in data.items():
+        entry = plan.get(key)
+        if entry is None:
+            kwargs[key] = val
+            continue
+        kind, sub_type = entry
+        if (kind == DECODE_NESTED and isinstance(val, dict)) or (kind == DECODE_LIST and isinstance(val, list)):
+            kwargs[key] = LazyField(kind, sub_type, val)
+            deferred = True
+        else:
+            kwargs[key] = val
+    return (lazy_cls if deferred else cls)(**kwargs)
+
+
+def build_binary_plan(cls: type) -> BinaryPlan:
+    """Build the field-order plan used by the binary format (see `core.mixin_binary`)."""
+    hints = get_type_hints(cls)
+    entries = []
+    codes = []
+    for f in fields(cls):
+        hint = hints.get(f.name)
+        codes.append(_STRUCT_CODES.get(hint))
+        field_type = resolve_dataclass_type(hint)
+        if is_dataclass_type(field_type):
+            entries.append((f.name, field_type, False))
+        elif is_list_of_dataclass(field_type):
+            entries.append((f.name, get_list_inner_type(hint), True))
+        else:
+            entries.append((f.name, None, False))
+    packed = "".join(codes) if codes and all(codes) else None
+    return tuple(entries), packed
+
+
+def get_binary_plan(cls: type) -> BinaryPlan:
+    """Return the cached binary plan for a dataclass type, building it on first use."""
+    plan = _BINARY_PLANS.get(cls)
+    if plan is None:
+        plan = _BINARY_PLANS[cls] = build_binary_plan(cls)
+    return plan
+
+
+def invalidate_plans(cls: Optional[type] = None) -> None:
+    """Drop cached plans so they are rebuilt on next use.
+
+    Call this for classes whose forward references only resolve after first use.
+    Args:
+        cls (type | None): Class to invalidate. If None, every cached plan is dropped.
+    """
+    if cls is None:
+        _ENCODER_PLANS.clear()
+        _DECODER_PLANS.clear()
+        _BINARY_PLANS.clear()
+        _INIT_FIELDS.clear()
+    else:
+        _ENCODER_PLANS.pop(cls, None)
+        _DECODER_PLANS.pop(cls, None)
+        _BINARY_PLANS.pop(cls, None)
+        _INIT_FIELDS.pop(cls, None)
@@ -13,11 +13,35 @@ logger = logging.getLogger(__name__)
 # logger.addHandler(logging.NullHandler())
 
 from .base_manager import BaseManager
-from .base_record import BaseRecord, AutoIDRecord, FlexibleRecord
+from .async_manager import AsyncManager
+from .base_record import (
+    BaseRecord, AutoIDRecord, FlexibleRecord, SlottedBaseRecord, SlottedAutoIDRecord, SlottedFlexibleRecord
+)
+from .cache import RecordCache
+from .index import ManifestIndex
+from .field_index import FieldIndex
+from .bulk import BatchResult
+from .storage import StorageBackend, DirectoryBackend, migrate_store, reshard_store
+from .sqlite_backend import SQLiteBackend
+from .log_backend import LogBackend
 
 __all__ = [
     "BaseManager",
+    "AsyncManager",
     "BaseRecord",
     "AutoIDRecord",
-    "FlexibleRecord"
+    "FlexibleRecord",
+    "SlottedBaseRecord",
+    "SlottedAutoIDRecord",
+    "SlottedFlexibleRecord",
+    "RecordCache",
+    "ManifestIndex",
+    "FieldIndex",
+    "BatchResult",
+    "StorageBackend",
+    "DirectoryBackend",
+    "SQLiteBackend",
+    "LogBackend",
+    "migrate_store",
+    "reshard_store",
 ]
@@ -0,0 +1,192 @@
+# manager/async_manager.py
+"""
+AsyncManager: asyncio counterpart to BaseManager.
+
+Runs the blocking file I/O and JSON work of a BaseManager on an executor with bounded
+concurrency, so the event loop is never blocked. Concurrent loads of the same record
+are coalesced into a single read.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Generic, Iterable, Optional, Type, TypeVar
+import asyncio
+import copy
+import functools
+import logging
+
+from ..core.base import BaseModel
+from ..core import metrics
+from .base_manager import BaseManager
+
+T = TypeVar("T", bound=BaseModel)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncManager(Generic[T]):
+    """Awaitable save/load/exists/delete/get_or_create over a BaseManager."""
+    def __init__(
+        self,
+        model_type: Type[T],
+        directory: Optional[Path] = None,
+        *,
+        max_concurrency: int = 16,
+        executor: Optional[Executor] = None,
+        **manager_options
+    ):
+        """
+        Initialize the async manager and its underlying BaseManager.
+        Args:
+            model_type (Type[T]): The dataclass type this manager handles.
+            directory (Path | None): The base directory where JSON files are stored
+                (omit when passing `backend=` through `manager_options`).
+            max_concurrency (int): Maximum number of blocking operations in flight at once.
+            executor (Executor | None): Executor to offload to. A private thread pool is created if omitted.
+            **manager_options: Passed through to `BaseManager` (e.g. `cache_size`, `index`, `backend`).
+        """
+        self._init(BaseManager(model_type, directory, **manager_options), max_concurrency, executor, owns_manager=True)
+
+    @classmethod
+    def from_manager(
+        cls,
+        manager: BaseManager[T],
+        *,
+        max_concurrency: int = 16,
+        executor: Optional[Executor] = None
+    ) -> "AsyncManager[T]":
+        """
+        Wrap an existing BaseManager.
+        Args:
+            manager (BaseManager[T]): Manager to delegate to.
+            max_concurrency (int): Maximum number of blocking operations in flight at once.
+            executor (Executor | None): Executor to offload to.
+        Returns:
+            AsyncManager[T]: A manager sharing the given manager's store, cache and index.
+                Closing it leaves the wrapped manager open; the caller still owns it.
+        """
+        self = cls.__new__(cls)
+        self._init(manager, max_concurrency, executor, owns_manager=False)
+        return self
+
+    def _init(self, manager: BaseManager[T], max_concurrency: int, executor: Optional[Executor], owns_manager: bool) -> None:
+        """Set up shared state for both constructors."""
+        self.manager = manager
+        self._owns_manager = owns_manager
+        self.model_type = manager.model_type
+        self.max_concurrency = max_concurrency
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_concurrency)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on the executor, bounded by the concurrency limit."""
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, functools.partial(metrics.bind(func), *args, **kwargs))
+
+    async def save(self, obj: T, name: str = None, *, app_name: str = "", version: str = "") -> None:
+        """Save a dataclass instance (see `BaseManager.save`)."""
+        self._inflight.pop(name or getattr(obj, "id", None), None)
+        await self._run(self.manager.save, obj, name, app_name=app_name, version=version)
+
+    async def save_if_changed(self, obj: T, name: str = None, *, app_name: str = "", version: str = "") -> bool:
+        """Save a dataclass instance only if it differs from the stored record (see `BaseManager.save_if_changed`)."""
+        self._inflight.pop(name or getattr(obj, "id", None), None)
+        return await self._run(self.manager.save_if_changed, obj, name, app_name=app_name, version=version)
+
+    async def load(self, name: str, fields: Optional[Iterable[str]] = None) -> T:
+        """
+        Load a dataclass instance by name (see `BaseManager.load`).
+        Concurrent calls for the same name share one read. Callers that join an
+        in-flight read get their own deep copy when the manager uses copy-on-read.
+        Projected loads (`fields`) are not shared.
+        """
+        if fields is not None:
+            return await self._run(self.manager.load, name, fields)
+
+        task = self._inflight.get(name)
+        joined = task is not None
+        if task is None:
+            task = asyncio.ensure_future(self._run(self.manager.load, name))
+            self._inflight[name] = task
+            task.add_done_callback(functools.partial(self._forget, name))
+
+        obj = await asyncio.shield(task)
+        if joined and self.manager.copy_on_read:
+            return copy.deepcopy(obj)
+        return obj
+
+    def _forget(self, name: str, task: asyncio.Future) -> None:
+        """Drop a finished load from the in-flight table (if it is still the current one)."""
+        if self._inflight.get(name) is task:
+            del self._inflight[name]
+
+    async def exists(self, name: str) -> bool:
+        """Check if a record exists (see `BaseManager.exists`)."""
+        return await self._run(self.manager.exists, name)
+
+    async def delete(self, name: str) -> None:
+        """Delete a record (see `BaseManager.delete`)."""
+        self._inflight.pop(name, None)
+        await self._run(self.manager.delete, name)
+
+    async def update(self, name: str, /, **changes) -> None:
+        """Change individual fields of a stored record (see `BaseManager.update`)."""
+        self._inflight.pop(name, None)
+        await self._run(functools.partial(self.manager.update, name, **changes))
+
+    async def get_or_create(self, obj: T, name: str = None, **save_kwargs) -> T:
+        """Load an existing record or create/save it (see `BaseManager.get_or_create`)."""
+        name = name or obj.id
+        if not await self.exists(name):
+            await self.save(obj, name=name, **save_kwargs)
+        return await self.load(name)
+
+    async def find(self, **criteria) -> list[T]:
+        """Load the records whose fields match all criteria (see `BaseManager.find`)."""
+        return await self._run(functools.partial(self.manager.find, **criteria))
+
+    async def iter_records(self, **criteria) -> AsyncIterator[T]:
+        """
+        Asynchronously iterate over records, prefetching up to `max_concurrency` at a time.
+        Args:
+            **criteria: Header fields to filter by (see `BaseManager.list`).
+        Yields:
+            T: Loaded records in name order.
+        """
+        names = await self.list(**criteria)
+        window = max(1, self.max_concurrency)
+        for start in range(0, len(names), window):
+            batch = await asyncio.gather(*(self.load(name) for name in names[start:start + window]))
+            for obj in batch:
+                yield obj
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.iter_records()
+
+    async def close(self) -> None:
+        """
+        Close the underlying BaseManager if this object created it (flushing write-behind
+        saves and closing the backend), then shut down the private executor, if any.
+        Both run off the event loop.
+        """
+        if self._owns_manager:
+            self._owns_manager = False
+            await self._run(self.manager.close)
+        if self._owns_executor:
+            self._owns_executor = False
+            await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+    async def __aenter__(self) -> "AsyncManager[T]":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    # Kept last: this method shadows the builtin `list` in the class body, so methods
+    # defined after it could not use `list[...]` in their annotations.
+    async def list(self, **criteria) -> list[str]:
+        """List record names (see `BaseManager.list`)."""
+        return await self._run(self.manager.list, **criteria)
@@ -1,95 +1,953 @@
 # manager/base_manager
 """
-BaseManager for managing dataclass records as JSON files on disk.
-Supports save/load/delete operations and automatic directory creation.
+BaseManager for managing dataclass records on a pluggable storage backend.
+By default records are JSON files in a directory (`DirectoryBackend`); other engines
+such as `SQLiteBackend` keep the same save/load/exists/delete/get_or_create API.
+Supports an optional in-memory LRU cache of loaded records, an optional manifest
+index for listing and header queries without opening records, thread-pooled bulk
+operations, transactional batches, an optional write-behind buffer with group commit,
+field-level patches (`update`) journaled next to the record on backends that support it and
+declarable secondary field indexes queried through `find`, and parallel streaming scans
+(`iter_records`) that decode records in worker processes, and transparent compression of
+records above a size threshold (`compression`).
+Record files are always replaced atomically (temp file + `os.replace`).
 """
 
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Type, TypeVar, Generic
-import logging
+from typing import Any, Callable, Iterable, Iterator, Optional, Type, TypeVar, Generic
+import functools
+import copy
+import hashlib
 import json
+import threading
+import logging
 from ..core.base import BaseModel
+from ..core.codecs import JsonCodec, get_codec, resolve_codec
+from ..core.compression import Compressor, decompress, get_compressor
+from ..core.mixin_file import _split_wrapper, _check_header
+from ..core.plans import encode_fields
+from ..core import metrics
+from ..core.mixin_dictlike import field_names
+from .cache import RecordCache
+from .index import ManifestIndex, MANIFEST_FILENAME
+from .bulk import BatchResult, run_batch
+from .storage import StorageBackend, DirectoryBackend, RecordStat
+from .patches import encode_patch, apply_patches
+from .field_index import FieldIndex, FIELD_INDEX_FILENAME, parse_criterion, matches
+from .scan import scan_record_files, chunked, decode_files, decode_payloads, run_chunks
 
 T = TypeVar("T", bound=BaseModel)
 
+# How many times `_read` re-reads a record that is replaced while it is being read.
+_READ_ATTEMPTS = 3
+
 logger = logging.getLogger(__name__)
 
 class BaseManager(Generic[T]):
-    """Handles file-based persistence for dataclass instances using JSON files."""
-    def __init__(self, model_type: Type[T], directory: Path):
+    """Handles persistence for dataclass instances on a storage backend (JSON files by default)."""
+    def __init__(
+        self,
+        model_type: Type[T],
+        directory: Optional[Path] = None,
+        *,
+        backend: Optional[StorageBackend] = None,
+        shard_levels: Optional[int] = None,
+        cache_size: int = 0,
+        cache_bytes: Optional[int] = None,
+        copy_on_read: bool = True,
+        index: bool = False,
+        index_hash: bool = False,
+        max_workers: int = 8,
+        max_open_files: int = 64,
+        write_behind: bool = False,
+        flush_interval: float = 1.0,
+        max_batch: int = 256,
+        fsync: bool = True,
+        codec: JsonCodec | str | None = None,
+        compact: bool = False,
+        skip_unchanged: bool = False,
+        digest_cache_size: int = 10_000,
+        patch_compact_ratio: float = 0.5,
+        field_indexes: Optional[dict[str, str]] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        compress_threshold: int = 1024
+    ):
         """
         Initialize the manager for a specific dataclass type.
         Args:
             model_type (Type[T]): The dataclass type this manager handles.
-            directory (Path): The base directory where JSON files are stored.
+            directory (Path | None): The base directory where JSON files are stored.
+                Required unless `backend` is given.
+            backend (StorageBackend | None): Storage engine to use instead of a `DirectoryBackend`,
+                e.g. `SQLiteBackend("records.db")`.
+            shard_levels (int | None): Spread record files over this many levels of hash-prefix
+                subdirectories (e.g. 2 -> `ab/cd/{name}.json`). None keeps the layout already recorded
+                in `directory` (flat by default); use `reshard_store` to convert an existing store.
+            cache_size (int): Maximum number of loaded records kept in memory (0 disables the cache
+                unless `cache_bytes` is set).
+            cache_bytes (int | None): Maximum approximate size of cached records, measured by stored size.
+            copy_on_read (bool): If True, `load` returns a deep copy of the cached record so callers
+                can mutate it freely. If False, cached instances are shared between callers.
+            index (bool): Maintain a manifest of record headers, sizes and mtimes on `save`/`delete`.
+            index_hash (bool): Also store a SHA-256 content hash of each record in the manifest.
+            max_workers (int): Thread pool size for `save_many` / `load_many`.
+            max_open_files (int): Maximum number of record files bulk operations keep open at once.
+            write_behind (bool): Buffer saves in memory and write them in groups. Repeated saves of the
+                same name are coalesced; `load`/`exists` see buffered records, while `list`/`count`
+                see them once flushed. Call `flush()` or `close()` (or use the manager as a context
+                manager) to guarantee durability.
+            flush_interval (float): Seconds between background flushes in write-behind mode (0 disables
+                the background thread; flushing then happens on `max_batch` or explicit `flush()`).
+            max_batch (int): Number of buffered records that triggers an immediate flush.
+            fsync (bool): fsync the files of each write-behind group and their directory once per group.
+            codec (JsonCodec | str | None): JSON codec or backend name ("json", "orjson", "ujson", "auto").
+                Defaults to the model's `json_codec`.
+            compact (bool): Write records without indentation.
+            skip_unchanged (bool): Make `save` skip records whose serialized form (header included)
+                is byte-identical to what is already stored (see `save_if_changed`).
+            digest_cache_size (int): Number of record digests remembered (LRU) so unchanged checks can
+                skip reading the stored record. With `index_hash`, the manifest's hashes are used instead.
+            patch_compact_ratio (float): Fold a record's delta journal into the record once the
+                journal exceeds this fraction of the record's size (see `update`).
+            field_indexes (dict[str, str] | None): Model fields to index for `find`, each mapped to
+                "hash" (equality/membership) or "sorted" (also ranges), e.g. {"status": "hash", "rank": "sorted"}.
+                Indexed fields must hold plain values (str, int, float, bool or None). The index is
+                persisted next to the store and built from the records when first enabled.
+            compression (str | None): Compress stored records with "gzip", "bz2", "lzma" or "zstd"
+                (zstd needs Python 3.14+ or the `zstandard` package). Loading detects compression
+                per record, so stores may mix compressed and plain records.
+            compression_level (int | None): Compression level (the format's default if None).
+            compress_threshold (int): Records whose serialized size is below this many bytes are
+                stored uncompressed, where compression costs more CPU than it saves space.
         """
+        if backend is None:
+            if directory is None:
+                raise ValueError("Either a directory or a storage backend must be provided.")
+            backend = DirectoryBackend(directory, shard_levels)
         self.model_type = model_type
-        self.directory = Path(directory)
-        self.directory.mkdir(parents=True, exist_ok=True)
+        self.backend = backend
+        self.directory: Optional[Path] = getattr(backend, "directory", None)
+        self.codec: Optional[JsonCodec] = get_codec(codec, compact) if codec is not None or compact else None
+        self.compressor: Optional[Compressor] = get_compressor(compression)
+        self.compression_level = compression_level
+        self.compress_threshold = compress_threshold
+        self.copy_on_read = copy_on_read
+        self.cache: Optional[RecordCache] = None
+        if cache_size or cache_bytes:
+            self.cache = RecordCache(max_entries=cache_size or None, max_bytes=cache_bytes)
+        self.index_hash = index_hash
+        self.index: Optional[ManifestIndex] = None
+        if index:
+            self.index = ManifestIndex(backend.meta_path(MANIFEST_FILENAME))
+        self.max_workers = max_workers
+        self._file_limiter = threading.BoundedSemaphore(max_open_files)
+        # Striped per-record locks: update, patch compaction, direct saves and deletes of one name
+        # are serialized, so compaction cannot drop a patch appended while it rewrites the record.
+        self._record_locks = tuple(threading.RLock() for _ in range(64))
+        self._batch_state = threading.local()
+        self.skip_unchanged = skip_unchanged
+        self.patch_compact_ratio = patch_compact_ratio
+        # name -> SHA-256 of the stored payload, tagged with the record's (mtime_ns, size)
+        self._digests = RecordCache(max_entries=digest_cache_size)
+
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.fsync = fsync
+        # name -> (payload, header, indexed field values or None)
+        self._pending: dict[str, tuple[bytes, dict, Optional[dict]]] = {}
+        self._flushing: dict[str, tuple[bytes, dict, Optional[dict]]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop_flusher = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if write_behind and flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name=f"WrapManagerFlush-{backend!r}", daemon=True
+            )
+            self._flusher.start()
+
+        self.field_index: Optional[FieldIndex] = None
+        if field_indexes:
+            unknown = [f for f in field_indexes if f not in field_names(model_type)]
+            if unknown:
+                raise ValueError(f"{model_type.__name__} has no field(s) {unknown} to index")
+            self.field_index = FieldIndex(backend.meta_path(FIELD_INDEX_FILENAME), field_indexes)
+            if not self.field_index.complete:
+                self.rebuild_field_indexes()
 
     def save(self, obj: T, name: str = None, *, app_name: str = "", version: str = "") -> None:
         """
-        Save a dataclass instance to a JSON file.
+        Save a dataclass instance to the store.
+        With `skip_unchanged` enabled, an object identical to the stored record is not rewritten.
         Args:
             obj (T): The object to save.
-            name (str): Optional override for the filename (defaults to `obj.id`).
+            name (str): Optional override for the record name (defaults to `obj.id`).
             app_name (str): Application name to include in file header.
             version (str): Version string to include in file header.
         """
+        with metrics.timed("manager.save"):
+            self._save(obj, name, app_name, version, self.skip_unchanged)
+
+    def save_if_changed(self, obj: T, name: str = None, *, app_name: str = "", version: str = "") -> bool:
+        """
+        Save a dataclass instance only if it differs from the stored record.
+        The comparison is on the serialized record (header included), against a digest remembered
+        from this manager's last write while the stored record's mtime and size are unchanged,
+        otherwise against the stored bytes.
+        Args:
+            obj (T): The object to save.
+            name (str): Optional override for the record name (defaults to `obj.id`).
+            app_name (str): Application name to include in file header.
+            version (str): Version string to include in file header.
+        Returns:
+            bool: True if the record was written (or queued), False if it was unchanged.
+        """
+        with metrics.timed("manager.save"):
+            return self._save(obj, name, app_name, version, True)
+
+    def _save(self, obj: T, name: Optional[str], app_name: str, version: str, only_changed: bool) -> bool:
+        """Serialize and store a record; returns False if skipped as unchanged."""
         name = name or getattr(obj, "id", None)
         if not name:
             raise ValueError("Object must have an 'id' or you must provide a name.")
 
-        path = self.directory / f"{name}.json"
-        obj.to_json(
-            path,
-            app_name=app_name or "WrapManager",
-            data_version=version or "1.0",
-            file_type=obj.__class__.__name__,
+        header = {
+            "app_name": app_name or "WrapManager",
+            "data_version": version or "1.0",
+            "file_type": obj.__class__.__name__,
+        }
+        payload = obj.to_json_bytes(**header, codec=self.codec)
+        if self.compressor is not None and len(payload) >= self.compress_threshold:
+            payload = self.compressor.compress(payload, self.compression_level)
+        if metrics.ACTIVE:
+            metrics.add_bytes(len(payload))
+        # Computed before writing so an unindexable value fails the save, not the index update.
+        fields = self._field_entry(obj) if self.field_index is not None else None
+
+        batch = getattr(self._batch_state, "items", None)
+        if only_changed and self._unchanged(name, payload, batch):
+            return False
+        if batch is not None:
+            batch[name] = (payload, header, fields)
+            return True
+        if self.write_behind:
+            self._buffer(name, payload, header, fields)
+            return True
+
+        with self._record_lock(name):
+            self.backend.write(name, payload, header)
+            self._after_write(name, header, payload, obj, fields, track_digest=only_changed)
+        return True
+
+    def _record_lock(self, name: str) -> threading.RLock:
+        """Return the lock serializing writers of one record name (within this manager)."""
+        return self._record_locks[hash(name) % len(self._record_locks)]
+
+    def _field_entry(self, obj: Any) -> dict:
+        """Return the serialized values of the indexed fields of an object."""
+        values = {field: getattr(obj, field, None) for field in self.field_index.fields}
+        return self.field_index.entry_for(encode_fields(self.model_type, values))
+
+    def _unchanged(self, name: str, payload: bytes, batch: Optional[dict]) -> bool:
+        """Check whether `payload` equals the newest stored, queued or batched version of a record."""
+        pending = (batch or {}).get(name) or (self._buffered(name) if self.write_behind else None)
+        if pending is not None:
+            return pending[0] == payload
+
+        st = self.backend.stat(name)
+        if st is None or st.size != len(payload):
+            return False
+        if self.backend.supports_deltas and self.backend.delta_stat(name) is not None:
+            return False
+        if self.index is not None and self.index_hash:
+            entry = self.index.get(name)
+            if entry and entry.get("hash") and entry.get("size") == st.size and entry.get("mtime_ns") == st.mtime_ns:
+                return entry["hash"] == hashlib.sha256(payload).hexdigest()
+        token = (st.mtime_ns, st.size)
+        known = self._digests.get(name, token)
+        if known is not None:
+            return known == hashlib.sha256(payload).digest()
+
+        try:
+            stored = self.backend.read(name)
+        except ValueError:
+            return False
+        if stored != payload:
+            return False
+        self._digests.put(name, hashlib.sha256(payload).digest(), token)
+        return True
+
+    def _after_write(
+        self, name: str, header: dict, payload: bytes, obj: Optional[T] = None, fields: Optional[dict] = None,
+        track_digest: bool = False
+    ) -> None:
+        """Update the cache, manifest, digests and field indexes after a record was written.
+        Without `obj` (or in copy-on-read mode) the cache entry is evicted instead of refreshed.
+        The payload digest is remembered for `skip_unchanged` managers and `save_if_changed` writes
+        (unless the manifest keeps hashes); otherwise any remembered digest is dropped."""
+        if self.field_index is not None and fields is not None:
+            self.field_index.record(name, fields)
+        track_digest = (track_digest or self.skip_unchanged) and not (self.index is not None and self.index_hash)
+        if not track_digest:
+            self._digests.evict(name)
+        if self.cache is None and self.index is None and not track_digest:
+            return
+        st = self.backend.stat(name)
+        if st is None:
+            return
+        if track_digest:
+            self._digests.put(name, hashlib.sha256(payload).digest(), (st.mtime_ns, st.size))
+        if self.cache is not None:
+            if self.copy_on_read or obj is None:
+                self.cache.evict(name)
+            else:
+                self.cache.put(name, obj, (st.mtime_ns, st.size), st.size)
+        if self.index is not None:
+            self.index.record(name, self._index_entry(header, st, payload))
+
+    @contextmanager
+    def batch(self):
+        """
+        Collect the saves made by this thread inside the block and write them as one group on exit:
+        a single transaction on SQLite, a group commit on directory stores.
+        Nothing is written if the block raises. Nested blocks join the outer one.
+        """
+        if getattr(self._batch_state, "items", None) is not None:
+            yield self
+            return
+
+        self._batch_state.items = {}
+        try:
+            yield self
+            items = self._batch_state.items
+        finally:
+            self._batch_state.items = None
+        if items:
+            self._write_group(items)
+
+    def _write_group(self, items: dict[str, tuple[bytes, dict, Optional[dict]]]) -> None:
+        """Write {name: (payload, header, fields)} as one group and update the cache/manifest."""
+        self.backend.write_many(
+            ((name, payload, header) for name, (payload, header, _) in items.items()), fsync=self.fsync
         )
+        for name, (payload, header, fields) in items.items():
+            self._after_write(name, header, payload, fields=fields)
+
+    def _buffer(self, name: str, payload: bytes, header: dict, fields: Optional[dict] = None) -> None:
+        """Queue a serialized record for the next group commit, replacing any queued version."""
+        with self._pending_lock:
+            self._pending[name] = (payload, header, fields)
+            full = len(self._pending) >= self.max_batch
+        if self.cache is not None:
+            self.cache.evict(name)
+        if full:
+            self.flush()
+
+    def _buffered(self, name: str) -> Optional[tuple[bytes, dict, Optional[dict]]]:
+        """Return the queued or in-flight (payload, header, fields) for a record, if any."""
+        with self._pending_lock:
+            return self._pending.get(name) or self._flushing.get(name)
+
+    def flush(self) -> int:
+        """
+        Write all buffered records as one group commit.
+        On directory stores each record is staged to a temporary file and moved into place with
+        `os.replace`, and with `fsync` enabled the directory is fsynced once for the whole group;
+        on SQLite the group is one transaction.
+        Returns:
+            int: Number of records written.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = self._pending, {}
+                self._flushing = batch
+
+            try:
+                with metrics.timed("manager.flush", records=len(batch)) as span:
+                    span.bytes = sum(len(payload) for payload, _, _ in batch.values())
+                    self.backend.write_many(
+                        ((name, payload, header) for name, (payload, header, _) in batch.items()), fsync=self.fsync
+                    )
+            except Exception:
+                with self._pending_lock:
+                    for name, item in batch.items():
+                        self._pending.setdefault(name, item)
+                    self._flushing = {}
+                raise
 
-    def load(self, name: str) -> T:
+            with self._pending_lock:
+                self._flushing = {}
+            for name, (payload, header, fields) in batch.items():
+                self._after_write(name, header, payload, fields=fields)
+            return len(batch)
+
+    def _flush_loop(self) -> None:
+        """Background thread body: flush every `flush_interval` seconds until closed."""
+        while not self._stop_flusher.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind flush failed for {self.backend!r}: {e}")
+
+    def close(self) -> None:
+        """Stop the background flusher, write any buffered records and close the backend."""
+        self._stop_flusher.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+        self.backend.close()
+
+    def __enter__(self) -> "BaseManager[T]":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def load(self, name: str, fields: Optional[Iterable[str]] = None) -> T:
         """
-        Load a dataclass instance from a JSON file by name.
+        Load a dataclass instance by name.
+        Patches journaled by `update` are folded in. When the cache is enabled, a cached
+        record is reused as long as the stored record's (and its journal's) mtime and size are unchanged.
         Args:
-            name (str): Name of the file (without extension).
+            name (str): Name of the record (file name without extension).
+            fields (Iterable[str] | None): Decode just these fields (see `from_dict(only=...)`),
+                plus `id` if the model has one; the others keep their defaults. Projected loads
+                bypass the cache and must not be saved back over the full record.
         Returns:
             T: An instance of the managed dataclass.
         """
-        path = self.directory / f"{name}.json"
-        return self.model_type.from_json(path, require_type=self.model_type.__name__)
+        with metrics.timed("manager.load"):
+            return self._load(name, fields)
+
+    def _load(self, name: str, fields: Optional[Iterable[str]]) -> T:
+        """Load a record (or a projection of it) from the write-behind buffer, the cache or the backend."""
+        if fields is not None:
+            fields = {fields} if isinstance(fields, str) else set(fields)
+            if "id" in field_names(self.model_type):
+                fields.add("id")
+
+        if self.write_behind:
+            buffered = self._buffered(name)
+            if buffered is not None:
+                return self._decode(name, buffered[0], fields)
+
+        if self.cache is None or fields is not None:
+            return self._read(name, only=fields)
+
+        st = self.backend.stat(name)
+        if st is None:
+            self.cache.evict(name)
+            return self._read(name)
+
+        token = (st.mtime_ns, st.size)
+        size = st.size
+        if self.backend.supports_deltas:
+            delta_st = self.backend.delta_stat(name)
+            if delta_st is not None:
+                token += (delta_st.mtime_ns, delta_st.size)
+                size += delta_st.size
+        obj = self.cache.get(name, token)
+        if obj is None:
+            obj = self._read(name, st)
+            self.cache.put(name, obj, token, size)
+        return copy.deepcopy(obj) if self.copy_on_read else obj
+
+    def _read(self, name: str, st: Optional[RecordStat] = None, only: Optional[Iterable[str]] = None) -> T:
+        """Read and decode a stored record (or a projection of it), folding in any journaled patches.
+        The record is stat'ed before it is read, so patches are matched against the base that was
+        actually read; if the record is replaced meanwhile, the read is retried."""
+        if not self.backend.supports_deltas:
+            return self._decode(name, self._read_payload(name), only)
+
+        for _ in range(_READ_ATTEMPTS):
+            base = st if st is not None else self.backend.stat(name)
+            payload = self._read_payload(name)
+            patches = self.backend.read_deltas(name)
+            if not patches:
+                return self._decode(name, payload, only)
+            st = self.backend.stat(name)
+            if st == base:
+                break
+        else:
+            logger.warning(f"Record '{name}' kept changing while being read; using the last read")
+
+        codec = resolve_codec(self.codec, self.model_type)
+        try:
+            header, data = _split_wrapper(codec.loads(decompress(payload)))
+            _check_header(header, self.model_type.__name__)
+            apply_patches(data, patches, base, codec)
+            return self.model_type.from_dict(data, only=only)
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Error loading record '{name}': {e}")
+
+    def _read_payload(self, name: str) -> bytes:
+        """Read a record's stored bytes, counting them when metrics are on."""
+        payload = self.backend.read(name)
+        if metrics.ACTIVE:
+            metrics.add_bytes(len(payload))
+        return payload
+
+    def _decode(self, name: str, payload: bytes, only: Optional[Iterable[str]] = None) -> T:
+        """Decode a stored record payload into the managed model type."""
+        try:
+            return self.model_type.from_json_bytes(
+                payload, require_type=self.model_type.__name__, codec=self.codec, only=only
+            )
+        except ValueError as e:
+            raise ValueError(f"Error loading record '{name}': {e}")
+
+    def update(self, name: str, /, **changes) -> None:
+        """
+        Change individual fields of a stored record without rewriting it.
+        On backends with delta journals (directory stores) the changes are appended as one small
+        patch and folded in on load; the record is rewritten once its journal exceeds
+        `patch_compact_ratio` of its size. Other backends, and records with a queued
+        write-behind or batch version, are loaded, changed and saved in full.
+        Setting a field to None clears it, as a save with skip_none would.
+        Updates, compaction, saves and deletes of the same record made through this manager
+        (from any of its threads) are serialized; other managers or processes are not coordinated.
+        Args:
+            name (str): Name of the record.
+            **changes: Field names and their new values.
+        """
+        with metrics.timed("manager.update"), self._record_lock(name):
+            self._update(name, changes)
+
+    def _update(self, name: str, changes: dict) -> None:
+        """Apply field changes as a journaled patch, or by rewriting the record."""
+        if not changes:
+            return
+        fields = encode_fields(self.model_type, changes)
+        entry = None
+        if self.field_index is not None and any(f in self.field_index.fields for f in changes):
+            entry = self.field_index.entry_for({**(self.field_index.get(name) or {}), **fields})
+
+        batch = getattr(self._batch_state, "items", None)
+        pending = (batch or {}).get(name) or (self._buffered(name) if self.write_behind else None)
+        if not self.backend.supports_deltas or pending is not None:
+            self._rewrite(name, changes, pending)
+            return
+
+        st = self.backend.stat(name)
+        if st is None:
+            raise ValueError(f"Cannot update missing record '{name}'")
+        codec = resolve_codec(self.codec, self.model_type)
+        journal_size = self.backend.append_delta(name, encode_patch(st, fields, codec))
+        self._digests.evict(name)
+        if entry is not None:
+            self.field_index.record(name, entry)
+        if self.cache is not None:
+            self.cache.evict(name)
+        if journal_size > st.size * self.patch_compact_ratio:
+            self.compact_patches(name)
+
+    def _rewrite(self, name: str, changes: dict, pending: Optional[tuple] = None) -> None:
+        """Apply field changes by loading and saving the whole record (or its queued version)."""
+        if pending is not None:
+            obj, header = self._decode(name, pending[0]), pending[1]
+        else:
+            obj, header = self.load(name), self.backend.header(name) or {}
+        for field_name, value in changes.items():
+            setattr(obj, field_name, value)
+        self.save(obj, name, app_name=header.get("app_name", ""), version=header.get("data_version", ""))
+
+    def compact_patches(self, name: str = None) -> int:
+        """
+        Fold delta journals into their records by rewriting them.
+        Args:
+            name (str | None): Record to compact; all records with a journal if omitted.
+        Returns:
+            int: Number of records rewritten.
+        """
+        if not self.backend.supports_deltas:
+            return 0
+        names = [name] if name is not None else sorted(self.backend.names())
+        compacted = 0
+        for record in names:
+            with self._record_lock(record):
+                if self.backend.delta_stat(record) is None:
+                    continue
+                self._rewrite(record, {})
+            compacted += 1
+        return compacted
+
+    def cache_stats(self) -> dict:
+        """
+        Return cache hit/miss counters.
+        Returns:
+            dict: Counters from the record cache (empty if the cache is disabled).
+        """
+        return self.cache.stats() if self.cache is not None else {}
 
     def exists(self, name: str) -> bool:
         """
-        Check if a record file exists.
+        Check if a record exists.
         Args:
-            name (str): Name of the file (without extension).
+            name (str): Name of the record (file name without extension).
         Returns:
-            bool: True if file exists, False otherwise.
+            bool: True if the record exists, False otherwise.
         """
-        return (self.directory / f"{name}.json").exists()
+        if self.write_behind and self._buffered(name) is not None:
+            return True
+        return self.backend.exists(name)
 
     def delete(self, name: str) -> None:
         """
-        Delete a record file.
+        Delete a record.
         Args:
-            name (str): Name of the file (without extension).
+            name (str): Name of the record (file name without extension).
         """
-        path = self.directory / f"{name}.json"
-        if path.exists():
-            path.unlink()
+        with metrics.timed("manager.delete"), self._record_lock(name):
+            if self.write_behind:
+                # Serialize with flush() so an in-flight group cannot resurrect the record.
+                with self._flush_lock:
+                    with self._pending_lock:
+                        self._pending.pop(name, None)
+                    self._delete_record(name)
+            else:
+                self._delete_record(name)
+
+    def _delete_record(self, name: str) -> None:
+        """Remove a record and its cache/manifest entries."""
+        self._digests.evict(name)
+        if self.cache is not None:
+            self.cache.evict(name)
+        if self.index is not None:
+            self.index.remove(name)
+        if self.field_index is not None:
+            self.field_index.remove(name)
+        self.backend.delete(name)
 
     def get_or_create(self, obj: T, name: str = None, **save_kwargs) -> T:
         """
         Load an existing record or create/save it if it doesn't exist.
         Args:
-            obj (T): The object to save if no file is found.
-            name (str): Optional override for the filename.
+            obj (T): The object to save if no record is found.
+            name (str): Optional override for the record name.
             **save_kwargs: Additional keyword arguments passed to `save`.
         Returns:
             T: The loaded or newly saved object.
         """
-        path = self.directory / f"{name or obj.id}.json"
-        if not path.exists():
+        if not self.exists(name or obj.id):
             self.save(obj, name=name, **save_kwargs)
         return self.load(name or obj.id)
+
+    def save_many(
+        self,
+        objs: Iterable[T],
+        *,
+        app_name: str = "",
+        version: str = "",
+        executor: Optional[Executor] = None
+    ) -> list[BatchResult]:
+        """
+        Save many objects concurrently, named by their `id`.
+        A failure is reported in that item's result and does not stop the batch.
+        Args:
+            objs (Iterable[T]): Objects to save.
+            app_name (str): Application name to include in file headers.
+            version (str): Version string to include in file headers.
+            executor (Executor | None): Executor to run on instead of a temporary thread pool.
+        Returns:
+            list[BatchResult]: One result per object, in input order.
+        """
+        def save_one(obj: T):
+            self.save(obj, app_name=app_name, version=version)
+            return obj.id, obj
+
+        with metrics.timed("manager.save_many") as span:
+            results = run_batch(
+                save_one, objs, max_workers=self.max_workers, limiter=self._file_limiter, executor=executor
+            )
+            span.records = len(results)
+            return results
+
+    def load_many(self, names: Iterable[str], *, executor: Optional[Executor] = None) -> list[BatchResult]:
+        """
+        Load many records concurrently.
+        A failure is reported in that item's result and does not stop the batch.
+        Args:
+            names (Iterable[str]): Names of the records.
+            executor (Executor | None): Executor to run on instead of a temporary thread pool.
+        Returns:
+            list[BatchResult]: One result per name, in input order; `value` holds the loaded object.
+        """
+        def load_one(name: str):
+            return name, self.load(name)
+
+        with metrics.timed("manager.load_many") as span:
+            results = run_batch(
+                load_one, names, max_workers=self.max_workers, limiter=self._file_limiter, executor=executor
+            )
+            span.records = len(results)
+            return results
+
+    def find(self, **criteria) -> list[T]:
+        """
+        Load the records whose fields match all criteria, in name order.
+        Criteria are `field=value` or `field__op=value` with op one of eq, in, gt, gte, lt, lte
+        (e.g. `find(status="published", rank__gte=3)`). Indexed fields narrow the candidates
+        before anything is loaded; the remaining criteria are checked on the loaded records.
+        Without any indexed criterion every record is loaded. Write-behind saves are found
+        once flushed, as with `list`.
+        Args:
+            **criteria: Field criteria that must all match.
+        Returns:
+            list[T]: Matching records.
+        """
+        with metrics.timed("manager.find") as span:
+            results = [obj for _, obj in self._find(criteria)]
+            span.records = len(results)
+            return results
+
+    def find_names(self, **criteria) -> list[str]:
+        """
+        Return the sorted names of records whose fields match all criteria (see `find`).
+        Answered from the field indexes alone when every criterion is on an indexed field.
+        Args:
+            **criteria: Field criteria that must all match.
+        Returns:
+            list[str]: Matching record names.
+        """
+        parsed = self._parse_criteria(criteria)
+        if parsed and self.field_index is not None and all(f in self.field_index.fields for f, _, _ in parsed):
+            return sorted(self._candidates(parsed))
+        return [name for name, _ in self._find(criteria)]
+
+    def _parse_criteria(self, criteria: dict) -> list[tuple[str, str, Any]]:
+        """Split `field__op=value` criteria into (field, op, value), checking the field names."""
+        parsed = [parse_criterion(key) + (value,) for key, value in criteria.items()]
+        unknown = [field for field, _, _ in parsed if field not in field_names(self.model_type)]
+        if unknown:
+            raise ValueError(f"{self.model_type.__name__} has no field(s) {unknown}")
+        return parsed
+
+    def _candidates(self, parsed: list[tuple[str, str, Any]]) -> Optional[set[str]]:
+        """Intersect the index lookups of the indexed criteria (None if no criterion is indexed)."""
+        names = None
+        for field, op, value in parsed:
+            if self.field_index is None or field not in self.field_index.fields:
+                continue
+            found = self.field_index.lookup(field, op, value)
+            names = found if names is None else names & found
+            if not names:
+                break
+        return names
+
+    def _find(self, criteria: dict) -> Iterator[tuple[str, T]]:
+        """Yield (name, record) for the records matching the criteria, in name order."""
+        parsed = self._parse_criteria(criteria)
+        candidates = self._candidates(parsed)
+        names = sorted(candidates) if candidates is not None else self.list()
+        for name in names:
+            try:
+                obj = self.load(name)
+            except ValueError:
+                # Deleted or rewritten outside this manager since it was indexed.
+                logger.warning(f"Skipping unreadable record '{name}' in find")
+                continue
+            # Re-check every criterion so a stale index can never return a wrong record.
+            if all(matches(getattr(obj, field, None), op, value) for field, op, value in parsed):
+                yield name, obj
+
+    def rebuild_field_indexes(self) -> int:
+        """
+        Rebuild the field indexes by loading every record in the store.
+        Runs automatically when indexes are first enabled (or their field set changes);
+        call it after records were added, edited or removed outside this manager.
+        Returns:
+            int: Number of records indexed.
+        """
+        if self.field_index is None:
+            raise ValueError("No field indexes are configured for this manager.")
+        entries = {}
+        for name in self.backend.names():
+            try:
+                entries[name] = self._field_entry(self._read(name))
+            except ValueError as e:
+                logger.warning(f"Skipping record '{name}' while rebuilding field indexes: {e}")
+        self.field_index.replace_all(entries)
+        logger.info(f"Indexed {len(entries)} record(s) on fields {list(self.field_index.fields)}")
+        return len(entries)
+
+    def iter_all(
+        self,
+        *,
+        processes: Optional[int] = None,
+        chunk_size: int = 64,
+        executor: Optional[Executor] = None
+    ) -> Iterator[T]:
+        """
+        Stream every record in the store, decoded in parallel (see `iter_records`).
+        Args:
+            processes (int | None): Worker processes (None = CPU count, 0 or 1 = decode in this process).
+            chunk_size (int): Records per worker task.
+            executor (Executor | None): Executor to run on instead of a temporary process pool.
+        Returns:
+            Iterator[T]: Every readable record.
+        """
+        return self.iter_records(processes=processes, chunk_size=chunk_size, executor=executor)
+
+    def iter_records(
+        self,
+        filter: Optional[Callable[[T], bool]] = None,
+        *,
+        processes: Optional[int] = None,
+        chunk_size: int = 64,
+        max_in_flight: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        **criteria
+    ) -> Iterator[T]:
+        """
+        Stream records from the store, parsing and decoding them in worker processes.
+        Directory stores are listed with `os.scandir` and each worker reads its chunk of files
+        itself, checking the header criteria from the file prefix before reading the data.
+        Other backends are filtered by the backend and their payloads are sent to the workers.
+        Only `max_in_flight` chunks are pending at a time, so memory stays bounded. Records come
+        in store order (not sorted) and bypass the cache; unreadable records are logged and
+        skipped, and write-behind saves are seen once flushed. The model type must be
+        importable by the worker processes (i.e. defined at module level).
+        Args:
+            filter (Callable[[T], bool] | None): Predicate on decoded records, run in this process.
+            processes (int | None): Worker processes (None = CPU count, 0 or 1 = decode in this process).
+            chunk_size (int): Records per worker task.
+            max_in_flight (int | None): Chunks submitted but not yet consumed (default 2 per worker).
+            executor (Executor | None): Executor to run on instead of a temporary process pool.
+            **criteria: Header fields that must match before decoding (e.g. data_version="1.0").
+        Returns:
+            Iterator[T]: Matching records.
+        """
+        codec = resolve_codec(self.codec, self.model_type)
+        backend = self.backend
+        if isinstance(backend, DirectoryBackend):
+            delta_suffix = backend.delta_suffix if backend.supports_deltas else ""
+            files = scan_record_files(str(backend.directory), backend.shard_levels, backend.suffix)
+            func = functools.partial(decode_files, self.model_type, codec, criteria, delta_suffix)
+            chunks = chunked(files, chunk_size)
+        else:
+            func = functools.partial(decode_payloads, self.model_type, codec)
+            chunks = (
+                [item for item in map(self._scan_item, names) if item is not None]
+                for names in chunked(backend.query(**criteria), chunk_size)
+            )
+
+        results = run_chunks(func, chunks, processes=processes, executor=executor, max_in_flight=max_in_flight)
+        for name, obj, error in results:
+            if error is not None:
+                logger.warning(f"Skipping unreadable record '{name}' while iterating: {error}")
+            elif filter is None or filter(obj):
+                yield obj
+
+    def _scan_item(self, name: str) -> Optional[tuple[str, bytes, list[bytes], Optional[RecordStat]]]:
+        """Read a record's payload (and patches) for a worker; None if it has been deleted."""
+        try:
+            payload = self.backend.read(name)
+        except ValueError:
+            return None
+        if not self.backend.supports_deltas:
+            return name, payload, [], None
+        return name, payload, self.backend.read_deltas(name), self.backend.stat(name)
+
+    def count(self, **criteria) -> int:
+        """
+        Count records, optionally filtered by header fields.
+        Args:
+            **criteria: Header/manifest fields that must match.
+        Returns:
+            int: Number of matching records.
+        """
+        if self.index is not None:
+            return len(self.index.names(**criteria)) if criteria else len(self.index)
+        return self.backend.count(**criteria)
+
+    def get_header(self, name: str) -> Optional[dict]:
+        """
+        Return the header metadata for a record.
+        With the manifest enabled this also includes size, mtime_ns and (optionally) hash.
+        Args:
+            name (str): Name of the record (file name without extension).
+        Returns:
+            dict | None: Header fields, or None if the record is unknown or unreadable.
+        """
+        if self.index is not None:
+            return self.index.get(name)
+        return self.backend.header(name)
+
+    def scan_headers(self, **criteria) -> Iterator[tuple[str, dict]]:
+        """
+        Yield (name, header) for every record whose header matches the criteria, in name order.
+        Only header sections are read (from the manifest when enabled), never record data.
+        Args:
+            **criteria: Header/manifest fields that must match (e.g. data_version="1.0").
+        Returns:
+            Iterator[tuple[str, dict]]: Matching record names and their headers.
+        """
+        if self.index is not None:
+            yield from sorted(self.index.entries(**criteria), key=lambda item: item[0])
+            return
+
+        for name in sorted(self.backend.names()):
+            header = self.backend.header(name)
+            if header is None:
+                logger.warning(f"Skipping unreadable record '{name}' while scanning headers")
+                continue
+            if all(header.get(k) == v for k, v in criteria.items()):
+                yield name, header
+
+    def rebuild_index(self) -> int:
+        """
+        Rebuild the manifest from the records in the store.
+        Use after records were added, edited or removed outside this manager.
+        Returns:
+            int: Number of records indexed.
+        """
+        if self.index is None:
+            self.index = ManifestIndex(self.backend.meta_path(MANIFEST_FILENAME))
+
+        entries = {}
+        for name in self.backend.names():
+            header = self.backend.header(name)
+            st = self.backend.stat(name)
+            if header is None or st is None:
+                logger.warning(f"Skipping unreadable record '{name}' while rebuilding index")
+                continue
+            payload = self.backend.read(name) if self.index_hash else None
+            entries[name] = self._index_entry(header, st, payload)
+        self.index.replace_all(entries)
+        return len(entries)
+
+    def _index_entry(self, header: dict, st: RecordStat, payload: Optional[bytes] = None) -> dict:
+        """Build a manifest entry from a record's header, stat and (for hashing) payload."""
+        entry = {
+            "file_type": header.get("file_type"),
+            "data_version": header.get("data_version"),
+            "app_name": header.get("app_name"),
+            "size": st.size,
+            "mtime_ns": st.mtime_ns,
+        }
+        if self.index_hash and payload is not None:
+            entry["hash"] = hashlib.sha256(payload).hexdigest()
+        return entry
+
+    # Kept last: this method shadows the builtin `list` in the class body, so methods
+    # defined after it could not use `list[...]` in their annotations.
+    def list(self, **criteria) -> list[str]:
+        """
+        List record names, optionally filtered by header fields.
+        Uses the manifest when enabled; otherwise asks the backend (a directory store
+        reads record headers only if criteria are given, SQLite filters by column).
+        Args:
+            **criteria: Header/manifest fields that must match (e.g. file_type="Article").
+        Returns:
+            list[str]: Sorted record names.
+        """
+        if self.index is not None:
+            return self.index.names(**criteria)
+        return self.backend.query(**criteria)
@@ -2,12 +2,13 @@
 """
 Record classes for WrapDataclass manager module.
 
-Includes base dataclass record types with ID support and flexible content fields.
+Includes base dataclass record types with ID support and flexible content fields,
+each with a `Slotted*` counterpart that uses `__slots__` instead of a per-instance `__dict__`.
 """
 
 from dataclasses import dataclass, field
 import uuid
-from ..core.base import BaseModel
+from ..core.base import BaseModel, SlottedBaseModel
 
 
 @dataclass
@@ -33,3 +34,23 @@ class FlexibleRecord(BaseModel):
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     title: str
     body: str
+
+
+@dataclass(slots=True)
+class SlottedBaseRecord(SlottedBaseModel):
+    """`BaseRecord` without a per-instance `__dict__`, for keeping many records resident."""
+    id: str
+
+
+@dataclass(kw_only=True, slots=True)
+class SlottedAutoIDRecord(SlottedBaseModel):
+    """`AutoIDRecord` without a per-instance `__dict__`, for keeping many records resident."""
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+
+
+@dataclass(kw_only=True, slots=True)
+class SlottedFlexibleRecord(SlottedBaseModel):
+    """`FlexibleRecord` without a per-instance `__dict__`, for keeping many records resident."""
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    title: str
+    body: str
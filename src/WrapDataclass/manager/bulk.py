@@ -0,0 +1,66 @@
+# manager/bulk.py
+"""
+Helpers for bulk BaseManager operations.
+
+Runs a per-item function over a batch on a thread pool, keeping input order and
+capturing per-item failures instead of aborting the whole batch.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+import threading
+import logging
+
+from ..core import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one item in a bulk operation."""
+    name: Optional[str]
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the item completed without error."""
+        return self.error is None
+
+
+def run_batch(
+    func: Callable[[Any], tuple[Optional[str], Any]],
+    items: Iterable[Any],
+    *,
+    max_workers: int,
+    limiter: threading.Semaphore,
+    executor: Optional[Executor] = None
+) -> list[BatchResult]:
+    """
+    Apply `func` to every item concurrently and collect ordered results.
+    Args:
+        func (Callable): Called per item; returns (name, value). Exceptions become failed results.
+        items (Iterable): Items to process.
+        max_workers (int): Pool size when no executor is supplied.
+        limiter (Semaphore): Held around each call to cap concurrently open files.
+        executor (Executor | None): Existing executor to run on instead of a temporary pool.
+    Returns:
+        list[BatchResult]: One result per item, in input order.
+    """
+    def run_one(item: Any) -> BatchResult:
+        try:
+            with limiter:
+                name, value = func(item)
+            return BatchResult(name=name, value=value)
+        except Exception as e:
+            logger.debug(f"Bulk item {item!r} failed: {e}")
+            return BatchResult(name=item if isinstance(item, str) else getattr(item, "id", None), error=e)
+
+    # Let profile() blocks open in the calling thread see the work done on pool threads.
+    run_one = metrics.bind(run_one)
+    if executor is not None:
+        return list(executor.map(run_one, items))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run_one, items))
@@ -0,0 +1,108 @@
+# manager/cache.py
+"""
+In-memory LRU cache for records loaded by BaseManager.
+
+Entries are bounded by count and/or approximate size in bytes and are tagged with a
+validation token (e.g. file mtime and size) so stale entries are detected cheaply.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RecordCache:
+    """Thread-safe LRU cache keyed by record name with hit/miss counters."""
+    def __init__(self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+        Args:
+            max_entries (int | None): Maximum number of cached records (None for no limit).
+            max_bytes (int | None): Maximum total approximate size in bytes (None for no limit).
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, tuple[Any, Hashable, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def get(self, name: str, token: Hashable) -> Optional[Any]:
+        """
+        Return the cached object if present and its token still matches.
+        Args:
+            name (str): Record name.
+            token (Hashable): Current validation token for the record.
+        Returns:
+            The cached object, or None on a miss (stale entries are evicted).
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[1] == token:
+                self._entries.move_to_end(name)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                self._remove(name)
+            self.misses += 1
+            return None
+
+    def put(self, name: str, obj: Any, token: Hashable, size: int = 0) -> None:
+        """
+        Insert or replace an entry, evicting least recently used entries to fit the bounds.
+        Args:
+            name (str): Record name.
+            obj (Any): Object to cache.
+            token (Hashable): Validation token for the record.
+            size (int): Approximate size of the record in bytes.
+        """
+        with self._lock:
+            if name in self._entries:
+                self._remove(name)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[name] = (obj, token, size)
+            self.total_bytes += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def evict(self, name: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            if name in self._entries:
+                self._remove(name)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> dict:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+            }
+
+    def _remove(self, name: str) -> None:
+        """Remove an entry; the caller must hold the lock."""
+        _, _, size = self._entries.pop(name)
+        self.total_bytes -= size
@@ -0,0 +1,262 @@
+# manager/field_index.py
+"""
+Secondary field indexes for BaseManager.
+
+Each declared field gets a hash index (equality and membership lookups) or a sorted
+index (equality, membership and range lookups via `bisect`). The indexed values of
+every record are persisted with the same journal format as the manifest
+(`ManifestIndex`), and the lookup structures are rebuilt in memory on open.
+Only plain values (str, int, float, bool, None) can be indexed.
+"""
+
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Iterable, Optional
+import threading
+import logging
+
+from .index import ManifestIndex
+
+logger = logging.getLogger(__name__)
+
+FIELD_INDEX_FILENAME = ".fields.jsonl"
+
+HASH = "hash"
+SORTED = "sorted"
+
+# Lookup operators accepted as `field__op=value` criteria.
+OPERATORS = ("eq", "in", "gt", "gte", "lt", "lte")
+
+_INDEXABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def parse_criterion(key: str) -> tuple[str, str]:
+    """Split a `field__op` criterion key into (field, op); plain keys mean equality."""
+    field, sep, op = key.rpartition("__")
+    if sep and op in OPERATORS:
+        return field, op
+    return key, "eq"
+
+
+def matches(value: Any, op: str, target: Any) -> bool:
+    """Evaluate one criterion against a field value."""
+    if op == "eq":
+        return value == target
+    if op == "in":
+        return value in target
+    if value is None:
+        return False
+    try:
+        if op == "gt":
+            return value > target
+        if op == "gte":
+            return value >= target
+        if op == "lt":
+            return value < target
+        return value <= target
+    except TypeError:
+        return False
+
+
+class _SortedIndex:
+    """Parallel sorted lists of values and record names."""
+    __slots__ = ("keys", "names")
+
+    def __init__(self):
+        self.keys: list = []
+        self.names: list[str] = []
+
+    def load(self, pairs: Iterable[tuple[Any, str]]) -> None:
+        """Replace the contents with (value, name) pairs using one sort (None values are skipped)."""
+        pairs = [pair for pair in pairs if pair[0] is not None]
+        try:
+            pairs.sort(key=lambda pair: pair[0])
+        except TypeError:
+            raise ValueError("Cannot mix value types in a sorted index")
+        self.keys = [value for value, _ in pairs]
+        self.names = [name for _, name in pairs]
+
+    def check(self, value: Any) -> None:
+        """Raise ValueError if `value` cannot be ordered against the values already indexed."""
+        if value is None or not self.keys:
+            return
+        try:
+            value < self.keys[0]
+        except TypeError:
+            raise ValueError(f"Cannot mix {type(value).__name__} values with existing values in a sorted index")
+
+    def add(self, value: Any, name: str) -> None:
+        if value is None:
+            return
+        try:
+            i = bisect_right(self.keys, value)
+        except TypeError:
+            raise ValueError(f"Cannot mix {type(value).__name__} values with existing values in a sorted index")
+        self.keys.insert(i, value)
+        self.names.insert(i, name)
+
+    def remove(self, value: Any, name: str) -> None:
+        if value is None:
+            return
+        lo, hi = bisect_left(self.keys, value), bisect_right(self.keys, value)
+        for i in range(lo, hi):
+            if self.names[i] == name:
+                del self.keys[i]
+                del self.names[i]
+                return
+
+    def range(self, op: str, target: Any) -> set[str]:
+        keys = self.keys
+        try:
+            if op == "eq":
+                return set(self.names[bisect_left(keys, target):bisect_right(keys, target)])
+            if op == "gt":
+                return set(self.names[bisect_right(keys, target):])
+            if op == "gte":
+                return set(self.names[bisect_left(keys, target):])
+            if op == "lt":
+                return set(self.names[:bisect_left(keys, target)])
+            return set(self.names[:bisect_right(keys, target)])
+        except TypeError:
+            return set()
+
+
+class FieldIndex:
+    """Persistent hash/sorted indexes over selected model fields."""
+    def __init__(self, path: Path, fields: dict[str, str]):
+        """
+        Load the indexed values from disk (if present) and build the lookup structures.
+        Args:
+            path (Path): Journal file path.
+            fields (dict[str, str]): Field name -> "hash" or "sorted".
+        """
+        for field, kind in fields.items():
+            if kind not in (HASH, SORTED):
+                raise ValueError(f"Unknown index kind '{kind}' for field '{field}'; expected 'hash' or 'sorted'")
+        self.path = Path(path)
+        self.fields = dict(fields)
+        self._store = ManifestIndex(self.path)
+        self._lock = threading.Lock()
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @property
+    def complete(self) -> bool:
+        """False if the journal is missing, had unreadable lines or was written for a different set of fields."""
+        if not self.path.exists() or self._store.damaged:
+            return False
+        return all(set(entry) == set(self.fields) for _, entry in self._store.entries())
+
+    def _build(self) -> None:
+        """(Re)build the in-memory lookup structures from the stored entries."""
+        self._hash: dict[str, dict[Any, set[str]]] = {f: {} for f, k in self.fields.items() if k == HASH}
+        self._sorted: dict[str, _SortedIndex] = {f: _SortedIndex() for f, k in self.fields.items() if k == SORTED}
+        entries = list(self._store.entries())
+        for field, index in self._hash.items():
+            for name, entry in entries:
+                index.setdefault(entry.get(field), set()).add(name)
+        # One sort per field instead of an O(n) list insert per entry.
+        for field, index in self._sorted.items():
+            index.load((entry.get(field), name) for name, entry in entries)
+
+    def entry_for(self, values: dict) -> dict:
+        """Pick and validate the indexed fields out of a record's field values.
+        Called before the record is written, so a value the indexes would reject fails the save."""
+        entry = {}
+        for field in self.fields:
+            value = values.get(field)
+            if not isinstance(value, _INDEXABLE_TYPES):
+                raise ValueError(f"Field '{field}' has a {type(value).__name__} value, which cannot be indexed")
+            entry[field] = value
+        with self._lock:
+            self._check(entry)
+        return entry
+
+    def get(self, name: str) -> Optional[dict]:
+        """Return the indexed values stored for a record, or None."""
+        return self._store.get(name)
+
+    def record(self, name: str, entry: dict) -> None:
+        """Add or replace a record's indexed values."""
+        with self._lock:
+            old = self._store.get(name)
+            if old == entry:
+                return
+            self._check(entry)
+            if old is not None:
+                self._discard(name, old)
+            self._add(name, entry)
+            self._store.record(name, entry)
+
+    def remove(self, name: str) -> None:
+        """Drop a record from every index."""
+        with self._lock:
+            old = self._store.get(name)
+            if old is not None:
+                self._discard(name, old)
+                self._store.remove(name)
+
+    def replace_all(self, entries: dict[str, dict]) -> None:
+        """Replace all indexed values and rewrite the journal as a snapshot."""
+        with self._lock:
+            self._store.replace_all(entries)
+            self._build()
+
+    def _check(self, entry: dict) -> None:
+        """Validate an entry against the sorted indexes before anything is changed."""
+        for field, index in self._sorted.items():
+            try:
+                index.check(entry.get(field))
+            except ValueError as e:
+                raise ValueError(f"Field '{field}': {e}")
+
+    def _add(self, name: str, entry: dict) -> None:
+        for field, index in self._hash.items():
+            index.setdefault(entry.get(field), set()).add(name)
+        for field, index in self._sorted.items():
+            index.add(entry.get(field), name)
+
+    def _discard(self, name: str, entry: dict) -> None:
+        for field, index in self._hash.items():
+            names = index.get(entry.get(field))
+            if names is not None:
+                names.discard(name)
+                if not names:
+                    del index[entry.get(field)]
+        for field, index in self._sorted.items():
+            index.remove(entry.get(field), name)
+
+    def lookup(self, field: str, op: str, target: Any) -> set[str]:
+        """
+        Return the names of records whose indexed field satisfies one criterion.
+        Args:
+            field (str): An indexed field.
+            op (str): One of `OPERATORS`.
+            target (Any): Value to compare with (an iterable of values for "in").
+        Returns:
+            set[str]: Matching record names.
+        """
+        with self._lock:
+            if op == "in":
+                return set().union(*(self.lookup_one(field, "eq", value) for value in target))
+            return self.lookup_one(field, op, target)
+
+    def lookup_one(self, field: str, op: str, target: Any) -> set[str]:
+        """`lookup` for a single comparison. The caller must hold the lock."""
+        if field in self._sorted:
+            return self._sorted[field].range(op, target)
+        index = self._hash[field]
+        if op == "eq":
+            return set(index.get(target, ()))
+        # Range over a hash index: scan its distinct values.
+        names: set[str] = set()
+        for value, value_names in index.items():
+            if matches(value, op, target):
+                names |= value_names
+        return names
+
+    def names(self) -> Iterable[str]:
+        """Return the names of all indexed records."""
+        return self._store.names()
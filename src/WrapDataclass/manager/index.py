@@ -0,0 +1,134 @@
+# manager/index.py
+"""
+Persistent manifest index for BaseManager stores.
+
+The manifest maps record name -> header fields (file_type, data_version, app_name)
+plus file size, mtime and an optional content hash. It is persisted as an append-only
+JSON Lines journal so each save or delete costs one small append; the journal is
+compacted into a snapshot once it grows well beyond the number of live entries.
+"""
+
+from pathlib import Path
+from typing import Iterator, Optional
+import json
+import os
+import threading
+import logging
+
+from ..core.fileio import append_line
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".manifest.jsonl"
+
+
+class ManifestIndex:
+    """Journal-backed index of record metadata, queryable without opening record files."""
+    def __init__(self, path: Path, compact_factor: int = 2, compact_min: int = 1000):
+        """
+        Load the manifest from disk (if present).
+        Args:
+            path (Path): Journal file path.
+            compact_factor (int): Compact when the journal holds this many times more lines than live entries.
+            compact_min (int): Never compact journals shorter than this many lines.
+        """
+        self.path = Path(path)
+        self.compact_factor = compact_factor
+        self.compact_min = compact_min
+        self._entries: dict[str, dict] = {}
+        self._journal_lines = 0
+        # True when lines had to be skipped on load, so entries may be missing.
+        self.damaged = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def get(self, name: str) -> Optional[dict]:
+        """Return a copy of the entry for a record, or None."""
+        entry = self._entries.get(name)
+        return dict(entry) if entry is not None else None
+
+    def names(self, **criteria) -> list[str]:
+        """
+        Return record names, optionally filtered by entry fields.
+        Args:
+            **criteria: Field/value pairs that must all match (e.g. file_type="Article").
+        Returns:
+            list[str]: Sorted matching record names.
+        """
+        return sorted(name for name, _ in self.entries(**criteria))
+
+    def entries(self, **criteria) -> Iterator[tuple[str, dict]]:
+        """Yield (name, entry) pairs whose fields match all criteria."""
+        with self._lock:
+            snapshot = list(self._entries.items())
+        for name, entry in snapshot:
+            if all(entry.get(k) == v for k, v in criteria.items()):
+                yield name, dict(entry)
+
+    def record(self, name: str, entry: dict) -> None:
+        """Add or replace the entry for a record and append it to the journal."""
+        with self._lock:
+            self._entries[name] = dict(entry)
+            self._append({"name": name, "entry": entry})
+
+    def remove(self, name: str) -> None:
+        """Drop the entry for a record and append a tombstone to the journal."""
+        with self._lock:
+            if self._entries.pop(name, None) is not None:
+                self._append({"name": name, "deleted": True})
+
+    def replace_all(self, entries: dict[str, dict]) -> None:
+        """Replace every entry and rewrite the journal as a snapshot."""
+        with self._lock:
+            self._entries = {name: dict(entry) for name, entry in entries.items()}
+            self._write_snapshot()
+
+    def compact(self) -> None:
+        """Rewrite the journal as a snapshot of the live entries."""
+        with self._lock:
+            self._write_snapshot()
+
+    def _load(self) -> None:
+        """Replay the journal, ignoring a torn final line left by a crash."""
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    op = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    logger.warning(f"Skipping unreadable manifest line {line_no} in '{self.path}'")
+                    self.damaged = True
+                    continue
+                self._journal_lines += 1
+                if op.get("deleted"):
+                    self._entries.pop(op["name"], None)
+                else:
+                    self._entries[op["name"]] = op["entry"]
+
+    def _append(self, op: dict) -> None:
+        """Append one journal line and compact if the journal has grown too long.
+        The caller must hold the lock."""
+        append_line(self.path, json.dumps(op, separators=(",", ":")).encode("utf-8"))
+        self._journal_lines += 1
+        if self._journal_lines >= max(self.compact_min, self.compact_factor * len(self._entries)):
+            self._write_snapshot()
+
+    def _write_snapshot(self) -> None:
+        """Atomically replace the journal with one line per live entry.
+        The caller must hold the lock."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for name, entry in self._entries.items():
+                f.write(json.dumps({"name": name, "entry": entry}, separators=(",", ":")) + "\n")
+        os.replace(tmp, self.path)
+        self._journal_lines = len(self._entries)
+        self.damaged = False
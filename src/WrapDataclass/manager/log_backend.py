@@ -0,0 +1,419 @@
+# manager/log_backend.py
+"""
+Append-only, log-structured storage backend for BaseManager.
+
+Every save appends one frame to the active segment file and every delete appends a
+tombstone, so writes are purely sequential. An in-memory index maps each record name
+to the segment and offset of its latest payload, making loads a single positioned read.
+Segments roll over at `segment_size`; `compact()` (explicit, or in the background once
+enough of the log is dead) rewrites the live records into fresh segments and removes
+the old ones. On open the index is restored from the checkpoint file, if valid, and the
+log written after it is replayed; otherwise all segments are replayed.
+
+Frame layout (little-endian):
+    crc32 (I) | kind (B) | name length (H) | header length (I) | payload length (I) | mtime_ns (Q)
+    followed by the UTF-8 name, the compact JSON header and the payload bytes.
+The CRC covers everything after itself, so a torn frame at the end of the log is detected
+and truncated on open.
+"""
+
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional
+import json
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+import logging
+
+from ..core.fileio import atomic_write_bytes, fsync_directory
+from .storage import StorageBackend, RecordStat
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = "checkpoint.json"
+
+KIND_PUT = 1
+KIND_TOMBSTONE = 2
+
+_FRAME = struct.Struct("<IBHIIQ")
+_CRC_SIZE = 4
+_SEGMENT_NAME = re.compile(r"^segment-(\d{8})\.log$")
+
+
+class _Entry(NamedTuple):
+    """Location and metadata of a record's latest frame."""
+    segment: int
+    offset: int  # offset of the payload within the segment
+    frame_size: int
+    size: int
+    mtime_ns: int
+    header: dict
+
+
+def _encode_frame(kind: int, name: str, header_bytes: bytes, payload: bytes, mtime_ns: int) -> bytes:
+    """Build a complete frame, including its CRC."""
+    name_bytes = name.encode("utf-8")
+    body = _FRAME.pack(0, kind, len(name_bytes), len(header_bytes), len(payload), mtime_ns)[_CRC_SIZE:]
+    body += name_bytes + header_bytes + payload
+    return struct.pack("<I", zlib.crc32(body)) + body
+
+
+class LogBackend(StorageBackend):
+    """Segment-file record store with tombstones, compaction and checkpoints."""
+    def __init__(
+        self,
+        directory: Path | str,
+        *,
+        segment_size: int = 64 * 1024 * 1024,
+        fsync: bool = False,
+        compact_ratio: Optional[float] = 0.5,
+        compact_min_bytes: int = 16 * 1024 * 1024
+    ):
+        """
+        Open (or create) a log store and rebuild its index.
+        Args:
+            directory (Path | str): Directory holding the segment files (created if missing).
+            segment_size (int): Roll over to a new segment once the active one reaches this size.
+            fsync (bool): fsync the active segment after every single write. Group writes
+                (`write_many`) follow their own `fsync` argument.
+            compact_ratio (float | None): Start a background compaction once this fraction of the
+                log is dead (overwritten or deleted records). None disables automatic compaction.
+            compact_min_bytes (int): Never compact automatically while the log is smaller than this.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.fsync = fsync
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+
+        self._index: dict[str, _Entry] = {}
+        self._segment_bytes: dict[int, int] = {}
+        self._readers: dict[int, object] = {}
+        self._writer = None
+        self._active = 0
+        self._live_bytes = 0
+        self._lock = threading.RLock()
+        self._compactor: Optional[threading.Thread] = None
+
+        self._open()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.directory}')"
+
+    # ---- segment files -------------------------------------------------
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"segment-{segment:08d}.log"
+
+    def _segments_on_disk(self) -> list[int]:
+        """Return the ids of all segment files, in log order."""
+        ids = []
+        for path in self.directory.iterdir():
+            match = _SEGMENT_NAME.match(path.name)
+            if match:
+                ids.append(int(match.group(1)))
+        return sorted(ids)
+
+    def _reader(self, segment: int):
+        f = self._readers.get(segment)
+        if f is None:
+            f = self._segment_path(segment).open("rb")
+            self._readers[segment] = f
+        return f
+
+    def _open_writer(self, segment: int) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._active = segment
+        self._writer = self._segment_path(segment).open("ab")
+        self._segment_bytes.setdefault(segment, self._writer.tell())
+
+    # ---- startup -------------------------------------------------------
+
+    def _open(self) -> None:
+        """Restore the index from the checkpoint (if usable) and replay the rest of the log."""
+        segments = self._segments_on_disk()
+        start_segment, start_offset = self._load_checkpoint(segments)
+        if start_segment is None:
+            self._index.clear()
+            start_segment, start_offset = (segments[0] if segments else 1), 0
+
+        for segment in segments:
+            if segment < start_segment:
+                self._segment_bytes[segment] = self._segment_path(segment).stat().st_size
+                continue
+            last = segment == segments[-1]
+            self._replay(segment, start_offset if segment == start_segment else 0, truncate_torn=last)
+
+        self._live_bytes = sum(entry.frame_size for entry in self._index.values())
+        self._open_writer(segments[-1] if segments else 1)
+
+    def _load_checkpoint(self, segments: list[int]) -> tuple[Optional[int], int]:
+        """Load the checkpoint into the index. Returns the log position to replay from, or (None, 0)."""
+        path = self.directory / CHECKPOINT_FILENAME
+        if not path.exists():
+            return None, 0
+        try:
+            content = json.loads(path.read_bytes())
+            segment, offset = content["position"]
+            entries = {
+                name: _Entry(seg, off, frame_size, size, mtime_ns, header)
+                for name, (seg, off, frame_size, size, mtime_ns, header) in content["entries"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint '{path}': {e}")
+            return None, 0
+
+        needed = {entry.segment for entry in entries.values()} | {segment}
+        if not needed <= set(segments) or offset > self._segment_path(segment).stat().st_size:
+            logger.warning(f"Checkpoint '{path}' does not match the segment files; replaying the full log")
+            return None, 0
+
+        self._index = entries
+        return segment, offset
+
+    def _replay(self, segment: int, start: int, *, truncate_torn: bool) -> None:
+        """Apply the frames of one segment from `start` to the index."""
+        path = self._segment_path(segment)
+        with path.open("rb") as f:
+            f.seek(start)
+            offset = start
+            while True:
+                head = f.read(_FRAME.size)
+                if not head:
+                    break
+                frame = self._parse_frame(f, head)
+                if frame is None:
+                    if not truncate_torn:
+                        raise ValueError(f"Corrupt frame in log segment '{path}' at offset {offset}")
+                    logger.warning(f"Truncating torn frame in log segment '{path}' at offset {offset}")
+                    break
+                kind, name, header, payload_len, mtime_ns, frame_size = frame
+                self._apply(kind, name, header, segment, offset, frame_size, payload_len, mtime_ns)
+                offset += frame_size
+
+        if offset < path.stat().st_size:
+            os.truncate(path, offset)
+        self._segment_bytes[segment] = offset
+
+    @staticmethod
+    def _parse_frame(f, head: bytes):
+        """Read the rest of a frame after its fixed header; None if it is truncated or corrupt."""
+        if len(head) < _FRAME.size:
+            return None
+        crc, kind, name_len, header_len, payload_len, mtime_ns = _FRAME.unpack(head)
+        rest = f.read(name_len + header_len + payload_len)
+        if len(rest) < name_len + header_len + payload_len or zlib.crc32(head[_CRC_SIZE:] + rest) != crc:
+            return None
+        try:
+            name = rest[:name_len].decode("utf-8")
+            header = json.loads(rest[name_len:name_len + header_len]) if header_len else None
+        except ValueError:
+            return None
+        return kind, name, header, payload_len, mtime_ns, _FRAME.size + len(rest)
+
+    def _apply(
+        self,
+        kind: int,
+        name: str,
+        header: Optional[dict],
+        segment: int,
+        frame_start: int,
+        frame_size: int,
+        payload_len: int,
+        mtime_ns: int
+    ) -> None:
+        """Update the index for one frame written at `frame_start` in `segment`."""
+        old = self._index.pop(name, None)
+        if old is not None:
+            self._live_bytes -= old.frame_size
+        if kind == KIND_PUT:
+            offset = frame_start + frame_size - payload_len
+            self._index[name] = _Entry(segment, offset, frame_size, payload_len, mtime_ns, header or {})
+            self._live_bytes += frame_size
+
+    # ---- writing -------------------------------------------------------
+
+    def _append(self, kind: int, name: str, payload: bytes, header: Optional[dict], mtime_ns: int) -> None:
+        """Append one frame to the active segment and index it. Caller holds the lock."""
+        if self._segment_bytes[self._active] >= self.segment_size:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._open_writer(self._active + 1)
+
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8") if header else b""
+        frame = _encode_frame(kind, name, header_bytes, payload, mtime_ns)
+        start = self._segment_bytes[self._active]
+        self._writer.write(frame)
+        self._segment_bytes[self._active] = start + len(frame)
+        self._apply(kind, name, header, self._active, start, len(frame), len(payload), mtime_ns)
+
+    def _sync(self, fsync: bool) -> None:
+        """Make appended frames visible to readers and, optionally, durable."""
+        self._writer.flush()
+        if fsync:
+            os.fsync(self._writer.fileno())
+
+    def write(self, name: str, payload: bytes, header: dict) -> None:
+        with self._lock:
+            self._append(KIND_PUT, name, payload, header, time.time_ns())
+            self._sync(self.fsync)
+        self._maybe_compact()
+
+    def write_many(self, items: Iterable[tuple[str, bytes, dict]], *, fsync: bool = True) -> None:
+        with self._lock:
+            mtime_ns = time.time_ns()
+            for name, payload, header in items:
+                self._append(KIND_PUT, name, payload, header, mtime_ns)
+            self._sync(fsync)
+        self._maybe_compact()
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            if name not in self._index:
+                return
+            self._append(KIND_TOMBSTONE, name, b"", None, time.time_ns())
+            self._sync(self.fsync)
+        self._maybe_compact()
+
+    # ---- reading -------------------------------------------------------
+
+    def read(self, name: str) -> bytes:
+        with self._lock:
+            entry = self._index.get(name)
+            if entry is None:
+                raise ValueError(f"Record '{name}' not found in '{self.directory}'")
+            f = self._reader(entry.segment)
+            f.seek(entry.offset)
+            return f.read(entry.size)
+
+    def stat(self, name: str) -> Optional[RecordStat]:
+        entry = self._index.get(name)
+        return RecordStat(entry.size, entry.mtime_ns) if entry is not None else None
+
+    def exists(self, name: str) -> bool:
+        return name in self._index
+
+    def names(self) -> Iterator[str]:
+        with self._lock:
+            names = list(self._index)
+        yield from names
+
+    def header(self, name: str) -> Optional[dict]:
+        entry = self._index.get(name)
+        return dict(entry.header) if entry is not None else None
+
+    def count(self, **criteria) -> int:
+        if not criteria:
+            return len(self._index)
+        return super().count(**criteria)
+
+    def meta_path(self, filename: str) -> Path:
+        return self.directory / filename
+
+    def stats(self) -> dict:
+        """
+        Return log size figures.
+        Returns:
+            dict: records, segments, total_bytes, live_bytes and dead_bytes.
+        """
+        with self._lock:
+            total = sum(self._segment_bytes.values())
+            return {
+                "records": len(self._index),
+                "segments": len(self._segment_bytes),
+                "total_bytes": total,
+                "live_bytes": self._live_bytes,
+                "dead_bytes": total - self._live_bytes,
+            }
+
+    # ---- compaction and checkpoints -------------------------------------
+
+    def _maybe_compact(self) -> None:
+        """Start a background compaction if enough of the log is dead."""
+        if self.compact_ratio is None:
+            return
+        total = sum(self._segment_bytes.values())
+        if total < self.compact_min_bytes or total - self._live_bytes < total * self.compact_ratio:
+            return
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return
+            self._compactor = threading.Thread(
+                target=self._background_compact, name=f"WrapLogCompact-{self.directory.name}", daemon=True
+            )
+            self._compactor.start()
+
+    def _background_compact(self) -> None:
+        try:
+            self.compact()
+        except Exception as e:
+            logger.error(f"Background compaction failed for '{self.directory}': {e}")
+
+    def compact(self) -> int:
+        """
+        Rewrite the live records into new segments and delete the old ones.
+        Reads and writes wait while compaction runs. Old segments are removed oldest first,
+        so a crash part-way through never resurrects a deleted record.
+        Returns:
+            int: Number of bytes reclaimed.
+        """
+        with self._lock:
+            before = sum(self._segment_bytes.values())
+            old_segments = sorted(self._segment_bytes)
+            self._sync(True)
+
+            live = sorted(self._index.items(), key=lambda item: (item[1].segment, item[1].offset))
+            self._open_writer(self._active + 1)
+            self._index = {}
+            self._live_bytes = 0
+            for name, entry in live:
+                f = self._reader(entry.segment)
+                f.seek(entry.offset)
+                self._append(KIND_PUT, name, f.read(entry.size), entry.header, entry.mtime_ns)
+            self._sync(True)
+
+            for segment in old_segments:
+                reader = self._readers.pop(segment, None)
+                if reader is not None:
+                    reader.close()
+                self._segment_path(segment).unlink(missing_ok=True)
+                del self._segment_bytes[segment]
+            fsync_directory(self.directory)
+            self._write_checkpoint()
+            return before - sum(self._segment_bytes.values())
+
+    def checkpoint(self) -> None:
+        """Persist the index so the next open only replays frames written after this point."""
+        with self._lock:
+            self._sync(True)
+            self._write_checkpoint()
+
+    def _write_checkpoint(self) -> None:
+        content = {
+            "position": [self._active, self._segment_bytes[self._active]],
+            "entries": {name: list(entry) for name, entry in self._index.items()},
+        }
+        atomic_write_bytes(
+            self.directory / CHECKPOINT_FILENAME, json.dumps(content, separators=(",", ":")).encode("utf-8"), fsync=True
+        )
+
+    def close(self) -> None:
+        """Wait for a running compaction, write a checkpoint and close all segment files."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._lock:
+            if self._writer is None:
+                return
+            self._sync(True)
+            self._write_checkpoint()
+            self._writer.close()
+            self._writer = None
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
@@ -0,0 +1,87 @@
+# manager/patches.py
+"""
+Field-level patches for BaseManager.update.
+
+A patch is one compact JSON line holding the fields to set, the fields to clear and the
+(mtime_ns, size) of the base record it applies to, prefixed with the CRC-32 of the JSON
+(8 hex digits and a space). Patches are appended to a per-record delta journal and folded
+into the record's data on load. A patch whose base no longer matches the stored record
+(because the record was rewritten after it was journaled) is ignored, so a crash between
+rewriting a record and clearing its journal is harmless. A line whose CRC does not match
+(a torn or damaged write) is skipped with a warning.
+"""
+
+from typing import Iterable
+import json
+import zlib
+import logging
+
+from ..core.codecs import JsonCodec
+from .storage import RecordStat
+
+logger = logging.getLogger(__name__)
+
+
+def encode_patch(base: RecordStat, fields: dict, codec: JsonCodec) -> bytes:
+    """
+    Encode one patch line.
+    Args:
+        base (RecordStat): Stat of the stored record the patch applies to.
+        fields (dict): Encoded field values; None clears the field (like a save with skip_none).
+        codec (JsonCodec): Codec to encode with (its compact variant is used).
+    Returns:
+        bytes: The framed patch, without a trailing newline.
+    """
+    patch = {
+        "base": [base.mtime_ns, base.size],
+        "set": {name: value for name, value in fields.items() if value is not None},
+        "unset": [name for name, value in fields.items() if value is None],
+    }
+    body = codec.as_compact().dumps(patch)
+    return b"%08x " % zlib.crc32(body) + body
+
+
+def _decode_patch(line: bytes, codec: JsonCodec) -> dict:
+    """Check a journal line's CRC and decode it. Raises ValueError if the line is damaged."""
+    crc, _, body = line.partition(b" ")
+    try:
+        valid = len(crc) == 8 and int(crc, 16) == zlib.crc32(body)
+    except ValueError:
+        valid = False
+    if not valid:
+        raise ValueError("CRC mismatch")
+    try:
+        return codec.loads(body)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(e)
+
+
+def apply_patches(data: dict, patches: Iterable[bytes], base: RecordStat, codec: JsonCodec) -> int:
+    """
+    Fold journaled patches into a record's data dict, in order.
+    Patches for a different base and damaged lines are skipped.
+    Args:
+        data (dict): The record's `data` section, updated in place.
+        patches (Iterable[bytes]): Journal lines.
+        base (RecordStat): Stat of the stored record the data was read from.
+        codec (JsonCodec): Codec to decode with.
+    Returns:
+        int: Number of patches applied.
+    """
+    expected = [base.mtime_ns, base.size]
+    applied = 0
+    for line in patches:
+        if not line.strip():
+            continue
+        try:
+            patch = _decode_patch(line, codec)
+        except ValueError as e:
+            logger.warning(f"Skipping damaged patch line: {e}")
+            continue
+        if patch.get("base") != expected:
+            continue
+        data.update(patch["set"])
+        for name in patch["unset"]:
+            data.pop(name, None)
+        applied += 1
+    return applied
@@ -0,0 +1,163 @@
+# manager/scan.py
+"""
+Parallel, streaming store scans for BaseManager.iter_records.
+
+Record files are enumerated with `os.scandir` and handed to worker processes in chunks;
+each worker checks the header criteria from the file prefix, then reads, parses and
+decodes the matching records and sends the instances back. At most `max_in_flight`
+chunks are queued or being decoded at any time, so memory stays bounded however
+large the store is. Stores that are not directories ship payload bytes to the workers instead.
+"""
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+import json
+import os
+import logging
+
+from ..core.codecs import JsonCodec
+from ..core.compression import decompress
+from ..core.mixin_file import read_header, _split_wrapper, _check_header
+from .patches import apply_patches
+from .storage import RecordStat
+
+logger = logging.getLogger(__name__)
+
+# One decoded item: (name, instance or None, error message or None).
+# Records skipped by the header criteria are not reported at all.
+ScanResult = tuple[str, Any, Optional[str]]
+
+
+def scan_record_files(directory: str, shard_levels: int, suffix: str) -> Iterator[tuple[str, str]]:
+    """Yield (name, path) for every record file of a directory store, in directory order."""
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if shard_levels:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from scan_record_files(entry.path, shard_levels - 1, suffix)
+            elif entry.name.endswith(suffix) and entry.is_file():
+                yield entry.name[:-len(suffix)], entry.path
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[list]:
+    """Split an iterable into lists of at most `size` items."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _decode(model_type: type, codec: JsonCodec, name: str, payload: bytes,
+            patches: list[bytes], base: Optional[RecordStat]) -> Any:
+    """Parse and decode one record payload, folding in journaled patches."""
+    try:
+        header, data = _split_wrapper(codec.loads(decompress(payload)))
+        _check_header(header, model_type.__name__)
+        if patches and base is not None:
+            apply_patches(data, patches, base, codec)
+        return model_type.from_dict(data)
+    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Error loading record '{name}': {e}")
+
+
+def decode_files(model_type: type, codec: JsonCodec, criteria: dict, delta_suffix: str,
+                 files: list[tuple[str, str]]) -> list[ScanResult]:
+    """
+    Worker: decode a chunk of record files, skipping those whose header does not match.
+    Args:
+        model_type (type): Dataclass type to decode into (must be importable by the worker).
+        codec (JsonCodec): Codec to parse with.
+        criteria (dict): Header fields that must match; checked before the data is read.
+        delta_suffix (str): Suffix of delta journals next to the record files ("" if none).
+        files (list[tuple[str, str]]): (name, path) pairs.
+    Returns:
+        list[ScanResult]: Decoded records and per-record errors, in input order.
+    """
+    results = []
+    for name, path in files:
+        try:
+            if criteria:
+                header = read_header(path)
+                if any(header.get(k) != v for k, v in criteria.items()):
+                    continue
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                payload = f.read()
+            patches = []
+            if delta_suffix:
+                try:
+                    with open(path + delta_suffix, "rb") as f:
+                        patches = f.read().splitlines()
+                except FileNotFoundError:
+                    pass
+            base = RecordStat(st.st_size, st.st_mtime_ns)
+            results.append((name, _decode(model_type, codec, name, payload, patches, base), None))
+        except FileNotFoundError:
+            # Deleted since it was listed.
+            continue
+        except (OSError, ValueError) as e:
+            results.append((name, None, str(e)))
+    return results
+
+
+def decode_payloads(model_type: type, codec: JsonCodec,
+                    items: list[tuple[str, bytes, list[bytes], Optional[RecordStat]]]) -> list[ScanResult]:
+    """Worker: decode a chunk of (name, payload, patches, base stat) items read by the parent."""
+    results = []
+    for name, payload, patches, base in items:
+        try:
+            results.append((name, _decode(model_type, codec, name, payload, patches, base), None))
+        except ValueError as e:
+            results.append((name, None, str(e)))
+    return results
+
+
+def run_chunks(
+    func: Callable[[list], list[ScanResult]],
+    chunks: Iterable[list],
+    *,
+    processes: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    max_in_flight: Optional[int] = None
+) -> Iterator[ScanResult]:
+    """
+    Run `func` over chunks in a process pool and stream the results in chunk order.
+    Args:
+        func (Callable): Picklable worker called once per chunk.
+        chunks (Iterable[list]): Work items, consumed lazily as capacity frees up.
+        processes (int | None): Pool size (None = CPU count, 0 or 1 = decode in this process).
+        executor (Executor | None): Existing executor to run on instead of a temporary pool.
+        max_in_flight (int | None): Chunks submitted but not yet consumed (default 2 per worker).
+    Returns:
+        Iterator[ScanResult]: Results of every chunk, in order.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if executor is None and processes <= 1:
+        # A single worker would only add pickling overhead.
+        for chunk in chunks:
+            yield from func(chunk)
+        return
+
+    pool = executor or ProcessPoolExecutor(max_workers=processes)
+    limit = max(1, max_in_flight or 2 * processes)
+    inflight = deque()
+    try:
+        for chunk in chunks:
+            inflight.append(pool.submit(func, chunk))
+            if len(inflight) >= limit:
+                yield from inflight.popleft().result()
+        while inflight:
+            yield from inflight.popleft().result()
+    finally:
+        for future in inflight:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,184 @@
+# manager/sqlite_backend.py
+"""
+SQLite storage backend for BaseManager.
+
+Stores every record as a row (payload BLOB plus queryable header columns) in a single
+database file using WAL mode, avoiding one file per record and allowing transactional
+batches. Uses only the stdlib `sqlite3` module.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+import sqlite3
+import threading
+import time
+import logging
+
+from .storage import StorageBackend, RecordStat, HEADER_FIELDS
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    name TEXT PRIMARY KEY,
+    file_type TEXT,
+    data_version TEXT,
+    app_name TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_file_type ON records (file_type);
+CREATE INDEX IF NOT EXISTS records_data_version ON records (data_version);
+"""
+
+_UPSERT = """
+INSERT INTO records (name, file_type, data_version, app_name, size, mtime_ns, payload)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (name) DO UPDATE SET
+    file_type = excluded.file_type,
+    data_version = excluded.data_version,
+    app_name = excluded.app_name,
+    size = excluded.size,
+    mtime_ns = excluded.mtime_ns,
+    payload = excluded.payload
+"""
+
+# Columns that `query`/`count` may filter on.
+_QUERY_COLUMNS = frozenset(HEADER_FIELDS + ("size",))
+
+
+class SQLiteBackend(StorageBackend):
+    """Single-file SQLite record store with WAL journaling and per-thread connections."""
+    def __init__(self, path: Path | str, *, synchronous: str = "NORMAL", timeout: float = 30.0):
+        """
+        Open (or create) the database.
+        Args:
+            path (Path | str): Database file path.
+            synchronous (str): SQLite `synchronous` pragma ("OFF", "NORMAL", "FULL").
+            timeout (float): Seconds to wait on a locked database.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.synchronous = synchronous
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._conn.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.path}')"
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            self._local.conn = conn
+            self._local.depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed writes in one transaction (nested blocks join the outer one)."""
+        conn = self._conn
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield self
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield self
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    def write(self, name: str, payload: bytes, header: dict) -> None:
+        self._conn.execute(_UPSERT, self._row(name, payload, header))
+
+    def write_many(self, items: Iterable[tuple[str, bytes, dict]], *, fsync: bool = True) -> None:
+        rows = [self._row(name, payload, header) for name, payload, header in items]
+        with self.transaction():
+            self._conn.executemany(_UPSERT, rows)
+
+    @staticmethod
+    def _row(name: str, payload: bytes, header: dict) -> tuple:
+        """Build the column values for one record."""
+        return (
+            name,
+            header.get("file_type"),
+            header.get("data_version"),
+            header.get("app_name"),
+            len(payload),
+            time.time_ns(),
+            payload,
+        )
+
+    def read(self, name: str) -> bytes:
+        row = self._conn.execute("SELECT payload FROM records WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise ValueError(f"Record '{name}' not found in '{self.path}'")
+        return row[0]
+
+    def delete(self, name: str) -> None:
+        self._conn.execute("DELETE FROM records WHERE name = ?", (name,))
+
+    def stat(self, name: str) -> Optional[RecordStat]:
+        row = self._conn.execute("SELECT size, mtime_ns FROM records WHERE name = ?", (name,)).fetchone()
+        return RecordStat(*row) if row is not None else None
+
+    def names(self) -> Iterator[str]:
+        for (name,) in self._conn.execute("SELECT name FROM records"):
+            yield name
+
+    def header(self, name: str) -> Optional[dict]:
+        row = self._conn.execute(
+            "SELECT file_type, data_version, app_name FROM records WHERE name = ?", (name,)
+        ).fetchone()
+        return dict(zip(HEADER_FIELDS, row)) if row is not None else None
+
+    def query(self, **criteria) -> list[str]:
+        where, params = self._where(criteria)
+        return [name for (name,) in self._conn.execute(f"SELECT name FROM records{where} ORDER BY name", params)]
+
+    def count(self, **criteria) -> int:
+        where, params = self._where(criteria)
+        return self._conn.execute(f"SELECT COUNT(*) FROM records{where}", params).fetchone()[0]
+
+    @staticmethod
+    def _where(criteria: dict) -> tuple[str, list]:
+        """Build a WHERE clause from header criteria."""
+        unknown = set(criteria) - _QUERY_COLUMNS
+        if unknown:
+            raise ValueError(f"Cannot query on {sorted(unknown)}; expected any of {sorted(_QUERY_COLUMNS)}")
+        if not criteria:
+            return "", []
+        clause = " AND ".join(f"{column} = ?" for column in criteria)
+        return f" WHERE {clause}", list(criteria.values())
+
+    def meta_path(self, filename: str) -> Path:
+        return self.path.with_name(self.path.name + filename)
+
+    def close(self) -> None:
+        """Close every connection opened by this backend."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
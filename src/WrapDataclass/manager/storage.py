@@ -0,0 +1,375 @@
+# manager/storage.py
+"""
+Storage backends for BaseManager.
+
+A backend stores opaque serialized records (bytes) by name, together with their
+header metadata, and knows nothing about dataclasses. `DirectoryBackend` keeps the
+original one-JSON-file-per-record layout, optionally sharded into hash-prefix
+subdirectories; other engines live in sibling modules.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+import hashlib
+import json
+import os
+import logging
+
+from ..core.fileio import append_line, atomic_write_bytes, atomic_write_group, fsync_directory
+from ..core.mixin_file import read_header
+
+logger = logging.getLogger(__name__)
+
+# Header fields every backend can filter on.
+HEADER_FIELDS = ("file_type", "data_version", "app_name")
+
+# Marker recording the shard layout of a DirectoryBackend store.
+LAYOUT_FILENAME = ".layout.json"
+
+
+class RecordStat(NamedTuple):
+    """Cheap per-record metadata used to validate caches and build manifests."""
+    size: int
+    mtime_ns: int
+
+
+class StorageBackend(ABC):
+    """
+    Interface for record storage engines used by BaseManager.
+    Engines must implement the abstract methods; the others have generic defaults.
+    Engines that set `supports_deltas` must also implement `append_delta`, `read_deltas`
+    and `delta_stat`.
+    """
+    # True if the engine keeps per-record delta journals (see `append_delta`).
+    supports_deltas = False
+
+    @abstractmethod
+    def write(self, name: str, payload: bytes, header: dict) -> None:
+        """Store (or replace) a record."""
+        raise NotImplementedError
+
+    def write_many(self, items: Iterable[tuple[str, bytes, dict]], *, fsync: bool = True) -> None:
+        """Store a batch of (name, payload, header) records as one group."""
+        for name, payload, header in items:
+            self.write(name, payload, header)
+
+    @abstractmethod
+    def read(self, name: str) -> bytes:
+        """Return a record's payload. Raises ValueError if it cannot be read."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, name: str) -> None:
+        """Remove a record if present."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def stat(self, name: str) -> Optional[RecordStat]:
+        """Return size/mtime for a record, or None if it does not exist."""
+        raise NotImplementedError
+
+    def exists(self, name: str) -> bool:
+        """Check if a record exists."""
+        return self.stat(name) is not None
+
+    @abstractmethod
+    def names(self) -> Iterator[str]:
+        """Yield the names of all stored records (in no particular order)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def header(self, name: str) -> Optional[dict]:
+        """Return a record's header metadata, or None if missing or unreadable."""
+        raise NotImplementedError
+
+    def query(self, **criteria) -> list[str]:
+        """Return sorted names of records whose header fields match all criteria."""
+        names = sorted(self.names())
+        if not criteria:
+            return names
+        return [
+            name for name in names
+            if all((self.header(name) or {}).get(k) == v for k, v in criteria.items())
+        ]
+
+    def count(self, **criteria) -> int:
+        """Count records whose header fields match all criteria."""
+        return len(self.query(**criteria))
+
+    def append_delta(self, name: str, delta: bytes) -> int:
+        """Append one encoded patch to a record's delta journal. Returns the journal size in bytes."""
+        raise NotImplementedError
+
+    def read_deltas(self, name: str) -> list[bytes]:
+        """Return a record's journaled patches in order (empty if there are none)."""
+        return []
+
+    def delta_stat(self, name: str) -> Optional[RecordStat]:
+        """Return size/mtime of a record's delta journal, or None if it has none."""
+        return None
+
+    @contextmanager
+    def transaction(self):
+        """Group writes made inside the block (a no-op unless the engine supports it)."""
+        yield self
+
+    @abstractmethod
+    def meta_path(self, filename: str) -> Path:
+        """Return where sidecar metadata (manifests, indexes) for this store should live."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class DirectoryBackend(StorageBackend):
+    """
+    One `{name}.json` file per record, either flat in one directory (the original layout)
+    or spread over hash-prefix subdirectories (`shard_levels`), e.g. `ab/cd/{name}.json`.
+    The sharded layout is recorded in a `.layout.json` marker so it is picked up on reopen.
+    Patches from `BaseManager.update` go to a `{name}.json.delta` journal of CRC-framed JSON
+    lines next to the record, removed whenever the record itself is rewritten or deleted.
+    """
+    suffix = ".json"
+    delta_suffix = ".delta"
+    supports_deltas = True
+
+    def __init__(self, directory: Path | str, shard_levels: Optional[int] = None):
+        """
+        Args:
+            directory (Path | str): Directory holding the record files (created if missing).
+            shard_levels (int | None): Number of two-hex-digit hash subdirectory levels (0 = flat).
+                None uses the layout recorded in the directory (flat if there is none).
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stored = read_layout(self.directory)
+        self.shard_levels = stored
+        if shard_levels is None:
+            shard_levels = stored
+        elif shard_levels and not stored and not any(self.names()):
+            # A new (or empty flat) store adopts the requested layout.
+            write_layout(self.directory, shard_levels)
+        elif shard_levels != stored:
+            raise ValueError(
+                f"Directory '{self.directory}' uses {stored} shard level(s), not {shard_levels}; "
+                f"convert it with reshard_store() first"
+            )
+        self.shard_levels = shard_levels
+        self._known_dirs: set[Path] = set()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.directory}')"
+
+    def path(self, name: str) -> Path:
+        """Return the file path for a record name."""
+        return shard_path(self.directory, name, self.shard_levels, self.suffix)
+
+    def _write_path(self, name: str) -> Path:
+        """Return the file path for a record name, creating its shard directory if needed."""
+        path = self.path(name)
+        if self.shard_levels and path.parent not in self._known_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path.parent)
+        return path
+
+    def _delta_path(self, name: str) -> Path:
+        path = self.path(name)
+        return path.with_name(path.name + self.delta_suffix)
+
+    def write(self, name: str, payload: bytes, header: dict) -> None:
+        atomic_write_bytes(self._write_path(name), payload)
+        self._delta_path(name).unlink(missing_ok=True)
+
+    def write_many(self, items: Iterable[tuple[str, bytes, dict]], *, fsync: bool = True) -> None:
+        names = []
+
+        def paths():
+            for name, payload, _ in items:
+                names.append(name)
+                yield self._write_path(name), payload
+
+        atomic_write_group(paths(), fsync=fsync)
+        for name in names:
+            self._delta_path(name).unlink(missing_ok=True)
+
+    def append_delta(self, name: str, delta: bytes) -> int:
+        return append_line(self._delta_path(name), delta)
+
+    def read_deltas(self, name: str) -> list[bytes]:
+        try:
+            return self._delta_path(name).read_bytes().splitlines()
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            raise ValueError(f"Error loading delta journal '{self._delta_path(name)}': {e}")
+
+    def delta_stat(self, name: str) -> Optional[RecordStat]:
+        try:
+            st = os.stat(self._delta_path(name))
+        except OSError:
+            return None
+        return RecordStat(st.st_size, st.st_mtime_ns)
+
+    def read(self, name: str) -> bytes:
+        path = self.path(name)
+        try:
+            return path.read_bytes()
+        except OSError as e:
+            raise ValueError(f"Error loading JSON file '{path}': {e}")
+
+    def delete(self, name: str) -> None:
+        self.path(name).unlink(missing_ok=True)
+        self._delta_path(name).unlink(missing_ok=True)
+
+    def stat(self, name: str) -> Optional[RecordStat]:
+        try:
+            st = os.stat(self.path(name))
+        except OSError:
+            return None
+        return RecordStat(st.st_size, st.st_mtime_ns)
+
+    def exists(self, name: str) -> bool:
+        return self.path(name).exists()
+
+    def names(self) -> Iterator[str]:
+        pattern = "*/" * self.shard_levels + f"*{self.suffix}"
+        for path in self.directory.glob(pattern):
+            if not path.name.startswith("."):
+                yield path.name[:-len(self.suffix)]
+
+    def header(self, name: str) -> Optional[dict]:
+        try:
+            return read_header(self.path(name))
+        except ValueError:
+            return None
+
+    def meta_path(self, filename: str) -> Path:
+        return self.directory / filename
+
+
+def shard_path(directory: Path, name: str, shard_levels: int, suffix: str = ".json") -> Path:
+    """Return `directory/ab/cd/{name}{suffix}`, using `shard_levels` pairs of hex digits of the name's MD5."""
+    if not shard_levels:
+        return directory / f"{name}{suffix}"
+    digest = hashlib.md5(name.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return directory.joinpath(*(digest[2 * i:2 * i + 2] for i in range(shard_levels)), f"{name}{suffix}")
+
+
+def read_layout(directory: Path) -> int:
+    """Return the shard level count recorded in a directory store (0 if flat or unrecorded)."""
+    path = Path(directory) / LAYOUT_FILENAME
+    try:
+        return int(json.loads(path.read_bytes())["shard_levels"])
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Error loading layout file '{path}': {e}")
+
+
+def write_layout(directory: Path, shard_levels: int) -> None:
+    """Record a directory store's shard level count (removing the marker for a flat store)."""
+    path = Path(directory) / LAYOUT_FILENAME
+    if shard_levels:
+        atomic_write_bytes(path, json.dumps({"shard_levels": shard_levels}).encode("utf-8"), fsync=True)
+    else:
+        path.unlink(missing_ok=True)
+        fsync_directory(directory)
+
+
+def reshard_store(directory: Path | str, shard_levels: int) -> int:
+    """
+    Convert a directory store in place to a different shard layout (0 = flat).
+    Record files and their delta journals are moved one at a time with `os.replace`; if
+    interrupted, run it again with the same arguments to finish. Stop any manager using the store first.
+    Args:
+        directory (Path | str): Root directory of the store.
+        shard_levels (int): Target number of hash subdirectory levels.
+    Returns:
+        int: Number of record files moved.
+    """
+    directory = Path(directory)
+    if shard_levels < 0:
+        raise ValueError("shard_levels must be >= 0")
+    suffix = DirectoryBackend.suffix
+    delta_suffix = suffix + DirectoryBackend.delta_suffix
+
+    moved = 0
+    created: set[Path] = set()
+    files = [(path, suffix) for path in directory.rglob(f"*{suffix}")]
+    files += [(path, delta_suffix) for path in directory.rglob(f"*{delta_suffix}")]
+    for path, file_suffix in files:
+        if path.name.startswith("."):
+            continue
+        target = shard_path(directory, path.name[:-len(file_suffix)], shard_levels, file_suffix)
+        if target == path:
+            continue
+        if target.parent not in created:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            created.add(target.parent)
+        os.replace(path, target)
+        if file_suffix == suffix:
+            moved += 1
+
+    # Remove shard directories left empty, deepest first.
+    for sub in sorted((p for p in directory.rglob("*") if p.is_dir()), key=lambda p: len(p.parts), reverse=True):
+        try:
+            sub.rmdir()
+        except OSError:
+            pass
+
+    write_layout(directory, shard_levels)
+    logger.info(f"Resharded '{directory}' to {shard_levels} level(s), moved {moved} record(s)")
+    return moved
+
+
+def migrate_store(
+    source: Union[StorageBackend, Path, str],
+    target: StorageBackend,
+    *,
+    batch_size: int = 500,
+    delete_source: bool = False
+) -> int:
+    """
+    Copy every record from one store into another, e.g. a directory store into SQLite.
+    Payloads are copied verbatim, so no dataclass types are needed. Records with pending
+    patches must be folded first (`BaseManager.compact_patches()`).
+    Args:
+        source (StorageBackend | Path | str): Source backend, or a directory of JSON records.
+        target (StorageBackend): Destination backend.
+        batch_size (int): Records written per `write_many` group.
+        delete_source (bool): Remove each record from the source once the target holds it.
+    Returns:
+        int: Number of records migrated.
+    """
+    if not isinstance(source, StorageBackend):
+        source = DirectoryBackend(source)
+
+    migrated = 0
+    batch = []
+
+    def write_batch():
+        target.write_many(batch)
+        if delete_source:
+            for name, _, _ in batch:
+                source.delete(name)
+        batch.clear()
+
+    for name in sorted(source.names()):
+        header = source.header(name)
+        if header is None:
+            logger.warning(f"Skipping unreadable record '{name}' during migration")
+            continue
+        if source.read_deltas(name):
+            raise ValueError(
+                f"Record '{name}' has pending patches; run BaseManager.compact_patches() before migrating"
+            )
+        batch.append((name, source.read(name), header))
+        migrated += 1
+        if len(batch) >= batch_size:
+            write_batch()
+    if batch:
+        write_batch()
+    return migrated
@@ -0,0 +1,68 @@
+# tests/test_journals.py
+"""Regression tests for the manifest and field-index journals."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from WrapDataclass.manager import AutoIDRecord, BaseManager
+from WrapDataclass.manager.field_index import FIELD_INDEX_FILENAME
+from WrapDataclass.manager.index import MANIFEST_FILENAME
+
+
+@dataclass
+class Note(AutoIDRecord):
+    title: str = ""
+    status: str = "draft"
+    rank: int = 0
+
+
+def _manager(directory):
+    return BaseManager(Note, directory, index=True, field_indexes={"status": "hash", "rank": "sorted"})
+
+
+def _tear(path, tail=b'{"name":"torn","entry":{"status"'):
+    """Leave a partial, newline-less last line, as a crash mid-append would."""
+    with open(path, "ab") as f:
+        f.write(tail)
+
+
+def test_torn_tail_does_not_swallow_the_next_entry(tmp_path):
+    m = _manager(tmp_path)
+    m.save(Note(id="a", status="live", rank=1))
+    _tear(tmp_path / MANIFEST_FILENAME)
+    _tear(tmp_path / FIELD_INDEX_FILENAME)
+
+    m = _manager(tmp_path)
+    m.save(Note(id="b", status="live", rank=2))
+
+    m = _manager(tmp_path)
+    assert m.list() == ["a", "b"]
+    assert m.find_names(status="live") == ["a", "b"]
+    assert m.find_names(rank__gte=2) == ["b"]
+    for name in (MANIFEST_FILENAME, FIELD_INDEX_FILENAME):
+        assert (tmp_path / name).read_bytes().endswith(b"\n")
+
+
+def test_damaged_field_index_journal_is_rebuilt(tmp_path):
+    m = _manager(tmp_path)
+    m.save(Note(id="a", status="live", rank=1))
+    m.save(Note(id="b", status="live", rank=2))
+    journal = tmp_path / FIELD_INDEX_FILENAME
+    journal.write_bytes(journal.read_bytes()[:-5])
+
+    m = _manager(tmp_path)
+    assert m.find_names(status="live") == ["a", "b"]
+
+
+def test_unorderable_sorted_value_fails_before_the_write(tmp_path):
+    m = _manager(tmp_path)
+    m.save(Note(id="a", status="live", rank=1))
+
+    with pytest.raises(ValueError):
+        m.save(Note(id="a", status="gone", rank="high"))
+
+    assert m.load("a").status == "live"
+    assert m.find_names(status="live") == ["a"]
+    assert m.find_names(status="gone") == []
+    assert m.find_names(rank__gte=0) == ["a"]